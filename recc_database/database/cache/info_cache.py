@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+import re
+from bisect import bisect_left
+from copy import copy
+from datetime import datetime
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from recc_database.database.cache.invalidation_bus import (
+    CHANGE_OPS_ALL,
+    CacheInvalidatorInterface,
+    ChangeEvent,
+    ChangeEvents,
+)
+from recc_database.database.cache.ttl_lru_cache import Clock
+from recc_database.packet.info import Info
+from recc_database.variables.database import TABLE_INFO
+
+_CHANGE_EVENTS: ChangeEvents = {TABLE_INFO: CHANGE_OPS_ALL}
+
+InfoVersion = Tuple[int, Optional[datetime]]
+"""
+(row_count, max_updated_at)
+"""
+
+_LIKE_ESCAPE = "\\"
+_LIKE_ANY = "%"
+_LIKE_ONE = "_"
+
+
+def split_like_pattern(pattern: str) -> Tuple[str, str]:
+    """
+    Split a `LIKE` pattern into its literal prefix and the rest.
+
+    :return: The prefix and the regular expression of the rest,
+        which is empty for an exact key and `.*` for a plain prefix.
+    """
+
+    prefix = list()
+    rest = list()
+    escaped = False
+
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == _LIKE_ESCAPE:
+            escaped = True
+            continue
+        elif char == _LIKE_ANY:
+            rest.append(".*")
+            continue
+        elif char == _LIKE_ONE:
+            rest.append(".")
+            continue
+
+        if rest:
+            rest.append(re.escape(char))
+        else:
+            prefix.append(char)
+
+    return "".join(prefix), "".join(rest)
+
+
+class InfoSnapshot:
+    """
+    An immutable copy of the whole `info` table with a sorted key index.
+
+    The infos are returned as copies, so the callers may modify them freely.
+    """
+
+    def __init__(self, infos: Iterable[Info]):
+        self._infos: Dict[str, Info] = {info.key: info for info in infos}
+        self._keys: List[str] = sorted(self._infos.keys())
+        updated = [i.updated_at for i in self._infos.values() if i.updated_at]
+        self._version: InfoVersion = len(self._infos), max(updated, default=None)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def version(self) -> InfoVersion:
+        return self._version
+
+    def get(self, key: str) -> Optional[Info]:
+        info = self._infos.get(key)
+        return copy(info) if info is not None else None
+
+    def exists(self, key: str) -> bool:
+        return key in self._infos
+
+    def prefixed(self, prefix: str) -> List[Info]:
+        result = list()
+        for index in range(bisect_left(self._keys, prefix), len(self._keys)):
+            key = self._keys[index]
+            if not key.startswith(prefix):
+                break
+            result.append(copy(self._infos[key]))
+        return result
+
+    def like(self, pattern: str) -> List[Info]:
+        """
+        The infos whose key matches the `LIKE` pattern, in the order of the keys.
+        """
+
+        prefix, rest = split_like_pattern(pattern)
+        if not rest:
+            info = self.get(prefix)
+            return [info] if info is not None else []
+        if rest == ".*":
+            return self.prefixed(prefix)
+        regex = re.compile(rest, re.DOTALL)
+        start = len(prefix)
+        return [i for i in self.prefixed(prefix) if regex.fullmatch(i.key, start)]
+
+
+class InfoCache(CacheInvalidatorInterface):
+    """
+    Holds the loaded :class:`InfoSnapshot` until the `info` table changes.
+
+    The snapshot is revalidated against the version of the table
+    once it is older than the ttl, to notice the changes of other processes.
+    """
+
+    def __init__(self, ttl: float, clock: Clock = monotonic):
+        self._ttl = ttl
+        self._clock = clock
+        self._snapshot: Optional[InfoSnapshot] = None
+        self._checked_at = 0.0
+        self._generation = 0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def snapshot(self) -> Optional[InfoSnapshot]:
+        return self._snapshot
+
+    @property
+    def generation(self) -> int:
+        """
+        Pass the value read before loading the snapshot to :meth:`set`.
+        """
+        return self._generation
+
+    def is_stale(self) -> bool:
+        return self._clock() - self._checked_at >= self._ttl
+
+    def touch(self) -> None:
+        self._checked_at = self._clock()
+
+    def set(self, snapshot: InfoSnapshot, generation: Optional[int] = None) -> None:
+        if generation is not None and generation != self._generation:
+            return
+        self._snapshot = snapshot
+        self.touch()
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._snapshot = None
+
+    @property
+    def change_events(self) -> ChangeEvents:
+        return _CHANGE_EVENTS
+
+    def on_change(self, event: ChangeEvent) -> None:
+        if event.table == TABLE_INFO:
+            self.clear()
+
+    def on_reset(self) -> None:
+        self.clear()
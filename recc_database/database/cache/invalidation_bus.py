@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set
+
+from orjson import JSONDecodeError, loads
+
+from recc_database.variables.database import (
+    CHANGE_OP_DELETE,
+    CHANGE_OP_INSERT,
+    CHANGE_OP_TRUNCATE,
+    CHANGE_OP_UPDATE,
+)
+
+CHANGE_OPS_ALL = frozenset(
+    (CHANGE_OP_INSERT, CHANGE_OP_UPDATE, CHANGE_OP_DELETE, CHANGE_OP_TRUNCATE)
+)
+CHANGE_OPS_EXCEPT_INSERT = CHANGE_OPS_ALL - {CHANGE_OP_INSERT}
+
+ChangeEvents = Mapping[str, FrozenSet[str]]
+"""
+The operations of each table whose change events are consumed.
+"""
+
+
+@dataclass
+class ChangeEvent:
+    """A row change broadcast by the `recc_notify_change` trigger."""
+
+    table: str
+    op: str
+    key: Optional[Dict[str, Any]] = None
+
+    @property
+    def is_truncate(self) -> bool:
+        return self.op == CHANGE_OP_TRUNCATE
+
+    def get(self, column: str) -> Any:
+        return self.key.get(column) if self.key else None
+
+
+def parse_change_payload(payload: str) -> Optional[ChangeEvent]:
+    try:
+        obj = loads(payload)
+    except JSONDecodeError:
+        return None
+    if not isinstance(obj, dict):
+        return None
+    table = obj.get("table")
+    op = obj.get("op")
+    if not isinstance(table, str) or not isinstance(op, str):
+        return None
+    key = obj.get("key")
+    return ChangeEvent(table, op, key if isinstance(key, dict) else None)
+
+
+class CacheInvalidatorInterface(metaclass=ABCMeta):
+    @property
+    @abstractmethod
+    def change_events(self) -> ChangeEvents:
+        """
+        Only the triggers of these events are installed in the database.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def on_change(self, event: ChangeEvent) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def on_reset(self) -> None:
+        """
+        Called when change events may have been missed,
+        e.g. when the listener connection is lost or re-established.
+        """
+        raise NotImplementedError
+
+
+class InvalidationBus:
+    """
+    Fans the change events out to the registered cache invalidators.
+    """
+
+    def __init__(self):
+        self._invalidators: List[CacheInvalidatorInterface] = list()
+        self._received = 0
+
+    @property
+    def received(self) -> int:
+        return self._received
+
+    def __len__(self) -> int:
+        return len(self._invalidators)
+
+    def change_events(self) -> Dict[str, FrozenSet[str]]:
+        """
+        The union of the events consumed by the registered invalidators.
+        """
+
+        result: Dict[str, Set[str]] = dict()
+        for invalidator in self._invalidators:
+            for table, ops in invalidator.change_events.items():
+                result.setdefault(table, set()).update(ops)
+        return {table: frozenset(ops) for table, ops in result.items()}
+
+    def register(self, invalidator: CacheInvalidatorInterface) -> None:
+        if invalidator not in self._invalidators:
+            self._invalidators.append(invalidator)
+
+    def unregister(self, invalidator: CacheInvalidatorInterface) -> None:
+        self._invalidators.remove(invalidator)
+
+    def dispatch(self, event: ChangeEvent) -> None:
+        self._received += 1
+        for invalidator in self._invalidators:
+            invalidator.on_change(event)
+
+    def dispatch_payload(self, payload: str) -> None:
+        event = parse_change_payload(payload)
+        if event is not None:
+            self.dispatch(event)
+        else:
+            # An unknown payload cannot be mapped to keys; play it safe.
+            self.reset()
+
+    def reset(self) -> None:
+        for invalidator in self._invalidators:
+            invalidator.on_reset()
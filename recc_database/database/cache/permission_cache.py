@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+from copy import copy
+from time import monotonic
+from typing import List, Optional, Tuple
+
+from recc_database.database.cache.invalidation_bus import (
+    CHANGE_OPS_ALL,
+    CHANGE_OPS_EXCEPT_INSERT,
+    CacheInvalidatorInterface,
+    ChangeEvent,
+    ChangeEvents,
+)
+from recc_database.database.cache.ttl_lru_cache import Clock, TtlLruCache
+from recc_database.packet.permission import Permission
+from recc_database.variables.database import (
+    CHANGE_OP_INSERT,
+    TABLE_GROUP,
+    TABLE_GROUP_MEMBER,
+    TABLE_PERMISSION,
+    TABLE_PROJECT,
+    TABLE_PROJECT_MEMBER,
+    TABLE_ROLE,
+    TABLE_ROLE_PERMISSION,
+    TABLE_USER,
+)
+
+PermissionKey = Tuple[int, int, Optional[int]]
+"""
+(user_uid, group_uid, project_uid)
+"""
+
+_USER_INDEX = 0
+_GROUP_INDEX = 1
+_PROJECT_INDEX = 2
+
+_CHANGE_EVENTS: ChangeEvents = {
+    # No results can be cached for a row that did not exist.
+    TABLE_USER: CHANGE_OPS_EXCEPT_INSERT,
+    TABLE_GROUP: CHANGE_OPS_EXCEPT_INSERT,
+    TABLE_PROJECT: CHANGE_OPS_EXCEPT_INSERT,
+    TABLE_ROLE: CHANGE_OPS_EXCEPT_INSERT,
+    TABLE_PERMISSION: CHANGE_OPS_ALL,
+    TABLE_ROLE_PERMISSION: CHANGE_OPS_ALL,
+    TABLE_GROUP_MEMBER: CHANGE_OPS_ALL,
+    TABLE_PROJECT_MEMBER: CHANGE_OPS_ALL,
+}
+
+
+class PermissionCache(CacheInvalidatorInterface):
+    """
+    Resolved results of the `recc_appropriate_permission` function.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, clock: Clock = monotonic):
+        self._cache: TtlLruCache[PermissionKey, List[Permission]] = TtlLruCache(
+            maxsize, ttl, clock
+        )
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        It increases with every invalidation.
+
+        Pass the value read before querying the database to :meth:`set`,
+        so that a result fetched before an invalidation is never cached.
+        """
+        return self._generation
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(
+        self,
+        user_uid: int,
+        group_uid: int,
+        project_uid: Optional[int] = None,
+    ) -> Optional[List[Permission]]:
+        permissions = self._cache.get((user_uid, group_uid, project_uid))
+        if permissions is None:
+            return None
+        # The packets are mutable, so the cached ones are never handed out.
+        return [copy(p) for p in permissions]
+
+    def set(
+        self,
+        permissions: List[Permission],
+        user_uid: int,
+        group_uid: int,
+        project_uid: Optional[int] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        if generation is not None and generation != self._generation:
+            return
+        key = user_uid, group_uid, project_uid
+        self._cache.set(key, [copy(p) for p in permissions])
+
+    def invalidate_user(self, user_uid: int) -> None:
+        self._generation += 1
+        self._cache.pop_if(lambda k: k[_USER_INDEX] == user_uid)
+
+    def invalidate_group(self, group_uid: int) -> None:
+        self._generation += 1
+        self._cache.pop_if(lambda k: k[_GROUP_INDEX] == group_uid)
+
+    def invalidate_project(self, project_uid: int) -> None:
+        self._generation += 1
+        self._cache.pop_if(lambda k: k[_PROJECT_INDEX] == project_uid)
+
+    def invalidate_group_member(self, group_uid: int, user_uid: int) -> None:
+        self._generation += 1
+        # Project-level results fall back to the group member's role,
+        # so every entry of this user within this group is affected.
+        self._cache.pop_if(
+            lambda k: k[_USER_INDEX] == user_uid and k[_GROUP_INDEX] == group_uid
+        )
+
+    def invalidate_project_member(self, project_uid: int, user_uid: int) -> None:
+        self._generation += 1
+        self._cache.pop_if(
+            lambda k: k[_USER_INDEX] == user_uid and k[_PROJECT_INDEX] == project_uid
+        )
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+
+    @property
+    def change_events(self) -> ChangeEvents:
+        return _CHANGE_EVENTS
+
+    def on_change(self, event: ChangeEvent) -> None:
+        table = event.table
+        if table not in _CHANGE_EVENTS:
+            return
+
+        if event.is_truncate:
+            self.clear()
+        elif table in (TABLE_PERMISSION, TABLE_ROLE_PERMISSION):
+            # Administrators are granted every permission, even new ones.
+            self.clear()
+        elif event.op == CHANGE_OP_INSERT and table in (
+            TABLE_USER,
+            TABLE_GROUP,
+            TABLE_PROJECT,
+            TABLE_ROLE,
+        ):
+            pass  # No results can be cached for a row that did not exist.
+        elif table == TABLE_ROLE:
+            self.clear()
+        elif table == TABLE_USER:
+            self.invalidate_user(event.get("uid"))
+        elif table == TABLE_GROUP:
+            self.invalidate_group(event.get("uid"))
+        elif table == TABLE_PROJECT:
+            self.invalidate_project(event.get("uid"))
+        elif table == TABLE_GROUP_MEMBER:
+            self.invalidate_group_member(event.get("group_uid"), event.get("user_uid"))
+        else:
+            assert table == TABLE_PROJECT_MEMBER
+            self.invalidate_project_member(
+                event.get("project_uid"), event.get("user_uid")
+            )
+
+    def on_reset(self) -> None:
+        self.clear()
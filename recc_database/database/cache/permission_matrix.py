@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Iterable, List, Optional
+
+from recc_database.database.cache.invalidation_bus import (
+    CHANGE_OPS_ALL,
+    CacheInvalidatorInterface,
+    ChangeEvent,
+    ChangeEvents,
+)
+from recc_database.packet.permission import Permission
+from recc_database.packet.role_permission import RolePermission
+from recc_database.variables.database import (
+    TABLE_PERMISSION,
+    TABLE_ROLE,
+    TABLE_ROLE_PERMISSION,
+)
+
+_CHANGE_EVENTS: ChangeEvents = {
+    TABLE_PERMISSION: CHANGE_OPS_ALL,
+    TABLE_ROLE: CHANGE_OPS_ALL,
+    TABLE_ROLE_PERMISSION: CHANGE_OPS_ALL,
+}
+
+
+class PermissionMatrix:
+    """
+    The role to permission grants as one bitset per role.
+
+    Each permission is assigned a bit in the order of its uid, so a grant
+    check is a dictionary lookup and a bitwise AND.
+    """
+
+    def __init__(
+        self,
+        permissions: Iterable[Permission],
+        role_permissions: Iterable[RolePermission],
+    ):
+        self._slugs: List[str] = list()
+        self._slug_bits: Dict[str, int] = dict()
+        self._uid_bits: Dict[int, int] = dict()
+        self._role_masks: Dict[int, int] = dict()
+
+        items = ((p.uid, p.slug) for p in permissions if p.uid is not None)
+        for index, (uid, slug) in enumerate(sorted(items, key=lambda x: x[0])):
+            bit = 1 << index
+            self._slugs.append(slug if slug else str())
+            self._uid_bits[uid] = bit
+            if slug:
+                self._slug_bits[slug] = bit
+
+        for item in role_permissions:
+            if item.role_uid is None or item.permission_uid is None:
+                continue
+            bit = self._uid_bits.get(item.permission_uid, 0)
+            mask = self._role_masks.get(item.role_uid, 0)
+            self._role_masks[item.role_uid] = mask | bit
+
+    def __len__(self) -> int:
+        """
+        The number of permissions.
+        """
+        return len(self._slugs)
+
+    @property
+    def role_uids(self) -> List[int]:
+        return list(self._role_masks.keys())
+
+    def role_mask(self, role_uid: int) -> int:
+        return self._role_masks.get(role_uid, 0)
+
+    def slug_mask(self, *slugs: str) -> int:
+        """
+        :raise KeyError: If a slug is not a known permission.
+        """
+
+        mask = 0
+        for slug in slugs:
+            mask |= self._slug_bits[slug]
+        return mask
+
+    def has_mask(self, role_uid: int, mask: int) -> bool:
+        """
+        Whether the role is granted all permissions of the precomputed mask.
+        """
+        return (self._role_masks.get(role_uid, 0) & mask) == mask
+
+    def has_permission(self, role_uid: int, slug: str) -> bool:
+        bit = self._slug_bits.get(slug, 0)
+        return bool(self._role_masks.get(role_uid, 0) & bit)
+
+    def has_permission_uid(self, role_uid: int, permission_uid: int) -> bool:
+        bit = self._uid_bits.get(permission_uid, 0)
+        return bool(self._role_masks.get(role_uid, 0) & bit)
+
+    def permission_slugs(self, role_uid: int) -> List[str]:
+        mask = self._role_masks.get(role_uid, 0)
+        return [s for i, s in enumerate(self._slugs) if mask >> i & 1]
+
+
+class PermissionMatrixCache(CacheInvalidatorInterface):
+    """
+    Holds the loaded :class:`PermissionMatrix` until a dependent table changes.
+    """
+
+    def __init__(self):
+        self._matrix: Optional[PermissionMatrix] = None
+        self._generation = 0
+
+    @property
+    def matrix(self) -> Optional[PermissionMatrix]:
+        return self._matrix
+
+    @property
+    def generation(self) -> int:
+        """
+        Pass the value read before loading the matrix to :meth:`set`.
+        """
+        return self._generation
+
+    def set(self, matrix: PermissionMatrix, generation: Optional[int] = None) -> None:
+        if generation is not None and generation != self._generation:
+            return
+        self._matrix = matrix
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._matrix = None
+
+    @property
+    def change_events(self) -> ChangeEvents:
+        return _CHANGE_EVENTS
+
+    def on_change(self, event: ChangeEvent) -> None:
+        if event.table in _CHANGE_EVENTS:
+            self.clear()
+
+    def on_reset(self) -> None:
+        self.clear()
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+from time import monotonic
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from recc_database.database.cache.invalidation_bus import (
+    CHANGE_OPS_EXCEPT_INSERT,
+    CacheInvalidatorInterface,
+    ChangeEvent,
+    ChangeEvents,
+)
+from recc_database.database.cache.ttl_lru_cache import Clock, TtlLruCache
+from recc_database.variables.database import (
+    CHANGE_OP_INSERT,
+    TABLE_GROUP,
+    TABLE_PERMISSION,
+    TABLE_PROJECT,
+    TABLE_ROLE,
+    TABLE_TASK,
+)
+
+KeyType = TypeVar("KeyType")
+
+SlugEntry = Tuple[int, ...]
+"""
+(uid, *parent_uids)
+"""
+
+ProjectKey = Tuple[int, str]
+"""
+(group_uid, project_slug)
+"""
+
+TaskKey = Tuple[str, str, str]
+"""
+(group_slug, project_slug, task_slug)
+"""
+
+SlugMapSelector = Callable[["SlugCache"], "SlugMap[str]"]
+
+_UID_INDEX = 0
+_GROUP_INDEX = 1
+_PROJECT_INDEX = 2
+
+_CHANGE_EVENTS: ChangeEvents = {
+    # Lookups of a missing slug are never cached.
+    TABLE_GROUP: CHANGE_OPS_EXCEPT_INSERT,
+    TABLE_PROJECT: CHANGE_OPS_EXCEPT_INSERT,
+    TABLE_TASK: CHANGE_OPS_EXCEPT_INSERT,
+    TABLE_ROLE: CHANGE_OPS_EXCEPT_INSERT,
+    TABLE_PERMISSION: CHANGE_OPS_EXCEPT_INSERT,
+}
+
+
+class SlugMap(Generic[KeyType]):
+    """
+    A bounded mapping between the slug keys and the uids of one table.
+
+    Each entry also keeps the uids of its parent rows,
+    so that it can be invalidated when a parent is renamed or deleted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, clock: Clock = monotonic):
+        self._uids: TtlLruCache[KeyType, SlugEntry] = TtlLruCache(
+            maxsize, ttl, clock, self._unlink
+        )
+        # The reverse index follows the entries, so it needs no bound of its own.
+        self._keys: Dict[int, KeyType] = dict()
+        self._key_misses = 0
+
+    def _unlink(self, key: KeyType, entry: SlugEntry) -> None:
+        uid = entry[_UID_INDEX]
+        if self._keys.get(uid) == key:
+            del self._keys[uid]
+
+    @property
+    def hits(self) -> int:
+        return self._uids.hits
+
+    @property
+    def misses(self) -> int:
+        return self._uids.misses + self._key_misses
+
+    def __len__(self) -> int:
+        return len(self._uids)
+
+    def get_entry(self, key: KeyType) -> Optional[SlugEntry]:
+        return self._uids.get(key)
+
+    def get_uid(self, key: KeyType) -> Optional[int]:
+        entry = self._uids.get(key)
+        return entry[_UID_INDEX] if entry is not None else None
+
+    def get_key(self, uid: int) -> Optional[KeyType]:
+        key = self._keys.get(uid)
+        if key is None:
+            self._key_misses += 1
+            return None
+        # The lookup expires the entry, which also unlinks the uid.
+        return key if self._uids.get(key) is not None else None
+
+    def set(self, key: KeyType, entry: SlugEntry) -> None:
+        uid = entry[_UID_INDEX]
+        previous_key = self._keys.get(uid)
+        if previous_key is not None and previous_key != key:
+            # A uid has a single key, so the renamed one is stale.
+            self._uids.pop(previous_key)
+        self._uids.set(key, entry)
+        self._keys[uid] = key
+
+    def pop_if(self, predicate: Callable[[KeyType, SlugEntry], bool]) -> None:
+        self._uids.pop_if_item(predicate)
+
+    def pop_uid(self, uid: int) -> None:
+        key = self._keys.get(uid)
+        if key is not None:
+            self._uids.pop(key)
+
+    def pop_parent(self, index: int, uid: int) -> None:
+        self.pop_if(lambda k, e: e[index] == uid)
+
+    def clear(self) -> None:
+        self._uids.clear()
+        self._keys.clear()
+
+
+class SlugCache(CacheInvalidatorInterface):
+    """
+    Resolved slug and uid pairs of the groups, projects, tasks, roles and permissions.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, clock: Clock = monotonic):
+        self._groups: SlugMap[str] = SlugMap(maxsize, ttl, clock)
+        self._projects: SlugMap[ProjectKey] = SlugMap(maxsize, ttl, clock)
+        self._tasks: SlugMap[TaskKey] = SlugMap(maxsize, ttl, clock)
+        self._roles: SlugMap[str] = SlugMap(maxsize, ttl, clock)
+        self._permissions: SlugMap[str] = SlugMap(maxsize, ttl, clock)
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        It increases with every invalidation.
+
+        Pass the value read before querying the database to :meth:`set`,
+        so that a result fetched before an invalidation is never cached.
+        """
+        return self._generation
+
+    @property
+    def groups(self) -> SlugMap[str]:
+        return self._groups
+
+    @property
+    def projects(self) -> SlugMap[ProjectKey]:
+        """
+        Entries of `(uid, group_uid)`.
+        """
+        return self._projects
+
+    @property
+    def tasks(self) -> SlugMap[TaskKey]:
+        """
+        Entries of `(uid, group_uid, project_uid)`.
+        """
+        return self._tasks
+
+    @property
+    def roles(self) -> SlugMap[str]:
+        return self._roles
+
+    @property
+    def permissions(self) -> SlugMap[str]:
+        return self._permissions
+
+    def set(
+        self,
+        slug_map: SlugMap[KeyType],
+        key: KeyType,
+        entry: SlugEntry,
+        generation: Optional[int] = None,
+    ) -> None:
+        if generation is not None and generation != self._generation:
+            return
+        slug_map.set(key, entry)
+
+    def invalidate_group(self, uid: int) -> None:
+        self._generation += 1
+        self._groups.pop_uid(uid)
+        self._projects.pop_parent(_GROUP_INDEX, uid)
+        # The task keys contain the slug of the group.
+        self._tasks.pop_parent(_GROUP_INDEX, uid)
+
+    def invalidate_project(self, uid: int) -> None:
+        self._generation += 1
+        self._projects.pop_uid(uid)
+        self._tasks.pop_parent(_PROJECT_INDEX, uid)
+
+    def invalidate_task(self, uid: int) -> None:
+        self._generation += 1
+        self._tasks.pop_uid(uid)
+
+    def invalidate_task_by_slug(self, project_uid: int, slug: str) -> None:
+        self._generation += 1
+        self._tasks.pop_if(
+            lambda k, e: e[_PROJECT_INDEX] == project_uid and k[2] == slug
+        )
+
+    def invalidate_role(self, uid: int) -> None:
+        self._generation += 1
+        self._roles.pop_uid(uid)
+
+    def invalidate_permission(self, uid: int) -> None:
+        self._generation += 1
+        self._permissions.pop_uid(uid)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._groups.clear()
+        self._projects.clear()
+        self._tasks.clear()
+        self._roles.clear()
+        self._permissions.clear()
+
+    @property
+    def change_events(self) -> ChangeEvents:
+        return _CHANGE_EVENTS
+
+    def on_change(self, event: ChangeEvent) -> None:
+        table = event.table
+        if table not in _CHANGE_EVENTS:
+            return
+
+        if event.is_truncate:
+            # A truncate may cascade to the tables below it.
+            self.clear()
+        elif event.op == CHANGE_OP_INSERT:
+            pass  # Lookups of a missing slug are never cached.
+        elif table == TABLE_GROUP:
+            self.invalidate_group(event.get("uid"))
+        elif table == TABLE_PROJECT:
+            self.invalidate_project(event.get("uid"))
+        elif table == TABLE_TASK:
+            self.invalidate_task(event.get("uid"))
+        elif table == TABLE_ROLE:
+            self.invalidate_role(event.get("uid"))
+        else:
+            assert table == TABLE_PERMISSION
+            self.invalidate_permission(event.get("uid"))
+
+    def on_reset(self) -> None:
+        self.clear()
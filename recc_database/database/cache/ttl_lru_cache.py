@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+KeyType = TypeVar("KeyType")
+ValueType = TypeVar("ValueType")
+
+Clock = Callable[[], float]
+RemoveCallback = Callable[[KeyType, ValueType], None]
+
+
+class TtlLruCache(Generic[KeyType, ValueType]):
+    """
+    A bounded mapping whose entries expire after `ttl` seconds.
+
+    When the cache is full, the least recently used entry is evicted.
+    The `on_remove` callback receives every value that is evicted, expired,
+    replaced or popped, but not the ones dropped by :meth:`clear`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Clock = monotonic,
+        on_remove: Optional[RemoveCallback] = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("The maxsize must be at least 1")
+        if ttl <= 0:
+            raise ValueError("The ttl must be greater than 0")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._on_remove = on_remove
+        self._items: "OrderedDict[KeyType, Tuple[float, ValueType]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: KeyType) -> Optional[ValueType]:
+        item = self._items.get(key)
+        if item is None:
+            self._misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._items[key]
+            self._removed(key, value)
+            self._misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def _removed(self, key: KeyType, value: ValueType) -> None:
+        if self._on_remove is not None:
+            self._on_remove(key, value)
+
+    def set(self, key: KeyType, value: ValueType) -> None:
+        item = self._items.get(key)
+        self._items[key] = (self._clock() + self._ttl, value)
+        self._items.move_to_end(key)
+        if item is not None:
+            self._removed(key, item[1])
+        while len(self._items) > self._maxsize:
+            evicted_key, evicted = self._items.popitem(last=False)
+            self._removed(evicted_key, evicted[1])
+
+    def pop(self, key: KeyType) -> Optional[ValueType]:
+        item = self._items.pop(key, None)
+        if item is None:
+            return None
+        self._removed(key, item[1])
+        return item[1]
+
+    def pop_if(self, predicate: Callable[[KeyType], bool]) -> int:
+        keys = [key for key in self._items.keys() if predicate(key)]
+        for key in keys:
+            self._removed(key, self._items.pop(key)[1])
+        return len(keys)
+
+    def pop_if_item(self, predicate: Callable[[KeyType, ValueType], bool]) -> int:
+        keys = [key for key, item in self._items.items() if predicate(key, item[1])]
+        for key in keys:
+            self._removed(key, self._items.pop(key)[1])
+        return len(keys)
+
+    def clear(self) -> None:
+        self._items.clear()
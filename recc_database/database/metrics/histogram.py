@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from math import inf
+from typing import List, Sequence, Tuple
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""
+Upper bounds in seconds, the `+Inf` bucket is implicit.
+"""
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    bounds: Tuple[float, ...]
+    """
+    Upper bounds of the buckets, the last one is always `inf`.
+    """
+
+    counts: Tuple[int, ...]
+    """
+    Non-cumulative number of observations in each bucket.
+    """
+
+    count: int
+    sum: float
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def cumulative_counts(self) -> List[int]:
+        result = list()
+        total = 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the quantile by linear interpolation within its bucket,
+        like the `histogram_quantile()` function of Prometheus.
+        """
+
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("The quantile must be between 0 and 1")
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        lower = 0.0
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            if count and seen + count >= rank:
+                if bound == inf:
+                    return lower
+                return lower + (bound - lower) * ((rank - seen) / count)
+            seen += count
+            if bound != inf:
+                lower = bound
+        return lower
+
+
+class Histogram:
+    __slots__ = ("_bounds", "_counts", "_count", "_sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        bounds = sorted(set(buckets))
+        if not bounds:
+            raise ValueError("At least one bucket is required")
+        if bounds[-1] != inf:
+            bounds.append(inf)
+        self._bounds = tuple(bounds)
+        self._counts = [0] * len(self._bounds)
+        self._count = 0
+        self._sum = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            self._bounds, tuple(self._counts), self._count, self._sum
+        )
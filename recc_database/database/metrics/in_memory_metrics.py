@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+
+from recc_database.database.metrics.histogram import (
+    DEFAULT_LATENCY_BUCKETS,
+    Histogram,
+    HistogramSnapshot,
+)
+from recc_database.database.metrics.metrics_hook import (
+    MetricsHookInterface,
+    get_query_label,
+)
+
+
+@dataclass(frozen=True)
+class QueryMetricsSnapshot:
+    name: str
+    latency: HistogramSnapshot
+    rows: int
+    errors: int
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    queries: Dict[str, QueryMetricsSnapshot]
+    acquire_wait: HistogramSnapshot
+    acquire_errors: int
+    pool_size: Optional[int] = None
+    pool_idle_size: Optional[int] = None
+    error_types: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def pool_in_use(self) -> Optional[int]:
+        if self.pool_size is None or self.pool_idle_size is None:
+            return None
+        return self.pool_size - self.pool_idle_size
+
+    def slowest(self, q=0.99, limit=10) -> Dict[str, float]:
+        """
+        The queries with the largest estimated quantile of latency, slowest first.
+        """
+
+        estimates = {n: m.latency.quantile(q) for n, m in self.queries.items()}
+        ordered = sorted(estimates.items(), key=lambda x: x[1], reverse=True)
+        return dict(ordered[:limit])
+
+
+class _QueryMetrics:
+    __slots__ = ("latency", "rows", "errors")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.latency = Histogram(buckets)
+        self.rows = 0
+        self.errors = 0
+
+
+class InMemoryMetrics(MetricsHookInterface):
+    """
+    Aggregates the metrics per query constant.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        acquire_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        self._latency_buckets = tuple(latency_buckets)
+        self._queries: Dict[str, _QueryMetrics] = dict()
+        self._acquire_wait = Histogram(acquire_buckets)
+        self._acquire_errors = 0
+        self._error_types: Dict[str, int] = dict()
+
+    def _count_error(self, error: BaseException) -> None:
+        name = type(error).__name__
+        self._error_types[name] = self._error_types.get(name, 0) + 1
+
+    def on_acquire(self, wait: float, error: Optional[BaseException] = None) -> None:
+        self._acquire_wait.observe(wait)
+        if error is not None:
+            self._acquire_errors += 1
+            self._count_error(error)
+
+    def on_query(
+        self,
+        query: str,
+        elapsed: float,
+        rows: int,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        label = get_query_label(query)
+        metrics = self._queries.get(label)
+        if metrics is None:
+            metrics = _QueryMetrics(self._latency_buckets)
+            self._queries[label] = metrics
+
+        metrics.latency.observe(elapsed)
+        metrics.rows += rows
+        if error is not None:
+            metrics.errors += 1
+            self._count_error(error)
+
+    def reset(self) -> None:
+        self._queries.clear()
+        self._acquire_wait = Histogram(self._acquire_wait.snapshot().bounds)
+        self._acquire_errors = 0
+        self._error_types.clear()
+
+    def snapshot(
+        self,
+        pool_size: Optional[int] = None,
+        pool_idle_size: Optional[int] = None,
+    ) -> MetricsSnapshot:
+        queries = {
+            label: QueryMetricsSnapshot(
+                label, metrics.latency.snapshot(), metrics.rows, metrics.errors
+            )
+            for label, metrics in self._queries.items()
+        }
+        return MetricsSnapshot(
+            queries,
+            self._acquire_wait.snapshot(),
+            self._acquire_errors,
+            pool_size,
+            pool_idle_size,
+            dict(self._error_types),
+        )
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+from abc import ABCMeta, abstractmethod
+from typing import Optional
+
+from recc_database.database.query_registry import get_query_name
+
+UNREGISTERED_QUERY_NAME = "unregistered"
+"""
+Label of the dynamically built queries, which would explode the label set.
+"""
+
+COPY_QUERY_LABEL_PREFIX = "COPY "
+"""
+The bulk loads are reported as `COPY <table>`.
+"""
+
+
+def get_query_label(query: str) -> str:
+    name = get_query_name(query)
+    if name is not None:
+        return name
+    if query.startswith(COPY_QUERY_LABEL_PREFIX):
+        return query
+    return UNREGISTERED_QUERY_NAME
+
+
+class MetricsHookInterface(metaclass=ABCMeta):
+    @abstractmethod
+    def on_acquire(self, wait: float, error: Optional[BaseException] = None) -> None:
+        """
+        Called after waiting for a pool connection.
+
+        :param wait: Seconds spent waiting.
+        :param error: The exception raised while acquiring, e.g. a timeout.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def on_query(
+        self,
+        query: str,
+        elapsed: float,
+        rows: int,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Called after each query.
+
+        :param query: The query text. See :func:`get_query_label`.
+        :param elapsed: Seconds spent in the query, excluding the acquire wait.
+        :param rows: The number of rows returned or affected.
+        :param error: The exception raised by the query.
+        """
+        raise NotImplementedError
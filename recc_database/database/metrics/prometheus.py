@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+from io import StringIO
+from math import inf
+from typing import Dict, Optional
+
+from recc_database.database.metrics.histogram import HistogramSnapshot
+from recc_database.database.metrics.in_memory_metrics import MetricsSnapshot
+
+DEFAULT_METRIC_PREFIX = "recc_db"
+
+PROMETHEUS_TEXT_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Optional[Dict[str, str]]) -> str:
+    if not labels:
+        return str()
+    items = (f'{k}="{_escape_label_value(v)}"' for k, v in labels.items())
+    return "{" + ",".join(items) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == inf else repr(float(bound))
+
+
+def _write_header(buffer: StringIO, name: str, kind: str, text: str) -> None:
+    buffer.write(f"# HELP {name} {text}\n")
+    buffer.write(f"# TYPE {name} {kind}\n")
+
+
+def _write_histogram(
+    buffer: StringIO,
+    name: str,
+    histogram: HistogramSnapshot,
+    labels: Optional[Dict[str, str]] = None,
+) -> None:
+    cumulative = histogram.cumulative_counts()
+    for bound, count in zip(histogram.bounds, cumulative):
+        bucket_labels = dict(labels) if labels else dict()
+        bucket_labels["le"] = _format_bound(bound)
+        buffer.write(f"{name}_bucket{_labels(bucket_labels)} {count}\n")
+    buffer.write(f"{name}_sum{_labels(labels)} {repr(histogram.sum)}\n")
+    buffer.write(f"{name}_count{_labels(labels)} {histogram.count}\n")
+
+
+def export_prometheus_text(
+    snapshot: MetricsSnapshot,
+    prefix=DEFAULT_METRIC_PREFIX,
+) -> str:
+    """
+    Render the snapshot in the Prometheus text exposition format.
+    """
+
+    buffer = StringIO()
+    queries = sorted(snapshot.queries.values(), key=lambda x: x.name)
+
+    name = f"{prefix}_query_duration_seconds"
+    _write_header(buffer, name, "histogram", "Query latency by query constant.")
+    for query in queries:
+        _write_histogram(buffer, name, query.latency, {"query": query.name})
+
+    name = f"{prefix}_query_rows_total"
+    _write_header(buffer, name, "counter", "Rows returned or affected.")
+    for query in queries:
+        buffer.write(f"{name}{_labels({'query': query.name})} {query.rows}\n")
+
+    name = f"{prefix}_query_errors_total"
+    _write_header(buffer, name, "counter", "Failed queries.")
+    for query in queries:
+        buffer.write(f"{name}{_labels({'query': query.name})} {query.errors}\n")
+
+    name = f"{prefix}_errors_total"
+    _write_header(buffer, name, "counter", "Errors by exception type.")
+    for error_type, count in sorted(snapshot.error_types.items()):
+        buffer.write(f"{name}{_labels({'type': error_type})} {count}\n")
+
+    name = f"{prefix}_pool_acquire_wait_seconds"
+    _write_header(buffer, name, "histogram", "Time waiting for a pool connection.")
+    _write_histogram(buffer, name, snapshot.acquire_wait)
+
+    name = f"{prefix}_pool_acquire_errors_total"
+    _write_header(buffer, name, "counter", "Failed pool connection acquisitions.")
+    buffer.write(f"{name} {snapshot.acquire_errors}\n")
+
+    if snapshot.pool_size is not None and snapshot.pool_idle_size is not None:
+        name = f"{prefix}_pool_connections"
+        _write_header(buffer, name, "gauge", "Open pool connections by state.")
+        in_use = snapshot.pool_size - snapshot.pool_idle_size
+        buffer.write(f"{name}{_labels({'state': 'in_use'})} {in_use}\n")
+        buffer.write(f"{name}{_labels({'state': 'idle'})} {snapshot.pool_idle_size}\n")
+
+    return buffer.getvalue()
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from logging import Logger, getLogger
+from random import random
+from typing import Any, Callable, Deque, FrozenSet, List, Optional, Sequence, Tuple
+
+from asyncpg.connection import Connection
+
+from recc_database.chrono.datetime import tznow
+from recc_database.database.metrics.metrics_hook import get_query_label
+from recc_database.database.query_registry import is_preparable
+from recc_database.database.query_utils import SQL_SEQUENCE_POINT
+
+SENSITIVE_COLUMNS = ("password", "salt", "private_key")
+REDACTED_VALUE = "<redacted>"
+
+DEFAULT_SLOW_QUERY_CAPACITY = 100
+
+_COMPARED_COLUMN_PATTERN = re.compile(r"\b(\w+)\s*(?:=|<>|!=)\s*\$(\d+)")
+_INSERT_PATTERN = re.compile(
+    r"INSERT\s+INTO\s+\S+\s*\((.*?)\)\s*VALUES\s*\((.*?)\)",
+    re.IGNORECASE | re.DOTALL,
+)
+_PLACEHOLDER_PATTERN = re.compile(r"^\$(\d+)$")
+_WRITE_KEYWORD_PATTERN = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+_EXPLAIN_ANALYZE_PREFIX = "EXPLAIN (ANALYZE, BUFFERS) "
+_EXPLAIN_PREFIX = "EXPLAIN "
+
+Random = Callable[[], float]
+
+logger = getLogger(__name__)
+
+
+@lru_cache(maxsize=1024)
+def find_sensitive_arguments(query: str) -> FrozenSet[int]:
+    """
+    Find the 0-based argument indices bound to one of the `SENSITIVE_COLUMNS`.
+    """
+
+    result = set()
+    for column, number in _COMPARED_COLUMN_PATTERN.findall(query):
+        if column.lower() in SENSITIVE_COLUMNS:
+            result.add(int(number) - 1)
+
+    for columns, values in _INSERT_PATTERN.findall(query):
+        names = [c.strip().lower() for c in columns.split(",")]
+        placeholders = [v.strip() for v in values.split(",")]
+        for name, placeholder in zip(names, placeholders):
+            matched = _PLACEHOLDER_PATTERN.match(placeholder)
+            if matched and name in SENSITIVE_COLUMNS:
+                result.add(int(matched.group(1)) - 1)
+    return frozenset(result)
+
+
+def redact_arguments(query: str, args: Sequence[Any]) -> Tuple[Any, ...]:
+    indices = find_sensitive_arguments(query)
+    return tuple(REDACTED_VALUE if i in indices else a for i, a in enumerate(args))
+
+
+def is_read_only(query: str) -> bool:
+    keyword = query.lstrip().split(maxsplit=1)[0].upper() if query.strip() else ""
+    if keyword not in ("SELECT", "WITH"):
+        return False
+    return _WRITE_KEYWORD_PATTERN.search(query) is None
+
+
+async def explain(conn: Connection, query: str, *args) -> str:
+    """
+    Capture the plan of the query in a transaction that is always rolled back.
+
+    Only read-only statements are executed with `ANALYZE`.
+    """
+
+    prefix = _EXPLAIN_ANALYZE_PREFIX if is_read_only(query) else _EXPLAIN_PREFIX
+    statement = prefix + query.strip().rstrip(SQL_SEQUENCE_POINT)
+    transaction = conn.transaction()
+    await transaction.start()
+    try:
+        rows = await conn.fetch(statement, *args)
+    finally:
+        await transaction.rollback()
+    return "\n".join(row[0] for row in rows)
+
+
+@dataclass(frozen=True)
+class SlowQueryRecord:
+    name: str
+    query: str
+    args: Tuple[Any, ...]
+    """
+    The arguments with the sensitive values redacted.
+    """
+
+    elapsed: float
+    recorded_at: datetime
+    plan: Optional[str] = None
+
+
+class SlowQueryLog:
+    """
+    Keeps the most recent queries slower than the threshold in a ring buffer.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        capacity=DEFAULT_SLOW_QUERY_CAPACITY,
+        explain_sample_rate=0.0,
+        random_func: Random = random,
+        log: Optional[Logger] = logger,
+    ):
+        if threshold < 0:
+            raise ValueError("The threshold must not be negative")
+        if capacity < 1:
+            raise ValueError("The capacity must be at least 1")
+        if not 0.0 <= explain_sample_rate <= 1.0:
+            raise ValueError("The explain_sample_rate must be between 0 and 1")
+        self._threshold = threshold
+        self._explain_sample_rate = explain_sample_rate
+        self._random = random_func
+        self._log = log
+        self._records: Deque[SlowQueryRecord] = deque(maxlen=capacity)
+
+    @property
+    def threshold(self) -> float:
+        return self._threshold
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def is_slow(self, elapsed: float) -> bool:
+        return elapsed >= self._threshold
+
+    def sample_explain(self, query: str) -> bool:
+        if not self._explain_sample_rate or not is_preparable(query):
+            return False
+        return self._random() < self._explain_sample_rate
+
+    def record(
+        self,
+        query: str,
+        args: Sequence[Any],
+        elapsed: float,
+        plan: Optional[str] = None,
+    ) -> SlowQueryRecord:
+        name = get_query_label(query)
+        redacted = redact_arguments(query, args)
+        item = SlowQueryRecord(name, query, redacted, elapsed, tznow(), plan)
+        self._records.append(item)
+        if self._log is not None:
+            self._log.warning(
+                "Slow query %s took %.3fs with arguments %r", name, elapsed, redacted
+            )
+        return item
+
+    def records(self) -> List[SlowQueryRecord]:
+        """
+        The oldest record comes first.
+        """
+        return list(self._records)
+
+    def plans(self) -> List[SlowQueryRecord]:
+        return [r for r in self._records if r.plan is not None]
+
+    def clear(self) -> None:
+        self._records.clear()
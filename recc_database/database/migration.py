@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+import re
+from asyncio import sleep
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Sequence, Tuple
+
+from asyncpg.connection import Connection
+
+from recc_database.chrono.datetime import tznow
+from recc_database.database.query.info import (
+    SELECT_INFO_DB_VERSION,
+    UPDATE_INFO_VALUE_BY_KEY,
+)
+from recc_database.database.query.migration import (
+    MIGRATION_2_2_0,
+    MIGRATION_2_3_0,
+    SELECT_ADVISORY_UNLOCK,
+    SELECT_INVALID_INDEX_NAMES,
+    SELECT_TRY_ADVISORY_LOCK,
+    get_drop_index_concurrently_query,
+)
+from recc_database.variables.database import (
+    DATABASE_MIGRATION_LOCK_KEY,
+    DATABASE_MIGRATION_LOCK_POLL_SECONDS,
+    INFO_KEY_RECC_DB_VERSION,
+)
+
+_RELEASE_VERSION_PATTERN = re.compile(r"\d+(?:\.\d+)*")
+
+
+def parse_version(version: str) -> Tuple[int, ...]:
+    """
+    Only the leading release numbers are compared, so a pre-release or
+    development build such as `2.3.0rc1` or `2.3.0.dev0` counts as its release.
+    """
+
+    matched = _RELEASE_VERSION_PATTERN.match(version.strip())
+    if matched is None:
+        raise ValueError(f"Invalid version: '{version}'")
+    return tuple(int(x) for x in matched.group().split("."))
+
+
+@dataclass(frozen=True)
+class MigrationStep:
+    version: str
+    queries: Sequence[str]
+
+    transaction: bool = True
+    """
+    The queries of a non-transactional step run one by one in autocommit mode,
+    which `CREATE INDEX CONCURRENTLY` requires. They must be idempotent,
+    because a failed step is retried from the first query.
+    """
+
+
+MIGRATION_STEPS = (
+    MigrationStep("2.2.0", MIGRATION_2_2_0, transaction=False),
+    MigrationStep("2.3.0", MIGRATION_2_3_0, transaction=False),
+)
+
+
+@asynccontextmanager
+async def advisory_lock(
+    conn: Connection,
+    key=DATABASE_MIGRATION_LOCK_KEY,
+    poll_interval=DATABASE_MIGRATION_LOCK_POLL_SECONDS,
+) -> AsyncIterator[None]:
+    """
+    Hold the session-level advisory lock, waiting for the other nodes first.
+
+    The lock is polled instead of waited for in `pg_advisory_lock()`, because
+    the waiting statement would block the `CREATE INDEX CONCURRENTLY` of the
+    node holding the lock, which waits for all running transactions.
+    """
+
+    while not await conn.fetchval(SELECT_TRY_ADVISORY_LOCK, key):
+        await sleep(poll_interval)
+    try:
+        yield
+    finally:
+        await conn.execute(SELECT_ADVISORY_UNLOCK, key)
+
+
+async def _update_version(conn: Connection, version: str) -> None:
+    await conn.execute(
+        UPDATE_INFO_VALUE_BY_KEY, INFO_KEY_RECC_DB_VERSION, version, tznow()
+    )
+
+
+async def _drop_invalid_indices(conn: Connection) -> None:
+    # A failed `CREATE INDEX CONCURRENTLY` leaves an INVALID index behind,
+    # which `IF NOT EXISTS` would silently keep.
+    for record in await conn.fetch(SELECT_INVALID_INDEX_NAMES):
+        await conn.execute(get_drop_index_concurrently_query(record[0]))
+
+
+async def run_step(conn: Connection, step: MigrationStep) -> None:
+    if step.transaction:
+        async with conn.transaction():
+            for query in step.queries:
+                await conn.execute(query)
+            await _update_version(conn, step.version)
+    else:
+        await _drop_invalid_indices(conn)
+        for query in step.queries:
+            await conn.execute(query)
+        await _update_version(conn, step.version)
+
+
+async def apply_migrations(
+    conn: Connection,
+    steps: Sequence[MigrationStep] = MIGRATION_STEPS,
+) -> List[str]:
+    """
+    Apply the steps newer than the database version in order.
+
+    The database version is updated after each step, so an interrupted
+    migration resumes from the failed step. Call it while holding the
+    :func:`advisory_lock`.
+
+    :return: The versions of the applied steps.
+    """
+
+    applied = list()
+    db_version = parse_version(await conn.fetchval(SELECT_INFO_DB_VERSION))
+    for step in steps:
+        if parse_version(step.version) <= db_version:
+            continue
+        await run_step(conn, step)
+        applied.append(step.version)
+    return applied
@@ -1,19 +1,80 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, List, Optional, Type, TypeVar
+from contextlib import asynccontextmanager
+from copy import copy
+from functools import partial
+from time import perf_counter
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from asyncpg import InvalidCatalogNameError, connect, create_pool
 from asyncpg.connection import Connection
+from asyncpg.exceptions import PostgresError
 from asyncpg.pool import Pool, PoolAcquireContext
 from asyncpg.protocol import Record
 from orjson import dumps, loads
 
+from recc_database.database.cache.info_cache import InfoCache
+from recc_database.database.cache.invalidation_bus import InvalidationBus
+from recc_database.database.cache.permission_cache import PermissionCache
+from recc_database.database.cache.permission_matrix import (
+    PermissionMatrix,
+    PermissionMatrixCache,
+)
+from recc_database.database.cache.slug_cache import SlugCache, SlugMapSelector
+from recc_database.database.metrics.in_memory_metrics import (
+    InMemoryMetrics,
+    MetricsSnapshot,
+)
+from recc_database.database.metrics.metrics_hook import (
+    COPY_QUERY_LABEL_PREFIX,
+    MetricsHookInterface,
+)
+from recc_database.database.metrics.slow_query_log import SlowQueryLog, explain
+from recc_database.database.pg_listener import PgChangeListener
+from recc_database.database.pool_options import PgPoolOptions
+from recc_database.database.query.create.triggers import (
+    get_create_notify_change_triggers,
+)
+from recc_database.database.query.permission import SELECT_PERMISSION_ALL
+from recc_database.database.query.role_permission import SELECT_ROLE_PERMISSION_ALL
+from recc_database.database.query.serial import SELECT_NEXT_SERIAL_UIDS
+from recc_database.database.query_registry import HOT_QUERIES
 from recc_database.database.query_utils import merge_queries
+from recc_database.database.row_mapper import get_row_mapper
+from recc_database.packet.permission import Permission
+from recc_database.packet.role_permission import RolePermission
+from recc_database.packet.slotted import can_slot, slotted
+from recc_database.variables.database import (
+    DATABASE_CURSOR_PREFETCH,
+    DATABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS,
+    DATABASE_POOL_MAX_QUERIES,
+    DATABASE_POOL_MAX_SIZE,
+    DATABASE_POOL_MIN_SIZE,
+    DATABASE_STATEMENT_CACHE_SIZE,
+)
 
 _DEFAULT_TEMPLATE_DATABASE = "template1"
+_JSONB_BINARY_FORMAT_VERSION = b"\x01"
 
 RecordType = TypeVar("RecordType")
+SessionType = TypeVar("SessionType", bound="PgBase")
+ResultType = TypeVar("ResultType")
 ColumnType = TypeVar("ColumnType")
+CacheType = Union[PermissionCache, PermissionMatrixCache, SlugCache, InfoCache]
 
 
 class PgConnection:
@@ -21,16 +82,31 @@ class PgConnection:
     Implementation for Type Hinting.
     """
 
-    __slots__ = ("_pool", "_conn", "_timeout")
+    __slots__ = ("_pool", "_conn", "_timeout", "_metrics")
 
-    def __init__(self, pool: Pool, timeout: Optional[float] = None):
+    def __init__(
+        self,
+        pool: Pool,
+        timeout: Optional[float] = None,
+        metrics: Optional[MetricsHookInterface] = None,
+    ):
         assert pool is not None
         self._pool = pool
         self._conn: Optional[PoolAcquireContext] = None
         self._timeout = timeout
+        self._metrics = metrics
 
     async def __aenter__(self) -> Connection:
-        conn = await self._pool.acquire(timeout=self._timeout)
+        if self._metrics is None:
+            conn = await self._pool.acquire(timeout=self._timeout)
+        else:
+            started = perf_counter()
+            try:
+                conn = await self._pool.acquire(timeout=self._timeout)
+            except BaseException as e:
+                self._metrics.on_acquire(perf_counter() - started, e)
+                raise
+            self._metrics.on_acquire(perf_counter() - started)
         self._conn = conn
         return self._conn
 
@@ -38,13 +114,107 @@ class PgConnection:
         await self._pool.release(self._conn)
 
 
+class PgPinnedConnection:
+    """
+    The connection of a session. It is released when the session ends.
+    """
+
+    __slots__ = ("_conn",)
+
+    def __init__(self, conn: Connection):
+        self._conn = conn
+
+    async def __aenter__(self) -> Connection:
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        pass
+
+
+async def warm_up_statements(conn: Connection, queries: Iterable[str]) -> int:
+    """
+    Prepare the queries into the statement cache of the connection.
+
+    The `fetch*()` and `execute()` calls with arguments look up this cache first,
+    so a warmed query skips the parse/plan round trip on its first use.
+    The public `Connection.prepare()` bypasses the cache (`use_cache=False`),
+    so the private `Connection._get_statement()` is used. Its signature is
+    checked by the tests against the pinned asyncpg versions, and the warm-up
+    is skipped if it is gone.
+    """
+
+    get_statement = getattr(conn, "_get_statement", None)
+    if get_statement is None:
+        return 0
+
+    count = 0
+    for query in queries:
+        try:
+            await get_statement(query, None)
+            count += 1
+        except PostgresError:
+            # e.g. The tables have not been created yet.
+            pass
+
+    # The parse messages are not followed by a sync, so the implicit transaction
+    # keeps its relation locks (and blocks any DDL) until the next simple query.
+    await conn.execute("SELECT 1;")
+    return count
+
+
+def _count_status_rows(status: Any) -> int:
+    # e.g. "INSERT 0 3", "UPDATE 2", "COPY 10"
+    count = status.rsplit(" ", 1)[-1] if isinstance(status, str) else str()
+    return int(count) if count.isdigit() else 0
+
+
+def _count_row(row: Any) -> int:
+    return 0 if row is None else 1
+
+
 async def _init_connection(conn: Connection):
+    # The binary format is required by `copy_records_to_table()`.
     await conn.set_type_codec(
         "jsonb",
         schema="pg_catalog",
-        encoder=lambda x: str(dumps(x), "utf-8"),
-        decoder=loads,
-        format="text",
+        encoder=lambda x: _JSONB_BINARY_FORMAT_VERSION + dumps(x),
+        decoder=lambda x: loads(x[1:]),
+        format="binary",
+    )
+    await warm_up_statements(conn, HOT_QUERIES)
+
+
+async def _create_pool(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    user: Optional[str] = None,
+    password: Optional[str] = None,
+    database: Optional[str] = None,
+    command_timeout: Optional[float] = None,
+    min_size=DATABASE_POOL_MIN_SIZE,
+    max_size=DATABASE_POOL_MAX_SIZE,
+    max_queries=DATABASE_POOL_MAX_QUERIES,
+    max_inactive_connection_lifetime=(
+        DATABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS
+    ),
+) -> Pool:
+    return await create_pool(
+        min_size=min_size,
+        max_size=max_size,
+        max_queries=max_queries,
+        max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+        setup=None,
+        init=_init_connection,
+        loop=None,
+        connection_class=Connection,
+        record_class=Record,
+        statement_cache_size=DATABASE_STATEMENT_CACHE_SIZE,
+        host=host,
+        port=port,
+        user=user,
+        password=password,
+        database=database,
+        command_timeout=command_timeout,
     )
 
 
@@ -55,30 +225,29 @@ async def connect_and_create_if_not_exists(
     password: Optional[str] = None,
     database: Optional[str] = None,
     command_timeout: Optional[float] = None,
-    min_size=10,
-    max_size=10,
-    max_queries=50000,
-    max_inactive_connection_lifetime=300.0,
+    min_size=DATABASE_POOL_MIN_SIZE,
+    max_size=DATABASE_POOL_MAX_SIZE,
+    max_queries=DATABASE_POOL_MAX_QUERIES,
+    max_inactive_connection_lifetime=(
+        DATABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS
+    ),
 ) -> Pool:
+    create = partial(
+        _create_pool,
+        host=host,
+        port=port,
+        user=user,
+        password=password,
+        database=database,
+        command_timeout=command_timeout,
+        min_size=min_size,
+        max_size=max_size,
+        max_queries=max_queries,
+        max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+    )
+
     try:
-        pool = await create_pool(
-            min_size=min_size,
-            max_size=max_size,
-            max_queries=max_queries,
-            max_inactive_connection_lifetime=max_inactive_connection_lifetime,
-            setup=None,
-            init=_init_connection,
-            loop=None,
-            connection_class=Connection,
-            record_class=Record,
-            host=host,
-            port=port,
-            user=user,
-            password=password,
-            database=database,
-            command_timeout=command_timeout,
-        )
-        return pool
+        return await create()
     except InvalidCatalogNameError:
         # Database does not exist, create it.
         pass
@@ -95,15 +264,7 @@ async def connect_and_create_if_not_exists(
     await sys_conn.close()
 
     # Connect to the newly created database.
-    return await create_pool(
-        host=host,
-        port=port,
-        user=user,
-        password=password,
-        database=database,
-        command_timeout=command_timeout,
-        init=_init_connection,
-    )
+    return await create()
 
 
 async def drop_database(
@@ -127,6 +288,19 @@ class PgBase:
     _pw: Optional[str] = None
     _name: Optional[str] = None
     _timeout: Optional[float] = None
+    _pool_options = PgPoolOptions()
+    _permission_cache: Optional[PermissionCache] = None
+    _permission_matrix: Optional[PermissionMatrixCache] = None
+    _slug_cache: Optional[SlugCache] = None
+    _info_cache: Optional[InfoCache] = None
+    _invalidation_bus: Optional[InvalidationBus] = None
+    _listener: Optional[PgChangeListener] = None
+    _listen_changes = False
+    _session_conn: Optional[Connection] = None
+    _metrics: Optional[MetricsHookInterface] = None
+    _slow_query_log: Optional[SlowQueryLog] = None
+    _slotted_packets = False
+    _project_access_table = False
 
     @property
     def host(self):
@@ -148,9 +322,62 @@ class PgBase:
     def timeout(self):
         return self._timeout
 
+    @property
+    def pool_options(self) -> PgPoolOptions:
+        return self._pool_options
+
+    @property
+    def metrics(self) -> Optional[MetricsHookInterface]:
+        return self._metrics
+
+    @property
+    def slow_query_log(self) -> Optional[SlowQueryLog]:
+        return self._slow_query_log
+
+    def metrics_snapshot(self) -> MetricsSnapshot:
+        if not isinstance(self._metrics, InMemoryMetrics):
+            raise TypeError("The metrics hook does not keep a snapshot")
+        if self._pool is not None:
+            return self._metrics.snapshot(self.pool_size(), self.pool_idle_size())
+        return self._metrics.snapshot()
+
+    def pool_size(self) -> int:
+        """
+        The number of connections currently open.
+        """
+        assert self._pool is not None
+        return self._pool.get_size()
+
+    def pool_idle_size(self) -> int:
+        assert self._pool is not None
+        return self._pool.get_idle_size()
+
+    @property
+    def permission_cache(self) -> Optional[PermissionCache]:
+        return self._permission_cache
+
+    @property
+    def slug_cache(self) -> Optional[SlugCache]:
+        return self._slug_cache
+
+    @property
+    def info_cache(self) -> Optional[InfoCache]:
+        return self._info_cache
+
+    @property
+    def invalidation_bus(self) -> Optional[InvalidationBus]:
+        return self._invalidation_bus
+
+    @property
+    def listener(self) -> Optional[PgChangeListener]:
+        return self._listener
+
     def is_open(self) -> bool:
         return self._pool is not None
 
+    def in_session(self) -> bool:
+        return self._session_conn is not None
+
     async def open(self) -> None:
         self._pool = await connect_and_create_if_not_exists(
             host=self._host,
@@ -159,13 +386,69 @@ class PgBase:
             password=self._pw,
             database=self._name,
             command_timeout=self._timeout,
+            min_size=self._pool_options.min_size,
+            max_size=self._pool_options.max_size,
+            max_queries=self._pool_options.max_queries,
+            max_inactive_connection_lifetime=(
+                self._pool_options.max_inactive_connection_lifetime
+            ),
         )
+        if self._listen_changes and self._invalidation_bus is not None:
+            listener = PgChangeListener(
+                self._invalidation_bus,
+                host=self._host,
+                port=self._port,
+                user=self._user,
+                password=self._pw,
+                database=self._name,
+            )
+            try:
+                async with self._pool.acquire() as conn:
+                    await self._create_change_triggers(conn)
+                await listener.open()
+            except BaseException:
+                await self._pool.close()
+                self._pool = None
+                raise
+            self._listener = listener
+
+    async def _create_change_triggers(self, conn: Connection) -> None:
+        """
+        Only the events consumed by the registered caches are notified,
+        so the other nodes and tables do not pay for the triggers.
+        The tables of a new database get them in `create_tables()`.
+        """
+
+        assert self._invalidation_bus is not None
+        change_events = self._invalidation_bus.change_events()
+        queries = get_create_notify_change_triggers(change_events)
+        if queries:
+            await conn.execute(merge_queries(*queries))
 
     async def close(self) -> None:
         assert self._pool is not None
+        if self._listener is not None:
+            await self._listener.close()
+            self._listener = None
         await self._pool.close()
         self._pool = None
 
+    def _caches(self) -> List[CacheType]:
+        caches = (
+            self._permission_cache,
+            self._permission_matrix,
+            self._slug_cache,
+            self._info_cache,
+        )
+        return [cache for cache in caches if cache is not None]
+
+    def clear_caches(self) -> None:
+        if self._invalidation_bus is not None:
+            self._invalidation_bus.reset()
+            return
+        for cache in self._caches():
+            cache.clear()
+
     async def drop_database(self) -> None:
         await drop_database(
             self._host,
@@ -175,9 +458,82 @@ class PgBase:
             self._name,
         )
 
-    def conn(self) -> PgConnection:
+    def conn(self) -> Union[PgConnection, PgPinnedConnection]:
+        if self._session_conn is not None:
+            return PgPinnedConnection(self._session_conn)
+        assert self._pool is not None
+        return PgConnection(
+            self._pool, self._pool_options.acquire_timeout, self._metrics
+        )
+
+    @asynccontextmanager
+    async def session(
+        self: SessionType,
+        transaction=False,
+        isolation: Optional[str] = None,
+        readonly=False,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[SessionType]:
+        """
+        Pin a single pool connection to every call made through the yielded object.
+
+        .. code-block:: python
+
+            async with db.session(transaction=True) as session:
+                uid = await session.insert_user(...)
+                await session.insert_group_member(group_uid, uid, role_uid)
+
+        :param transaction: Run the session in a transaction.
+            A nested transactional session creates a savepoint.
+        :param isolation: The transaction isolation mode.
+        :param readonly: Specifies whether the transaction is read-only.
+        :param timeout: The timeout of acquiring a connection.
+            Defaults to the `acquire_timeout` of the pool options.
+        """
+
+        if self._session_conn is not None:
+            if transaction:
+                async with self._session_conn.transaction(
+                    isolation=isolation, readonly=readonly
+                ):
+                    yield self
+            else:
+                yield self
+            return
+
         assert self._pool is not None
-        return PgConnection(self._pool)
+        if timeout is None:
+            timeout = self._pool_options.acquire_timeout
+        async with PgConnection(self._pool, timeout, self._metrics) as conn:
+            session = copy(self)
+            session._session_conn = conn
+            try:
+                if transaction:
+                    async with self._transaction_caches(conn, isolation, readonly):
+                        yield session
+                else:
+                    yield session
+            finally:
+                session._session_conn = None
+
+    @asynccontextmanager
+    async def _transaction_caches(
+        self,
+        conn: Connection,
+        isolation: Optional[str] = None,
+        readonly=False,
+    ) -> AsyncIterator[None]:
+        caches = self._caches()
+        generations = [cache.generation for cache in caches]
+        try:
+            async with conn.transaction(isolation=isolation, readonly=readonly):
+                yield
+        finally:
+            # The invalidations happened before the transaction ended,
+            # so results read in the meantime may have been cached.
+            for cache, generation in zip(caches, generations):
+                if generation != cache.generation:
+                    cache.clear()
 
     async def execute(
         self,
@@ -186,7 +542,45 @@ class PgBase:
         timeout: Optional[float] = None,
     ) -> Any:
         async with self.conn() as conn:
-            await conn.execute(query, *args, timeout=timeout)
+            call = conn.execute(query, *args, timeout=timeout)
+            if not self._is_observed():
+                await call
+            else:
+                await self._observe(conn, query, args, call, _count_status_rows)
+
+    def _is_observed(self) -> bool:
+        return self._metrics is not None or self._slow_query_log is not None
+
+    async def _observe(
+        self,
+        conn: Connection,
+        query: str,
+        args: Sequence[Any],
+        call: Awaitable[ResultType],
+        count: Callable[[ResultType], int],
+    ) -> ResultType:
+        started = perf_counter()
+        try:
+            result = await call
+        except BaseException as e:
+            if self._metrics is not None:
+                self._metrics.on_query(query, perf_counter() - started, 0, e)
+            raise
+        elapsed = perf_counter() - started
+
+        if self._metrics is not None:
+            self._metrics.on_query(query, elapsed, count(result))
+
+        slow_query_log = self._slow_query_log
+        if slow_query_log is not None and slow_query_log.is_slow(elapsed):
+            plan: Optional[str] = None
+            if slow_query_log.sample_explain(query):
+                try:
+                    plan = await explain(conn, query, *args)
+                except PostgresError as e:
+                    plan = f"EXPLAIN failed: {e}"
+            slow_query_log.record(query, args, elapsed, plan)
+        return result
 
     async def executes(
         self,
@@ -196,6 +590,63 @@ class PgBase:
         merged_single_query = merge_queries(*queries)
         await self.execute(merged_single_query, timeout=timeout)
 
+    async def copy_records(
+        self,
+        table: str,
+        columns: Sequence[str],
+        records: Iterable[Tuple[Any, ...]],
+        timeout: Optional[float] = None,
+    ) -> None:
+        async with self.conn() as conn:
+            call = conn.copy_records_to_table(
+                table,
+                records=records,
+                columns=columns,
+                timeout=timeout,
+            )
+            if not self._is_observed():
+                await call
+            else:
+                label = COPY_QUERY_LABEL_PREFIX + table
+                await self._observe(conn, label, (), call, _count_status_rows)
+
+    async def copy_records_returning_uids(
+        self,
+        table: str,
+        columns: Sequence[str],
+        records: Iterable[Tuple[Any, ...]],
+        timeout: Optional[float] = None,
+    ) -> List[int]:
+        """
+        COPY the records into a table with a `uid SERIAL` column.
+
+        COPY cannot return the generated keys,
+        so the uids are reserved from the sequence first.
+
+        :return: The uids in the order of the records.
+        """
+
+        items = list(records)
+        if not items:
+            return list()
+
+        async with self.conn() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch(SELECT_NEXT_SERIAL_UIDS, table, len(items))
+                uids = [row[0] for row in rows]
+                call = conn.copy_records_to_table(
+                    table,
+                    records=[(u, *r) for u, r in zip(uids, items)],
+                    columns=("uid", *columns),
+                    timeout=timeout,
+                )
+                if not self._is_observed():
+                    await call
+                else:
+                    label = COPY_QUERY_LABEL_PREFIX + table
+                    await self._observe(conn, label, (), call, _count_status_rows)
+        return uids
+
     async def fetch_rows(
         self,
         query: str,
@@ -203,7 +654,10 @@ class PgBase:
         timeout: Optional[float] = None,
     ) -> Any:
         async with self.conn() as conn:
-            return await conn.fetch(query, *args, timeout=timeout)
+            call = conn.fetch(query, *args, timeout=timeout)
+            if not self._is_observed():
+                return await call
+            return await self._observe(conn, query, args, call, len)
 
     async def fetch_first_row(
         self,
@@ -212,7 +666,10 @@ class PgBase:
         timeout: Optional[float] = None,
     ) -> Any:
         async with self.conn() as conn:
-            return await conn.fetchrow(query, *args, timeout=timeout)
+            call = conn.fetchrow(query, *args, timeout=timeout)
+            if not self._is_observed():
+                return await call
+            return await self._observe(conn, query, args, call, _count_row)
 
     async def fetch_first_row_column(
         self,
@@ -222,7 +679,15 @@ class PgBase:
         timeout: Optional[float] = None,
     ) -> Any:
         async with self.conn() as conn:
-            return await conn.fetchval(query, *args, column=column, timeout=timeout)
+            call = conn.fetchval(query, *args, column=column, timeout=timeout)
+            if not self._is_observed():
+                return await call
+            return await self._observe(conn, query, args, call, _count_row)
+
+    def _packet_class(self, cls: Type[RecordType]) -> Type[RecordType]:
+        if self._slotted_packets and can_slot(cls):
+            return slotted(cls)
+        return cls
 
     async def rows(
         self,
@@ -232,10 +697,74 @@ class PgBase:
         timeout: Optional[float] = None,
     ) -> List[RecordType]:
         rows = await self.fetch_rows(query, *args, timeout=timeout)
-        if rows is not None:
-            return [cls(**row) for row in rows]
-        else:
+        if not rows:
             return list()
+        mapper = get_row_mapper(self._packet_class(cls), tuple(rows[0].keys()))
+        return [mapper(row) for row in rows]
+
+    async def rows_by_uid(
+        self,
+        cls: Type[RecordType],
+        query: str,
+        uids: Iterable[int],
+        timeout: Optional[float] = None,
+    ) -> Dict[int, RecordType]:
+        """
+        Run a query of the `uid=ANY($1::INTEGER[])` form in a single round trip.
+
+        :return: The rows keyed by their `uid` column. Unknown uids are omitted.
+        """
+
+        keys = list(uids)
+        if not keys:
+            return dict()
+        rows = await self.fetch_rows(query, keys, timeout=timeout)
+        if not rows:
+            return dict()
+        mapper = get_row_mapper(self._packet_class(cls), tuple(rows[0].keys()))
+        return {row["uid"]: mapper(row) for row in rows}
+
+    async def columns_by_uid(
+        self,
+        query: str,
+        uids: Iterable[int],
+        timeout: Optional[float] = None,
+    ) -> Dict[int, Any]:
+        """
+        Like :meth:`rows_by_uid`, for a query selecting the `uid` and one value.
+        """
+
+        keys = list(uids)
+        if not keys:
+            return dict()
+        rows = await self.fetch_rows(query, keys, timeout=timeout)
+        return {row[0]: row[1] for row in rows}
+
+    async def stream(
+        self,
+        cls: Type[RecordType],
+        query: str,
+        *args,
+        prefetch=DATABASE_CURSOR_PREFETCH,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[RecordType]:
+        """
+        Iterate the query result through a server-side cursor in a transaction.
+
+        Only `prefetch` rows are held in memory at a time. The connection is
+        kept until the iteration finishes, so exhaust the iterator or call its
+        `aclose()` when stopping early.
+        """
+
+        async with self.conn() as conn:
+            async with conn.transaction():
+                cursor = conn.cursor(query, *args, prefetch=prefetch, timeout=timeout)
+                mapper: Optional[Callable[[Any], RecordType]] = None
+                async for record in cursor:
+                    if mapper is None:
+                        columns = tuple(record.keys())
+                        mapper = get_row_mapper(self._packet_class(cls), columns)
+                    yield mapper(record)
 
     async def row(
         self,
@@ -247,7 +776,8 @@ class PgBase:
         row = await self.fetch_first_row(query, *args, timeout=timeout)
         if row is None:
             raise LookupError("The query result does not exist")
-        return cls(**row)
+        mapper = get_row_mapper(self._packet_class(cls), tuple(row.keys()))
+        return mapper(row)
 
     async def column(
         self,
@@ -265,3 +795,65 @@ class PgBase:
         if not isinstance(value, cls):
             raise TypeError(f"The result is not of the '{cls.__name__}' type")
         return value
+
+    async def _select_permission_matrix(self) -> PermissionMatrix:
+        cache = self._permission_matrix
+        if cache is not None and cache.matrix is not None:
+            return cache.matrix
+
+        generation = cache.generation if cache is not None else None
+        permissions = await self.rows(Permission, SELECT_PERMISSION_ALL)
+        role_permissions = await self.rows(RolePermission, SELECT_ROLE_PERMISSION_ALL)
+        matrix = PermissionMatrix(permissions, role_permissions)
+        if cache is not None and not self.in_session():
+            # The transaction of a session may still roll back the grants.
+            cache.set(matrix, generation)
+        return matrix
+
+    async def _clear_permission_cache(self) -> None:
+        if self._permission_cache is not None:
+            self._permission_cache.clear()
+
+        matrix_cache = self._permission_matrix
+        if matrix_cache is None:
+            return
+        loaded = matrix_cache.matrix is not None
+        matrix_cache.clear()
+        if loaded and not self.in_session():
+            # Keep the checks of the loaded matrix free of database access.
+            await self._select_permission_matrix()
+
+    async def _select_uid_by_slug(
+        self, slug_map: SlugMapSelector, query: str, slug: str
+    ) -> int:
+        cache = self._slug_cache
+        if cache is None:
+            return await self.column(int, query, slug)
+
+        uid = slug_map(cache).get_uid(slug)
+        if uid is not None:
+            return uid
+
+        generation = cache.generation
+        uid = await self.column(int, query, slug)
+        if not self.in_session():
+            # The transaction of a session may still roll back the row.
+            cache.set(slug_map(cache), slug, (uid,), generation)
+        return uid
+
+    async def _select_slug_by_uid(
+        self, slug_map: SlugMapSelector, query: str, uid: int
+    ) -> str:
+        cache = self._slug_cache
+        if cache is None:
+            return await self.column(str, query, uid)
+
+        slug = slug_map(cache).get_key(uid)
+        if slug is not None:
+            return slug
+
+        generation = cache.generation
+        slug = await self.column(str, query, uid)
+        if not self.in_session():
+            cache.set(slug_map(cache), slug, (uid,), generation)
+        return slug
@@ -1,23 +1,61 @@
 # -*- coding: utf-8 -*-
 
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from recc_database.chrono.datetime import tznow
 from recc_database.database.mixin._pg_base import PgBase
 from recc_database.database.query.group import (
+    COPY_GROUP_COLUMNS,
     DELETE_GROUP_BY_UID,
+    DELETE_GROUP_EXTRA_PATH_BY_UID,
+    INCREMENT_GROUP_EXTRA_PATH_BY_UID,
     INSERT_GROUP,
+    MERGE_GROUP_EXTRA_BY_UID,
     SELECT_GROUP_ALL,
     SELECT_GROUP_BY_BELOW_VISIBILITY,
+    SELECT_GROUP_BY_EXTRA_CONTAINS,
+    SELECT_GROUP_BY_FEATURES_ALL,
+    SELECT_GROUP_BY_FEATURES_ANY,
     SELECT_GROUP_BY_UID,
+    SELECT_GROUP_BY_UIDS,
     SELECT_GROUP_COUNT,
+    SELECT_GROUP_PAGE,
     SELECT_GROUP_SLUG_BY_UID,
     SELECT_GROUP_UID_BY_SLUG,
+    SET_GROUP_EXTRA_PATH_BY_UID,
     get_update_group_query_by_uid,
 )
+from recc_database.database.query.jsonb import JsonbPath, jsonb_path
 from recc_database.packet.group import Group
-from recc_database.variables.database import VISIBILITY_LEVEL_PRIVATE
+from recc_database.variables.database import (
+    DATABASE_PAGE_LIMIT,
+    TABLE_GROUP,
+    VISIBILITY_LEVEL_PRIVATE,
+)
+
+
+def _group_record(
+    slug: str,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    features: Optional[List[str]] = None,
+    visibility=VISIBILITY_LEVEL_PRIVATE,
+    extra: Optional[Any] = None,
+    created_at: Optional[datetime] = None,
+) -> Tuple[Any, ...]:
+    created = created_at if created_at else tznow()
+    return slug, name, description, features, visibility, extra, created, created
 
 
 class PgGroup(PgBase):
@@ -31,17 +69,20 @@ class PgGroup(PgBase):
         extra: Optional[Any] = None,
         created_at: Optional[datetime] = None,
     ) -> int:
-        created = created_at if created_at else tznow()
-        return await self.column(
-            int,
-            INSERT_GROUP,
-            slug,
-            name,
-            description,
-            features,
-            visibility,
-            extra,
-            created,
+        record = _group_record(
+            slug, name, description, features, visibility, extra, created_at
+        )
+        return await self.column(int, INSERT_GROUP, *record)
+
+    async def insert_groups(self, groups: Iterable[Mapping[str, Any]]) -> List[int]:
+        """
+        :param groups: The keyword arguments of :meth:`insert_group` for each group.
+        :return: The uids in the order of the groups.
+        """
+
+        records = [_group_record(**group) for group in groups]
+        return await self.copy_records_returning_uids(
+            TABLE_GROUP, COPY_GROUP_COLUMNS, records
         )
 
     async def update_group_by_uid(
@@ -67,24 +108,122 @@ class PgGroup(PgBase):
             updated_at=updated,
         )
         await self.execute(query, *args)
+        if slug is not None and self._slug_cache is not None:
+            self._slug_cache.invalidate_group(uid)
+
+    async def merge_group_extra_by_uid(
+        self,
+        uid: int,
+        extra: Mapping[str, Any],
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        await self.execute(MERGE_GROUP_EXTRA_BY_UID, uid, extra, updated)
+
+    async def update_group_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        value: Any,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        await self.execute(SET_GROUP_EXTRA_PATH_BY_UID, uid, keys, value, updated)
+
+    async def delete_group_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        await self.execute(DELETE_GROUP_EXTRA_PATH_BY_UID, uid, keys, updated)
+
+    async def increment_group_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        delta: Union[int, float] = 1,
+        updated_at: Optional[datetime] = None,
+    ) -> Union[int, float]:
+        """
+        :return: The number at the path after the increment.
+        :raise LookupError: If the group or the parent of the path does not exist.
+        """
+
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        result = await self.fetch_first_row_column(
+            INCREMENT_GROUP_EXTRA_PATH_BY_UID, uid, keys, delta, updated
+        )
+        if result is None:
+            raise LookupError("The query result does not exist")
+        return result
 
     async def delete_group_by_uid(self, uid: int) -> None:
         await self.execute(DELETE_GROUP_BY_UID, uid)
+        if self._permission_cache is not None:
+            self._permission_cache.invalidate_group(uid)
+        if self._slug_cache is not None:
+            # Projects and tasks are removed by 'ON DELETE CASCADE'.
+            self._slug_cache.invalidate_group(uid)
 
     async def select_group_uid_by_slug(self, slug: str) -> int:
-        return await self.column(int, SELECT_GROUP_UID_BY_SLUG, slug)
+        return await self._select_uid_by_slug(
+            lambda c: c.groups, SELECT_GROUP_UID_BY_SLUG, slug
+        )
 
     async def select_group_slug_by_uid(self, uid: int) -> str:
-        return await self.column(str, SELECT_GROUP_SLUG_BY_UID, uid)
+        return await self._select_slug_by_uid(
+            lambda c: c.groups, SELECT_GROUP_SLUG_BY_UID, uid
+        )
 
     async def select_group_by_uid(self, uid: int) -> Group:
         return await self.row(Group, SELECT_GROUP_BY_UID, uid)
 
+    async def select_groups_by_uids(self, uids: Iterable[int]) -> Dict[int, Group]:
+        return await self.rows_by_uid(Group, SELECT_GROUP_BY_UIDS, uids)
+
     async def select_groups_by_below_visibility(self, visibility: int) -> List[Group]:
         return await self.rows(Group, SELECT_GROUP_BY_BELOW_VISIBILITY, visibility)
 
+    async def select_groups_by_feature(self, feature: str) -> List[Group]:
+        return await self.rows(Group, SELECT_GROUP_BY_FEATURES_ALL, [feature])
+
+    async def select_groups_by_features_all(
+        self, features: Iterable[str]
+    ) -> List[Group]:
+        """
+        The groups having every one of the features.
+        """
+        return await self.rows(Group, SELECT_GROUP_BY_FEATURES_ALL, list(features))
+
+    async def select_groups_by_features_any(
+        self, features: Iterable[str]
+    ) -> List[Group]:
+        """
+        The groups having at least one of the features.
+        """
+        return await self.rows(Group, SELECT_GROUP_BY_FEATURES_ANY, list(features))
+
+    async def select_groups_by_extra_contains(self, extra: Any) -> List[Group]:
+        """
+        The groups whose extra document contains the given one, e.g. `{"gpu": True}`.
+        """
+        return await self.rows(Group, SELECT_GROUP_BY_EXTRA_CONTAINS, extra)
+
     async def select_groups(self) -> List[Group]:
         return await self.rows(Group, SELECT_GROUP_ALL)
 
+    async def select_groups_page(
+        self, after_uid=0, limit=DATABASE_PAGE_LIMIT
+    ) -> List[Group]:
+        return await self.rows(Group, SELECT_GROUP_PAGE, after_uid, limit)
+
+    def stream_groups(self) -> AsyncIterator[Group]:
+        return self.stream(Group, SELECT_GROUP_ALL)
+
     async def select_groups_count(self) -> int:
         return await self.column(int, SELECT_GROUP_COUNT)
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 
-from typing import List
+from typing import AsyncIterator, Iterable, List, Tuple
 
 from recc_database.database.mixin._pg_base import PgBase
 from recc_database.database.query.group_member import (
+    COPY_GROUP_MEMBER_COLUMNS,
     DELETE_GROUP_MEMBER,
     INSERT_GROUP_MEMBER,
     SELECT_GROUP_MEMBER_ALL,
@@ -13,6 +14,7 @@ from recc_database.database.query.group_member import (
     SELECT_GROUP_MEMBER_JOIN_GROUP_BY_USER_UID,
     SELECT_GROUP_MEMBER_JOIN_GROUP_BY_USER_UID_AND_GROUP_UID,
     SELECT_GROUP_MEMBER_JOIN_PROJECT_BY_USER_UID,
+    SELECT_GROUP_MEMBER_PAGE,
     UPDATE_GROUP_MEMBER_ROLE,
 )
 from recc_database.packet.group_join_member import (
@@ -20,6 +22,7 @@ from recc_database.packet.group_join_member import (
     ProjectJoinGroupMember,
 )
 from recc_database.packet.group_member import GroupMember
+from recc_database.variables.database import DATABASE_PAGE_LIMIT, TABLE_GROUP_MEMBER
 
 
 class PgGroupMember(PgBase):
@@ -27,14 +30,35 @@ class PgGroupMember(PgBase):
         self, group_uid: int, user_uid: int, role_uid: int
     ) -> None:
         await self.execute(INSERT_GROUP_MEMBER, group_uid, user_uid, role_uid)
+        if self._permission_cache is not None:
+            self._permission_cache.invalidate_group_member(group_uid, user_uid)
+
+    async def insert_group_members(
+        self, members: Iterable[Tuple[int, int, int]]
+    ) -> None:
+        """
+        :param members: The `(group_uid, user_uid, role_uid)` of each member.
+        """
+
+        records = list(members)
+        if not records:
+            return
+        await self.copy_records(TABLE_GROUP_MEMBER, COPY_GROUP_MEMBER_COLUMNS, records)
+        if self._permission_cache is not None:
+            for group_uid, user_uid, _ in records:
+                self._permission_cache.invalidate_group_member(group_uid, user_uid)
 
     async def update_group_member_role(
         self, group_uid: int, user_uid: int, role_uid: int
     ) -> None:
         await self.execute(UPDATE_GROUP_MEMBER_ROLE, group_uid, user_uid, role_uid)
+        if self._permission_cache is not None:
+            self._permission_cache.invalidate_group_member(group_uid, user_uid)
 
     async def delete_group_member(self, group_uid: int, user_uid: int) -> None:
         await self.execute(DELETE_GROUP_MEMBER, group_uid, user_uid)
+        if self._permission_cache is not None:
+            self._permission_cache.invalidate_group_member(group_uid, user_uid)
 
     async def select_group_member(self, group_uid: int, user_uid: int) -> GroupMember:
         return await self.row(
@@ -57,6 +81,20 @@ class PgGroupMember(PgBase):
     async def select_group_members(self) -> List[GroupMember]:
         return await self.rows(GroupMember, SELECT_GROUP_MEMBER_ALL)
 
+    async def select_group_members_page(
+        self, after_group_uid=0, after_user_uid=0, limit=DATABASE_PAGE_LIMIT
+    ) -> List[GroupMember]:
+        return await self.rows(
+            GroupMember,
+            SELECT_GROUP_MEMBER_PAGE,
+            after_group_uid,
+            after_user_uid,
+            limit,
+        )
+
+    def stream_group_members(self) -> AsyncIterator[GroupMember]:
+        return self.stream(GroupMember, SELECT_GROUP_MEMBER_ALL)
+
     async def select_group_members_join_group_by_user_uid(
         self, user_uid: int
     ) -> List[GroupJoinGroupMember]:
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from asyncpg.exceptions import UniqueViolationError
 
 from recc_database.chrono.datetime import tznow
+from recc_database.database.cache.info_cache import InfoSnapshot
 from recc_database.database.mixin._pg_base import PgBase
 from recc_database.database.query.info import (
     DELETE_INFO_BY_KEY,
@@ -15,13 +16,51 @@ from recc_database.database.query.info import (
     SELECT_INFO_BY_KEY,
     SELECT_INFO_BY_KEY_LIKE,
     SELECT_INFO_DB_VERSION,
+    SELECT_INFO_PAGE,
+    SELECT_INFO_VERSION,
     UPDATE_INFO_VALUE_BY_KEY,
     UPSERT_INFO,
 )
 from recc_database.packet.info import Info
+from recc_database.variables.database import (
+    DATABASE_PAGE_LIMIT,
+    INFO_KEY_RECC_DB_VERSION,
+)
 
 
 class PgInfo(PgBase):
+    def _clear_info_cache(self) -> None:
+        if self._info_cache is not None:
+            self._info_cache.clear()
+
+    async def select_info_snapshot(self) -> Optional[InfoSnapshot]:
+        """
+        The whole table is loaded once and reloaded only when it was written
+        through this object, a change event arrived, or the version of the table,
+        which is checked once per ttl, differs from the snapshot.
+
+        :return: `None` if the info cache is disabled or inside a session.
+        """
+
+        cache = self._info_cache
+        if cache is None or self.in_session():
+            return None
+
+        generation = cache.generation
+        snapshot = cache.snapshot
+        if snapshot is not None:
+            if not cache.is_stale():
+                return snapshot
+            row = await self.fetch_first_row(SELECT_INFO_VERSION)
+            if row is not None and (row[0], row[1]) == snapshot.version:
+                if generation == cache.generation:
+                    cache.touch()
+                return snapshot
+
+        snapshot = InfoSnapshot(await self.rows(Info, SELECT_INFO_ALL))
+        cache.set(snapshot, generation)
+        return snapshot
+
     async def insert_info(
         self,
         key: str,
@@ -31,6 +70,7 @@ class PgInfo(PgBase):
         try:
             created = created_at if created_at else tznow()
             await self.execute(INSERT_INFO, key, value, created)
+            self._clear_info_cache()
         except UniqueViolationError:
             raise KeyError(f"The `{key}` key already exists")
 
@@ -42,6 +82,7 @@ class PgInfo(PgBase):
     ) -> None:
         updated = updated_at if updated_at else tznow()
         await self.execute(UPDATE_INFO_VALUE_BY_KEY, key, value, updated)
+        self._clear_info_cache()
 
     async def upsert_info(
         self,
@@ -51,21 +92,52 @@ class PgInfo(PgBase):
     ) -> None:
         created_or_updated = created_or_updated_at if created_or_updated_at else tznow()
         await self.execute(UPSERT_INFO, key, value, created_or_updated)
+        self._clear_info_cache()
 
     async def delete_info_by_key(self, key: str) -> None:
         await self.execute(DELETE_INFO_BY_KEY, key)
+        self._clear_info_cache()
 
     async def exists_info_by_key(self, key: str) -> bool:
+        snapshot = await self.select_info_snapshot()
+        if snapshot is not None:
+            return snapshot.exists(key)
         return await self.column(bool, EXISTS_INFO_BY_KEY, key)
 
     async def select_info_by_key(self, key: str) -> Info:
-        return await self.row(Info, SELECT_INFO_BY_KEY, key)
+        snapshot = await self.select_info_snapshot()
+        if snapshot is None:
+            return await self.row(Info, SELECT_INFO_BY_KEY, key)
+        info = snapshot.get(key)
+        if info is None:
+            raise LookupError("The query result does not exist")
+        return info
 
     async def select_infos_like(self, like: str) -> List[Info]:
+        snapshot = await self.select_info_snapshot()
+        if snapshot is not None:
+            return snapshot.like(like)
         return await self.rows(Info, SELECT_INFO_BY_KEY_LIKE, like)
 
     async def select_infos(self) -> List[Info]:
+        snapshot = await self.select_info_snapshot()
+        if snapshot is not None:
+            return snapshot.like("%")
         return await self.rows(Info, SELECT_INFO_ALL)
 
+    async def select_infos_page(
+        self, after_key="", limit=DATABASE_PAGE_LIMIT
+    ) -> List[Info]:
+        return await self.rows(Info, SELECT_INFO_PAGE, after_key, limit)
+
+    def stream_infos(self) -> AsyncIterator[Info]:
+        return self.stream(Info, SELECT_INFO_ALL)
+
     async def select_database_version(self) -> str:
-        return await self.column(str, SELECT_INFO_DB_VERSION)
+        snapshot = await self.select_info_snapshot()
+        if snapshot is None:
+            return await self.column(str, SELECT_INFO_DB_VERSION)
+        info = snapshot.get(INFO_KEY_RECC_DB_VERSION)
+        if info is None:
+            raise LookupError("The query result does not exist")
+        return info.value
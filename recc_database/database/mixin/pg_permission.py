@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 from recc_database.chrono.datetime import tznow
 from recc_database.database.mixin._pg_base import PgBase
 from recc_database.database.query.create.functions.appropriate_permission import (
-    get_select_appropriate_permission_by_user_and_group,
-    get_select_appropriate_permission_by_user_and_group_and_project,
+    SELECT_APPROPRIATE_PERMISSION_BY_USER_AND_GROUP,
+    SELECT_APPROPRIATE_PERMISSION_BY_USER_AND_GROUP_AND_PROJECT,
+    SELECT_APPROPRIATE_PERMISSIONS_BY_USER_AND_PAIRS,
 )
 from recc_database.database.query.permission import (
     DELETE_PERMISSION_BY_UID,
@@ -16,10 +17,12 @@ from recc_database.database.query.permission import (
     SELECT_PERMISSION_BY_ROLE_UID,
     SELECT_PERMISSION_BY_SLUG,
     SELECT_PERMISSION_BY_UID,
+    SELECT_PERMISSION_PAGE,
     SELECT_PERMISSION_SLUG_BY_UID,
     SELECT_PERMISSION_UID_BY_SLUG,
 )
 from recc_database.packet.permission import Permission
+from recc_database.variables.database import DATABASE_PAGE_LIMIT
 
 
 class PgPermission(PgBase):
@@ -29,16 +32,26 @@ class PgPermission(PgBase):
         created_at: Optional[datetime] = None,
     ) -> int:
         created = created_at if created_at else tznow()
-        return await self.column(int, INSERT_PERMISSION, slug, created)
+        uid = await self.column(int, INSERT_PERMISSION, slug, created)
+        # Administrators are granted every permission, even new ones.
+        await self._clear_permission_cache()
+        return uid
 
     async def delete_permission(self, uid: int) -> None:
         await self.execute(DELETE_PERMISSION_BY_UID, uid)
+        await self._clear_permission_cache()
+        if self._slug_cache is not None:
+            self._slug_cache.invalidate_permission(uid)
 
     async def select_permission_uid_by_slug(self, slug: str) -> int:
-        return await self.column(int, SELECT_PERMISSION_UID_BY_SLUG, slug)
+        return await self._select_uid_by_slug(
+            lambda c: c.permissions, SELECT_PERMISSION_UID_BY_SLUG, slug
+        )
 
     async def select_permission_slug_by_uid(self, uid: int) -> str:
-        return await self.column(str, SELECT_PERMISSION_SLUG_BY_UID, uid)
+        return await self._select_slug_by_uid(
+            lambda c: c.permissions, SELECT_PERMISSION_SLUG_BY_UID, uid
+        )
 
     async def select_permission_by_slug(self, slug: str) -> Permission:
         return await self.row(Permission, SELECT_PERMISSION_BY_SLUG, slug)
@@ -49,19 +62,100 @@ class PgPermission(PgBase):
     async def select_permission_all(self) -> List[Permission]:
         return await self.rows(Permission, SELECT_PERMISSION_ALL)
 
+    async def select_permission_page(
+        self, after_uid=0, limit=DATABASE_PAGE_LIMIT
+    ) -> List[Permission]:
+        return await self.rows(Permission, SELECT_PERMISSION_PAGE, after_uid, limit)
+
+    def stream_permission_all(self) -> AsyncIterator[Permission]:
+        return self.stream(Permission, SELECT_PERMISSION_ALL)
+
     async def select_permission_by_role_uid(self, role_uid: int) -> List[Permission]:
         return await self.rows(Permission, SELECT_PERMISSION_BY_ROLE_UID, role_uid)
 
+    async def _select_appropriate_permission(
+        self,
+        user_uid: int,
+        group_uid: int,
+        project_uid: Optional[int] = None,
+    ) -> List[Permission]:
+        args: Tuple[int, ...]
+        if project_uid is None:
+            query = SELECT_APPROPRIATE_PERMISSION_BY_USER_AND_GROUP
+            args = (user_uid, group_uid)
+        else:
+            query = SELECT_APPROPRIATE_PERMISSION_BY_USER_AND_GROUP_AND_PROJECT
+            args = (user_uid, group_uid, project_uid)
+
+        cache = self._permission_cache
+        if cache is None:
+            return await self.rows(Permission, query, *args)
+
+        cached = cache.get(user_uid, group_uid, project_uid)
+        if cached is not None:
+            return cached
+
+        generation = cache.generation
+        result = await self.rows(Permission, query, *args)
+        if not self.in_session():
+            # The transaction of a session may still roll back the grant.
+            cache.set(result, user_uid, group_uid, project_uid, generation)
+        return result
+
     async def select_appropriate_permission_by_user_and_group(
         self, user_uid: int, group_uid: int
     ) -> List[Permission]:
-        query = get_select_appropriate_permission_by_user_and_group(user_uid, group_uid)
-        return await self.rows(Permission, query)
+        return await self._select_appropriate_permission(user_uid, group_uid)
 
     async def select_appropriate_permission_by_user_and_group_and_project(
         self, user_uid: int, group_uid: int, project_uid: int
     ) -> List[Permission]:
-        query = get_select_appropriate_permission_by_user_and_group_and_project(
+        return await self._select_appropriate_permission(
             user_uid, group_uid, project_uid
         )
-        return await self.rows(Permission, query)
+
+    async def select_appropriate_permission_slugs_by_user_and_pairs(
+        self,
+        user_uid: int,
+        pairs: Iterable[Tuple[int, Optional[int]]],
+    ) -> Dict[Tuple[int, Optional[int]], List[str]]:
+        """
+        Resolve the permissions of many groups and projects in a single query.
+
+        :param pairs: The `(group_uid, project_uid)` to check. A `None` project
+            resolves the group permissions only.
+        :return: The permission slugs of each pair, in uid order.
+        """
+
+        cache = self._permission_cache
+        result: Dict[Tuple[int, Optional[int]], List[Permission]] = dict()
+        missing: List[Tuple[int, Optional[int]]] = list()
+        for group_uid, project_uid in pairs:
+            key = group_uid, project_uid
+            if key in result:
+                continue
+            cached = cache.get(user_uid, *key) if cache is not None else None
+            if cached is not None:
+                result[key] = cached
+            else:
+                result[key] = list()
+                missing.append(key)
+
+        if missing:
+            generation = cache.generation if cache is not None else None
+            group_uids = [g for g, _ in missing]
+            project_uids = [p for _, p in missing]
+            records = await self.fetch_rows(
+                SELECT_APPROPRIATE_PERMISSIONS_BY_USER_AND_PAIRS,
+                user_uid,
+                group_uids,
+                project_uids,
+            )
+            for r in records:
+                permission = Permission(r["uid"], r["slug"], r["created_at"])
+                result[r["group_uid"], r["project_uid"]].append(permission)
+            if cache is not None and not self.in_session():
+                for key in missing:
+                    cache.set(result[key], user_uid, *key, generation=generation)
+
+        return {k: [p.slug for p in v if p.slug] for k, v in result.items()}
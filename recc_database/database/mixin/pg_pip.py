@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from typing import List
+from typing import AsyncIterator, List
 
 from recc_database.database.mixin._pg_base import PgBase
 from recc_database.database.query.pip import (
@@ -31,3 +31,6 @@ class PgPip(PgBase):
 
     async def select_pip_all(self) -> List[Pip]:
         return await self.rows(Pip, SELECT_PIP_ALL)
+
+    def stream_pip_all(self) -> AsyncIterator[Pip]:
+        return self.stream(Pip, SELECT_PIP_ALL)
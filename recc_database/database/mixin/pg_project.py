@@ -1,24 +1,75 @@
 # -*- coding: utf-8 -*-
 
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from recc_database.chrono.datetime import tznow
 from recc_database.database.mixin._pg_base import PgBase
+from recc_database.database.query.create.project_access import REFRESH_PROJECT_ACCESS
+from recc_database.database.query.jsonb import JsonbPath, jsonb_path
 from recc_database.database.query.project import (
+    COPY_PROJECT_COLUMNS,
     DELETE_PROJECT_BY_UID,
+    DELETE_PROJECT_EXTRA_PATH_BY_UID,
+    INCREMENT_PROJECT_EXTRA_PATH_BY_UID,
     INSERT_PROJECT,
+    MERGE_PROJECT_EXTRA_BY_UID,
     SELECT_PROJECT_ALL,
     SELECT_PROJECT_BY_BELOW_VISIBILITY,
+    SELECT_PROJECT_BY_EXTRA_CONTAINS,
+    SELECT_PROJECT_BY_FEATURES_ALL,
+    SELECT_PROJECT_BY_FEATURES_ANY,
     SELECT_PROJECT_BY_GROUP_ID,
     SELECT_PROJECT_BY_UID,
+    SELECT_PROJECT_BY_UIDS,
     SELECT_PROJECT_BY_USER_UID,
+    SELECT_PROJECT_BY_USER_UID_FROM_ACCESS,
     SELECT_PROJECT_COUNT,
+    SELECT_PROJECT_PAGE,
     SELECT_PROJECT_UID_BY_GROUP_UID_AND_SLUG,
+    SET_PROJECT_EXTRA_PATH_BY_UID,
     get_update_project_query_by_uid,
 )
 from recc_database.packet.project import Project
-from recc_database.variables.database import VISIBILITY_LEVEL_PRIVATE
+from recc_database.variables.database import (
+    DATABASE_PAGE_LIMIT,
+    TABLE_PROJECT,
+    VISIBILITY_LEVEL_PRIVATE,
+)
+
+
+def _project_record(
+    group_uid: int,
+    slug: str,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    features: Optional[List[str]] = None,
+    visibility=VISIBILITY_LEVEL_PRIVATE,
+    extra: Optional[Any] = None,
+    created_at: Optional[datetime] = None,
+) -> Tuple[Any, ...]:
+    created = created_at if created_at else tznow()
+    return (
+        group_uid,
+        slug,
+        name,
+        description,
+        features,
+        visibility,
+        extra,
+        created,
+        created,
+    )
 
 
 class PgProject(PgBase):
@@ -33,10 +84,7 @@ class PgProject(PgBase):
         extra: Optional[Any] = None,
         created_at: Optional[datetime] = None,
     ) -> int:
-        created = created_at if created_at else tznow()
-        return await self.column(
-            int,
-            INSERT_PROJECT,
+        record = _project_record(
             group_uid,
             slug,
             name,
@@ -44,7 +92,20 @@ class PgProject(PgBase):
             features,
             visibility,
             extra,
-            created,
+            created_at,
+        )
+        return await self.column(int, INSERT_PROJECT, *record)
+
+    async def insert_projects(self, projects: Iterable[Mapping[str, Any]]) -> List[int]:
+        """
+        :param projects: The keyword arguments of :meth:`insert_project`
+            for each project.
+        :return: The uids in the order of the projects.
+        """
+
+        records = [_project_record(**project) for project in projects]
+        return await self.copy_records_returning_uids(
+            TABLE_PROJECT, COPY_PROJECT_COLUMNS, records
         )
 
     async def update_project_by_uid(
@@ -70,23 +131,94 @@ class PgProject(PgBase):
             updated_at=updated,
         )
         await self.execute(query, *args)
+        if slug is not None and uid is not None and self._slug_cache is not None:
+            self._slug_cache.invalidate_project(uid)
+
+    async def merge_project_extra_by_uid(
+        self,
+        uid: int,
+        extra: Mapping[str, Any],
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        await self.execute(MERGE_PROJECT_EXTRA_BY_UID, uid, extra, updated)
+
+    async def update_project_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        value: Any,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        await self.execute(SET_PROJECT_EXTRA_PATH_BY_UID, uid, keys, value, updated)
+
+    async def delete_project_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        await self.execute(DELETE_PROJECT_EXTRA_PATH_BY_UID, uid, keys, updated)
+
+    async def increment_project_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        delta: Union[int, float] = 1,
+        updated_at: Optional[datetime] = None,
+    ) -> Union[int, float]:
+        """
+        :return: The number at the path after the increment.
+        :raise LookupError: If the project or the parent of the path does not exist.
+        """
+
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        result = await self.fetch_first_row_column(
+            INCREMENT_PROJECT_EXTRA_PATH_BY_UID, uid, keys, delta, updated
+        )
+        if result is None:
+            raise LookupError("The query result does not exist")
+        return result
 
     async def delete_project_by_uid(self, uid: int) -> None:
         await self.execute(DELETE_PROJECT_BY_UID, uid)
+        if self._permission_cache is not None:
+            self._permission_cache.invalidate_project(uid)
+        if self._slug_cache is not None:
+            # Tasks are removed by 'ON DELETE CASCADE'.
+            self._slug_cache.invalidate_project(uid)
 
     async def select_project_uid_by_group_uid_and_slug(
         self, group_uid: int, slug: str
     ) -> int:
-        return await self.column(
+        cache = self._slug_cache
+        if cache is not None:
+            uid = cache.projects.get_uid((group_uid, slug))
+            if uid is not None:
+                return uid
+            generation = cache.generation
+
+        uid = await self.column(
             int,
             SELECT_PROJECT_UID_BY_GROUP_UID_AND_SLUG,
             group_uid,
             slug,
         )
+        if cache is not None and not self.in_session():
+            cache.set(cache.projects, (group_uid, slug), (uid, group_uid), generation)
+        return uid
 
     async def select_project_by_uid(self, uid: int) -> Project:
         return await self.row(Project, SELECT_PROJECT_BY_UID, uid)
 
+    async def select_projects_by_uids(self, uids: Iterable[int]) -> Dict[int, Project]:
+        return await self.rows_by_uid(Project, SELECT_PROJECT_BY_UIDS, uids)
+
     async def select_projects_by_group_uid(self, group_uid: int) -> List[Project]:
         return await self.rows(Project, SELECT_PROJECT_BY_GROUP_ID, group_uid)
 
@@ -95,11 +227,45 @@ class PgProject(PgBase):
     ) -> List[Project]:
         return await self.rows(Project, SELECT_PROJECT_BY_BELOW_VISIBILITY, visibility)
 
+    async def select_projects_by_feature(self, feature: str) -> List[Project]:
+        return await self.rows(Project, SELECT_PROJECT_BY_FEATURES_ALL, [feature])
+
+    async def select_projects_by_features_all(
+        self, features: Iterable[str]
+    ) -> List[Project]:
+        return await self.rows(Project, SELECT_PROJECT_BY_FEATURES_ALL, list(features))
+
+    async def select_projects_by_features_any(
+        self, features: Iterable[str]
+    ) -> List[Project]:
+        return await self.rows(Project, SELECT_PROJECT_BY_FEATURES_ANY, list(features))
+
+    async def select_projects_by_extra_contains(self, extra: Any) -> List[Project]:
+        return await self.rows(Project, SELECT_PROJECT_BY_EXTRA_CONTAINS, extra)
+
     async def select_projects(self) -> List[Project]:
         return await self.rows(Project, SELECT_PROJECT_ALL)
 
+    async def select_projects_page(
+        self, after_uid=0, limit=DATABASE_PAGE_LIMIT
+    ) -> List[Project]:
+        return await self.rows(Project, SELECT_PROJECT_PAGE, after_uid, limit)
+
+    def stream_projects(self) -> AsyncIterator[Project]:
+        return self.stream(Project, SELECT_PROJECT_ALL)
+
     async def select_projects_count(self) -> int:
         return await self.column(int, SELECT_PROJECT_COUNT)
 
     async def select_projects_by_user_uid(self, user_uid: int) -> List[Project]:
-        return await self.rows(Project, SELECT_PROJECT_BY_USER_UID, user_uid)
+        if self._project_access_table:
+            query = SELECT_PROJECT_BY_USER_UID_FROM_ACCESS
+        else:
+            query = SELECT_PROJECT_BY_USER_UID
+        return await self.rows(Project, query, user_uid)
+
+    async def refresh_project_access(self) -> None:
+        """
+        Rebuild the materialized access table from the member tables.
+        """
+        await self.execute(REFRESH_PROJECT_ACCESS)
@@ -1,18 +1,21 @@
 # -*- coding: utf-8 -*-
 
-from typing import List
+from typing import AsyncIterator, Iterable, List, Tuple
 
 from recc_database.database.mixin._pg_base import PgBase
 from recc_database.database.query.project_member import (
+    COPY_PROJECT_MEMBER_COLUMNS,
     DELETE_PROJECT_MEMBER,
     INSERT_PROJECT_MEMBER,
     SELECT_PROJECT_MEMBER_ALL,
     SELECT_PROJECT_MEMBER_BY_PROJECT_UID,
     SELECT_PROJECT_MEMBER_BY_PROJECT_UID_AND_USER_UID,
     SELECT_PROJECT_MEMBER_BY_USER_UID,
+    SELECT_PROJECT_MEMBER_PAGE,
     UPDATE_PROJECT_MEMBER_ROLE,
 )
 from recc_database.packet.project_member import ProjectMember
+from recc_database.variables.database import DATABASE_PAGE_LIMIT, TABLE_PROJECT_MEMBER
 
 
 class PgProjectMember(PgBase):
@@ -20,14 +23,37 @@ class PgProjectMember(PgBase):
         self, project_uid: int, user_uid: int, role_uid: int
     ) -> None:
         await self.execute(INSERT_PROJECT_MEMBER, project_uid, user_uid, role_uid)
+        if self._permission_cache is not None:
+            self._permission_cache.invalidate_project_member(project_uid, user_uid)
+
+    async def insert_project_members(
+        self, members: Iterable[Tuple[int, int, int]]
+    ) -> None:
+        """
+        :param members: The `(project_uid, user_uid, role_uid)` of each member.
+        """
+
+        records = list(members)
+        if not records:
+            return
+        await self.copy_records(
+            TABLE_PROJECT_MEMBER, COPY_PROJECT_MEMBER_COLUMNS, records
+        )
+        if self._permission_cache is not None:
+            for project_uid, user_uid, _ in records:
+                self._permission_cache.invalidate_project_member(project_uid, user_uid)
 
     async def update_project_member_role(
         self, project_uid: int, user_uid: int, role_uid: int
     ) -> None:
         await self.execute(UPDATE_PROJECT_MEMBER_ROLE, project_uid, user_uid, role_uid)
+        if self._permission_cache is not None:
+            self._permission_cache.invalidate_project_member(project_uid, user_uid)
 
     async def delete_project_member(self, project_uid: int, user_uid: int) -> None:
         await self.execute(DELETE_PROJECT_MEMBER, project_uid, user_uid)
+        if self._permission_cache is not None:
+            self._permission_cache.invalidate_project_member(project_uid, user_uid)
 
     async def select_project_member(
         self, project_uid: int, user_uid: int
@@ -59,3 +85,17 @@ class PgProjectMember(PgBase):
 
     async def select_project_members(self) -> List[ProjectMember]:
         return await self.rows(ProjectMember, SELECT_PROJECT_MEMBER_ALL)
+
+    async def select_project_members_page(
+        self, after_project_uid=0, after_user_uid=0, limit=DATABASE_PAGE_LIMIT
+    ) -> List[ProjectMember]:
+        return await self.rows(
+            ProjectMember,
+            SELECT_PROJECT_MEMBER_PAGE,
+            after_project_uid,
+            after_user_uid,
+            limit,
+        )
+
+    def stream_project_members(self) -> AsyncIterator[ProjectMember]:
+        return self.stream(ProjectMember, SELECT_PROJECT_MEMBER_ALL)
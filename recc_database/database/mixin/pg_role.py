@@ -1,23 +1,32 @@
 # -*- coding: utf-8 -*-
 
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Union
 
 from recc_database.chrono.datetime import tznow
 from recc_database.database.mixin._pg_base import PgBase
+from recc_database.database.query.jsonb import JsonbPath, jsonb_path
 from recc_database.database.query.role import (
     DELETE_ROLE_BY_UID,
+    DELETE_ROLE_EXTRA_PATH_BY_UID,
+    INCREMENT_ROLE_EXTRA_PATH_BY_UID,
     INSERT_ROLE,
+    MERGE_ROLE_EXTRA_BY_UID,
     SELECT_ROLE_ALL,
+    SELECT_ROLE_BY_EXTRA_CONTAINS,
     SELECT_ROLE_BY_UID,
     SELECT_ROLE_BY_USER_UID_AND_GROUP_UID,
     SELECT_ROLE_BY_USER_UID_AND_PROJECT_UID,
     SELECT_ROLE_LOCK_BY_UID,
+    SELECT_ROLE_PAGE,
     SELECT_ROLE_SLUG_BY_UID,
+    SELECT_ROLE_SLUG_BY_UIDS,
     SELECT_ROLE_UID_BY_SLUG,
+    SET_ROLE_EXTRA_PATH_BY_UID,
     get_update_role_query_by_uid,
 )
 from recc_database.packet.role import Role
+from recc_database.variables.database import DATABASE_PAGE_LIMIT
 
 
 class PgRole(PgBase):
@@ -66,15 +75,79 @@ class PgRole(PgBase):
             updated_at=updated_at,
         )
         await self.execute(query, *args)
+        if slug is not None and self._slug_cache is not None:
+            self._slug_cache.invalidate_role(uid)
+
+    async def merge_role_extra_by_uid(
+        self,
+        uid: int,
+        extra: Mapping[str, Any],
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        await self.execute(MERGE_ROLE_EXTRA_BY_UID, uid, extra, updated)
+
+    async def update_role_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        value: Any,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        await self.execute(SET_ROLE_EXTRA_PATH_BY_UID, uid, keys, value, updated)
+
+    async def delete_role_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        await self.execute(DELETE_ROLE_EXTRA_PATH_BY_UID, uid, keys, updated)
+
+    async def increment_role_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        delta: Union[int, float] = 1,
+        updated_at: Optional[datetime] = None,
+    ) -> Union[int, float]:
+        """
+        :return: The number at the path after the increment.
+        :raise LookupError: If the role or the parent of the path does not exist.
+        """
+
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        result = await self.fetch_first_row_column(
+            INCREMENT_ROLE_EXTRA_PATH_BY_UID, uid, keys, delta, updated
+        )
+        if result is None:
+            raise LookupError("The query result does not exist")
+        return result
 
     async def delete_role_by_uid(self, uid: int) -> None:
         await self.execute(DELETE_ROLE_BY_UID, uid)
+        # Members with this role are removed by 'ON DELETE CASCADE'.
+        await self._clear_permission_cache()
+        if self._slug_cache is not None:
+            self._slug_cache.invalidate_role(uid)
 
     async def select_role_uid_by_slug(self, slug: str) -> int:
-        return await self.column(int, SELECT_ROLE_UID_BY_SLUG, slug)
+        return await self._select_uid_by_slug(
+            lambda c: c.roles, SELECT_ROLE_UID_BY_SLUG, slug
+        )
 
     async def select_role_slug_by_uid(self, uid: int) -> str:
-        return await self.column(str, SELECT_ROLE_SLUG_BY_UID, uid)
+        return await self._select_slug_by_uid(
+            lambda c: c.roles, SELECT_ROLE_SLUG_BY_UID, uid
+        )
+
+    async def select_role_slugs_by_uids(self, uids: Iterable[int]) -> Dict[int, str]:
+        return await self.columns_by_uid(SELECT_ROLE_SLUG_BY_UIDS, uids)
 
     async def select_role_by_uid(self, uid: int) -> Role:
         return await self.row(Role, SELECT_ROLE_BY_UID, uid)
@@ -82,9 +155,20 @@ class PgRole(PgBase):
     async def select_role_lock_by_uid(self, uid: int) -> bool:
         return await self.column(bool, SELECT_ROLE_LOCK_BY_UID, uid)
 
+    async def select_roles_by_extra_contains(self, extra: Any) -> List[Role]:
+        return await self.rows(Role, SELECT_ROLE_BY_EXTRA_CONTAINS, extra)
+
     async def select_role_all(self) -> List[Role]:
         return await self.rows(Role, SELECT_ROLE_ALL)
 
+    async def select_role_page(
+        self, after_uid=0, limit=DATABASE_PAGE_LIMIT
+    ) -> List[Role]:
+        return await self.rows(Role, SELECT_ROLE_PAGE, after_uid, limit)
+
+    def stream_role_all(self) -> AsyncIterator[Role]:
+        return self.stream(Role, SELECT_ROLE_ALL)
+
     async def select_role_by_user_uid_and_group_uid(
         self, user_uid: int, group_uid: int
     ) -> Role:
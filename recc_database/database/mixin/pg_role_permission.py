@@ -1,16 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from io import StringIO
-from typing import List
+from typing import List, Optional
 
+from recc_database.database.cache.permission_matrix import PermissionMatrix
 from recc_database.database.mixin._pg_base import PgBase
 from recc_database.database.query.role_permission import (
     DELETE_ROLE_PERMISSION,
     INSERT_ROLE_PERMISSION,
+    SAFE_INSERT_ROLE_PERMISSION_BY_ROLE_UID_AND_PERMISSION_SLUGS,
     SELECT_ROLE_PERMISSION_ALL,
     SELECT_ROLE_PERMISSION_BY_ROLE_UID,
-    delete_role_permission_by_role_uid,
-    safe_insert_role_permission_by_slug,
+    UPDATE_ROLE_PERMISSION_BY_ROLE_UID_AND_PERMISSION_SLUGS,
 )
 from recc_database.packet.role_permission import RolePermission
 
@@ -18,26 +18,31 @@ from recc_database.packet.role_permission import RolePermission
 class PgRolePermission(PgBase):
     async def insert_role_permission(self, role_uid: int, permission_uid: int) -> None:
         await self.execute(INSERT_ROLE_PERMISSION, role_uid, permission_uid)
+        await self._clear_permission_cache()
 
     async def insert_role_permissions_by_slug(
         self, role_uid: int, permission_slugs: List[str]
     ) -> None:
-        buffer = StringIO()
-        for slug in permission_slugs:
-            buffer.write(safe_insert_role_permission_by_slug(role_uid, slug))
-        await self.execute(buffer.getvalue())
+        await self.execute(
+            SAFE_INSERT_ROLE_PERMISSION_BY_ROLE_UID_AND_PERMISSION_SLUGS,
+            role_uid,
+            permission_slugs,
+        )
+        await self._clear_permission_cache()
 
     async def delete_role_permission(self, role_uid: int, permission_uid: int) -> None:
         await self.execute(DELETE_ROLE_PERMISSION, role_uid, permission_uid)
+        await self._clear_permission_cache()
 
     async def update_role_permissions_by_slug(
         self, role_uid: int, permission_slugs: List[str]
     ) -> None:
-        buffer = StringIO()
-        buffer.write(delete_role_permission_by_role_uid(role_uid))
-        for slug in permission_slugs:
-            buffer.write(safe_insert_role_permission_by_slug(role_uid, slug))
-        await self.execute(buffer.getvalue())
+        await self.execute(
+            UPDATE_ROLE_PERMISSION_BY_ROLE_UID_AND_PERMISSION_SLUGS,
+            role_uid,
+            permission_slugs,
+        )
+        await self._clear_permission_cache()
 
     async def select_role_permission_all(self) -> List[RolePermission]:
         return await self.rows(RolePermission, SELECT_ROLE_PERMISSION_ALL)
@@ -50,3 +55,19 @@ class PgRolePermission(PgBase):
             SELECT_ROLE_PERMISSION_BY_ROLE_UID,
             role_uid,
         )
+
+    @property
+    def permission_matrix(self) -> Optional[PermissionMatrix]:
+        """
+        The loaded matrix, or `None` if it was invalidated since.
+        """
+        cache = self._permission_matrix
+        return cache.matrix if cache is not None else None
+
+    async def select_permission_matrix(self) -> PermissionMatrix:
+        """
+        The matrix is loaded once and kept until a role, permission or grant
+        changes, so the checks against it need no database access.
+        """
+
+        return await self._select_permission_matrix()
@@ -1,20 +1,33 @@
 # -*- coding: utf-8 -*-
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from recc_database.chrono.datetime import tznow
 from recc_database.database.mixin._pg_base import PgBase
+from recc_database.database.query.jsonb import JsonbPath, jsonb_path
 from recc_database.database.query.task import (
+    COPY_TASK_COLUMNS,
     DELETE_TASK_BY_PROJECT_UID_AND_SLUG,
     DELETE_TASK_BY_UID,
+    DELETE_TASK_EXTRA_PATH_BY_UID,
+    DELETE_TASK_PUBLISH_PORTS_PATH_BY_UID,
+    INCREMENT_TASK_EXTRA_PATH_BY_UID,
+    INCREMENT_TASK_PUBLISH_PORTS_PATH_BY_UID,
     INSERT_TASK,
+    MERGE_TASK_EXTRA_BY_UID,
+    MERGE_TASK_PUBLISH_PORTS_BY_UID,
+    SELECT_TASK_BY_EXTRA_CONTAINS,
     SELECT_TASK_BY_FULLPATH,
     SELECT_TASK_BY_PROJECT_ID,
     SELECT_TASK_BY_PROJECT_ID_AND_SLUG,
     SELECT_TASK_BY_UID,
+    SELECT_TASK_BY_UIDS,
+    SELECT_TASK_PATH_UIDS_BY_FULLPATH,
     SELECT_TASK_UID_BY_FULLPATH,
     SELECT_TASK_UID_BY_PROJECT_ID_AND_SLUG,
+    SET_TASK_EXTRA_PATH_BY_UID,
+    SET_TASK_PUBLISH_PORTS_PATH_BY_UID,
     UPDATE_TASK_DESCRIPTION_BY_PROJECT_UID_AND_SLUG,
     UPDATE_TASK_DESCRIPTION_BY_UID,
     UPDATE_TASK_EXTRA_BY_PROJECT_UID_AND_SLUG,
@@ -24,6 +37,43 @@ from recc_database.database.query.task import (
     get_update_task_query_by_uid,
 )
 from recc_database.packet.task import Task
+from recc_database.variables.database import TABLE_TASK
+
+
+def _task_record(
+    project_uid: int,
+    slug: str,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    extra: Optional[Any] = None,
+    rpc_address: Optional[str] = None,
+    auth_algorithm: Optional[str] = None,
+    private_key: Optional[str] = None,
+    public_key: Optional[str] = None,
+    maximum_restart_count: Optional[int] = None,
+    numa_memory_nodes: Optional[str] = None,
+    base_image_name: Optional[str] = None,
+    publish_ports: Optional[Dict[str, Any]] = None,
+    created_at: Optional[datetime] = None,
+) -> Tuple[Any, ...]:
+    created = created_at if created_at else tznow()
+    return (
+        project_uid,
+        slug,
+        name,
+        description,
+        extra,
+        rpc_address,
+        auth_algorithm,
+        private_key,
+        public_key,
+        maximum_restart_count,
+        numa_memory_nodes,
+        base_image_name,
+        publish_ports,
+        created,
+        created,
+    )
 
 
 class PgTask(PgBase):
@@ -44,10 +94,7 @@ class PgTask(PgBase):
         publish_ports: Optional[Dict[str, Any]] = None,
         created_at: Optional[datetime] = None,
     ) -> int:
-        created = created_at if created_at else tznow()
-        return await self.column(
-            int,
-            INSERT_TASK,
+        record = _task_record(
             project_uid,
             slug,
             name,
@@ -61,7 +108,19 @@ class PgTask(PgBase):
             numa_memory_nodes,
             base_image_name,
             publish_ports,
-            created,
+            created_at,
+        )
+        return await self.column(int, INSERT_TASK, *record)
+
+    async def insert_tasks(self, tasks: Iterable[Mapping[str, Any]]) -> List[int]:
+        """
+        :param tasks: The keyword arguments of :meth:`insert_task` for each task.
+        :return: The uids in the order of the tasks.
+        """
+
+        records = [_task_record(**task) for task in tasks]
+        return await self.copy_records_returning_uids(
+            TABLE_TASK, COPY_TASK_COLUMNS, records
         )
 
     async def update_task_description_by_uid(
@@ -114,6 +173,110 @@ class PgTask(PgBase):
             updated,
         )
 
+    async def merge_task_extra_by_uid(
+        self,
+        uid: int,
+        extra: Mapping[str, Any],
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        await self.execute(MERGE_TASK_EXTRA_BY_UID, uid, extra, updated)
+
+    async def update_task_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        value: Any,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        await self.execute(SET_TASK_EXTRA_PATH_BY_UID, uid, keys, value, updated)
+
+    async def delete_task_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        await self.execute(DELETE_TASK_EXTRA_PATH_BY_UID, uid, keys, updated)
+
+    async def increment_task_extra_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        delta: Union[int, float] = 1,
+        updated_at: Optional[datetime] = None,
+    ) -> Union[int, float]:
+        """
+        :return: The number at the path after the increment.
+        :raise LookupError: If the task or the parent of the path does not exist.
+        """
+
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        result = await self.fetch_first_row_column(
+            INCREMENT_TASK_EXTRA_PATH_BY_UID, uid, keys, delta, updated
+        )
+        if result is None:
+            raise LookupError("The query result does not exist")
+        return result
+
+    async def merge_task_publish_ports_by_uid(
+        self,
+        uid: int,
+        publish_ports: Mapping[str, Any],
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        await self.execute(MERGE_TASK_PUBLISH_PORTS_BY_UID, uid, publish_ports, updated)
+
+    async def update_task_publish_ports_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        value: Any,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        await self.execute(
+            SET_TASK_PUBLISH_PORTS_PATH_BY_UID, uid, keys, value, updated
+        )
+
+    async def delete_task_publish_ports_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        await self.execute(DELETE_TASK_PUBLISH_PORTS_PATH_BY_UID, uid, keys, updated)
+
+    async def increment_task_publish_ports_path_by_uid(
+        self,
+        uid: int,
+        path: JsonbPath,
+        delta: Union[int, float] = 1,
+        updated_at: Optional[datetime] = None,
+    ) -> Union[int, float]:
+        """
+        :return: The number at the path after the increment.
+        :raise LookupError: If the task or the parent of the path does not exist.
+        """
+
+        updated = updated_at if updated_at else tznow()
+        keys = jsonb_path(path)
+        result = await self.fetch_first_row_column(
+            INCREMENT_TASK_PUBLISH_PORTS_PATH_BY_UID, uid, keys, delta, updated
+        )
+        if result is None:
+            raise LookupError("The query result does not exist")
+        return result
+
     async def update_task_keys_by_uid(
         self,
         uid: int,
@@ -187,16 +350,25 @@ class PgTask(PgBase):
             updated_at=updated,
         )
         await self.execute(query, *args)
+        if slug is not None and self._slug_cache is not None:
+            self._slug_cache.invalidate_task(uid)
 
     async def delete_task_by_uid(self, uid: int) -> None:
         await self.execute(DELETE_TASK_BY_UID, uid)
+        if self._slug_cache is not None:
+            self._slug_cache.invalidate_task(uid)
 
     async def delete_task_by_slug(self, project_uid: int, slug: str) -> None:
         await self.execute(DELETE_TASK_BY_PROJECT_UID_AND_SLUG, project_uid, slug)
+        if self._slug_cache is not None:
+            self._slug_cache.invalidate_task_by_slug(project_uid, slug)
 
     async def select_task_by_uid(self, uid: int) -> Task:
         return await self.row(Task, SELECT_TASK_BY_UID, uid)
 
+    async def select_tasks_by_uids(self, uids: Iterable[int]) -> Dict[int, Task]:
+        return await self.rows_by_uid(Task, SELECT_TASK_BY_UIDS, uids)
+
     async def select_task_by_slug(self, project_uid: int, slug: str) -> Task:
         return await self.row(
             Task,
@@ -216,6 +388,9 @@ class PgTask(PgBase):
     async def select_task_by_project_uid(self, project_uid: int) -> List[Task]:
         return await self.rows(Task, SELECT_TASK_BY_PROJECT_ID, project_uid)
 
+    async def select_tasks_by_extra_contains(self, extra: Any) -> List[Task]:
+        return await self.rows(Task, SELECT_TASK_BY_EXTRA_CONTAINS, extra)
+
     async def select_task_by_fullpath(
         self, group_slug: str, project_slug: str, task_slug: str
     ) -> Task:
@@ -230,10 +405,28 @@ class PgTask(PgBase):
     async def select_task_uid_by_fullpath(
         self, group_slug: str, project_slug: str, task_slug: str
     ) -> int:
-        return await self.column(
-            int,
-            SELECT_TASK_UID_BY_FULLPATH,
-            group_slug,
-            project_slug,
-            task_slug,
-        )
+        cache = self._slug_cache
+        if cache is None:
+            return await self.column(
+                int,
+                SELECT_TASK_UID_BY_FULLPATH,
+                group_slug,
+                project_slug,
+                task_slug,
+            )
+
+        key = group_slug, project_slug, task_slug
+        uid = cache.tasks.get_uid(key)
+        if uid is not None:
+            return uid
+
+        generation = cache.generation
+        # The parent uids are kept to invalidate the entry by cascade.
+        row = await self.fetch_first_row(SELECT_TASK_PATH_UIDS_BY_FULLPATH, *key)
+        if row is None:
+            raise LookupError("The query result does not exist")
+        uid = row["uid"]
+        if not self.in_session():
+            entry = uid, row["group_uid"], row["project_uid"]
+            cache.set(cache.tasks, key, entry, generation)
+        return uid
@@ -1,27 +1,62 @@
 # -*- coding: utf-8 -*-
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from recc_database.chrono.datetime import tznow
 from recc_database.database.mixin._pg_base import PgBase
 from recc_database.database.query.user import (
+    COPY_USER_COLUMNS,
     DELETE_USER_BY_UID,
     INSERT_USER,
     SELECT_USER_ADMIN_COUNT,
     SELECT_USER_ALL,
     SELECT_USER_BY_UID,
+    SELECT_USER_BY_UIDS,
     SELECT_USER_COUNT,
     SELECT_USER_EXISTS_BY_USERNAME,
+    SELECT_USER_PAGE,
     SELECT_USER_PASSWORD_AND_SALT_BY_UID,
     SELECT_USER_UID_BY_USERNAME,
     SELECT_USER_USERNAME,
     SELECT_USER_USERNAME_BY_UID,
+    SELECT_USER_USERNAME_BY_UIDS,
     UPDATE_USER_LAST_LOGIN_BY_UID,
     UPDATE_USER_PASSWORD_AND_SALT_BY_UID,
     get_update_user_query_by_uid,
 )
 from recc_database.packet.user import PassInfo, User
+from recc_database.variables.database import DATABASE_PAGE_LIMIT, TABLE_USER
+
+
+def _user_record(
+    username: str,
+    password: str,
+    salt: str,
+    nickname: Optional[str] = None,
+    email: Optional[str] = None,
+    phone: Optional[str] = None,
+    admin: Optional[bool] = None,
+    dark: Optional[int] = None,
+    lang: Optional[str] = None,
+    timezone: Optional[str] = None,
+    created_at: Optional[datetime] = None,
+) -> Tuple[Any, ...]:
+    created = created_at if created_at else tznow()
+    return (
+        username,
+        password,
+        salt,
+        nickname if nickname else str(),
+        email if email else None,
+        phone if phone else None,
+        admin if admin else False,
+        dark if dark else 0,
+        lang if lang else str(),
+        timezone if timezone else str(),
+        created,
+        created,
+    )
 
 
 class PgUser(PgBase):
@@ -39,21 +74,30 @@ class PgUser(PgBase):
         timezone: Optional[str] = None,
         created_at: Optional[datetime] = None,
     ) -> int:
-        created = created_at if created_at else tznow()
-        return await self.column(
-            int,
-            INSERT_USER,
+        record = _user_record(
             username,
             password,
             salt,
-            nickname if nickname else str(),
-            email if email else None,
-            phone if phone else None,
-            admin if admin else False,
-            dark if dark else 0,
-            lang if lang else str(),
-            timezone if timezone else str(),
-            created,
+            nickname,
+            email,
+            phone,
+            admin,
+            dark,
+            lang,
+            timezone,
+            created_at,
+        )
+        return await self.column(int, INSERT_USER, *record)
+
+    async def insert_users(self, users: Iterable[Mapping[str, Any]]) -> List[int]:
+        """
+        :param users: The keyword arguments of :meth:`insert_user` for each user.
+        :return: The uids in the order of the users.
+        """
+
+        records = [_user_record(**user) for user in users]
+        return await self.copy_records_returning_uids(
+            TABLE_USER, COPY_USER_COLUMNS, records
         )
 
     async def update_user_last_login_by_uid(
@@ -107,13 +151,22 @@ class PgUser(PgBase):
             updated_at=updated,
         )
         await self.execute(query, *args)
+        if admin is not None and self._permission_cache is not None:
+            self._permission_cache.invalidate_user(uid)
 
     async def delete_user_by_uid(self, uid: int) -> None:
         await self.execute(DELETE_USER_BY_UID, uid)
+        if self._permission_cache is not None:
+            self._permission_cache.invalidate_user(uid)
 
     async def select_user_username_by_uid(self, uid: int) -> str:
         return await self.column(str, SELECT_USER_USERNAME_BY_UID, uid)
 
+    async def select_user_usernames_by_uids(
+        self, uids: Iterable[int]
+    ) -> Dict[int, str]:
+        return await self.columns_by_uid(SELECT_USER_USERNAME_BY_UIDS, uids)
+
     async def select_user_uid_by_username(self, username: str) -> int:
         return await self.column(int, SELECT_USER_UID_BY_USERNAME, username)
 
@@ -126,9 +179,20 @@ class PgUser(PgBase):
     async def select_user_by_uid(self, uid: int) -> User:
         return await self.row(User, SELECT_USER_BY_UID, uid)
 
+    async def select_users_by_uids(self, uids: Iterable[int]) -> Dict[int, User]:
+        return await self.rows_by_uid(User, SELECT_USER_BY_UIDS, uids)
+
     async def select_users(self) -> List[User]:
         return await self.rows(User, SELECT_USER_ALL)
 
+    async def select_users_page(
+        self, after_uid=0, limit=DATABASE_PAGE_LIMIT
+    ) -> List[User]:
+        return await self.rows(User, SELECT_USER_PAGE, after_uid, limit)
+
+    def stream_users(self) -> AsyncIterator[User]:
+        return self.stream(User, SELECT_USER_ALL)
+
     async def select_users_count(self) -> int:
         return await self.column(int, SELECT_USER_COUNT)
 
@@ -1,23 +1,28 @@
 # -*- coding: utf-8 -*-
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 from asyncpg.exceptions import UniqueViolationError
 
 from recc_database.chrono.datetime import tznow
 from recc_database.database.mixin._pg_base import PgBase
 from recc_database.database.query.user_info import (
+    COPY_USER_INFO_COLUMNS,
     DELETE_USER_INFO_BY_KEY,
+    DELETE_USER_INFO_BY_KEYS,
     EXISTS_USER_INFO_BY_KEY,
     INSERT_USER_INFO,
     SELECT_USER_INFO_ALL,
     SELECT_USER_INFO_BY_KEY,
     SELECT_USER_INFO_BY_KEY_LIKE,
+    SELECT_USER_INFO_BY_KEYS,
     UPDATE_USER_INFO_VALUE_BY_KEY,
     UPSERT_USER_INFO,
+    UPSERT_USER_INFOS,
 )
 from recc_database.packet.user import UserInfo
+from recc_database.variables.database import TABLE_USER_INFO
 
 
 class PgUserInfo(PgBase):
@@ -34,6 +39,21 @@ class PgUserInfo(PgBase):
         except UniqueViolationError:
             raise KeyError(f"The `{user_uid}` user_uid and `{key}` key already exists")
 
+    async def insert_user_infos(
+        self,
+        infos: Iterable[Tuple[int, str, str]],
+        created_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        :param infos: The `(user_uid, key, value)` of each info.
+        """
+
+        created = created_at if created_at else tznow()
+        records = [(u, k, v, created, created) for u, k, v in infos]
+        if not records:
+            return
+        await self.copy_records(TABLE_USER_INFO, COPY_USER_INFO_COLUMNS, records)
+
     async def update_user_info_value_by_key(
         self,
         user_uid: int,
@@ -54,15 +74,55 @@ class PgUserInfo(PgBase):
         created_or_updated = created_or_updated_at if created_or_updated_at else tznow()
         await self.execute(UPSERT_USER_INFO, user_uid, key, value, created_or_updated)
 
+    async def upsert_user_infos(
+        self,
+        user_uid: int,
+        infos: Mapping[str, str],
+        created_or_updated_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Insert or update all key and value pairs of the mapping in one statement.
+        """
+
+        if not infos:
+            return
+        keys = list(infos.keys())
+        values = [infos[k] for k in keys]
+        created_or_updated = created_or_updated_at if created_or_updated_at else tznow()
+        await self.execute(
+            UPSERT_USER_INFOS, user_uid, keys, values, created_or_updated
+        )
+
     async def delete_user_info_by_key(self, user_uid: int, key: str) -> None:
         await self.execute(DELETE_USER_INFO_BY_KEY, user_uid, key)
 
+    async def delete_user_infos_by_keys(
+        self, user_uid: int, keys: Iterable[str]
+    ) -> None:
+        items = list(keys)
+        if not items:
+            return
+        await self.execute(DELETE_USER_INFO_BY_KEYS, user_uid, items)
+
     async def exists_user_info_by_key(self, user_uid: int, key: str) -> bool:
         return await self.column(bool, EXISTS_USER_INFO_BY_KEY, user_uid, key)
 
     async def select_user_info_by_key(self, user_uid: int, key: str) -> UserInfo:
         return await self.row(UserInfo, SELECT_USER_INFO_BY_KEY, user_uid, key)
 
+    async def select_user_infos_by_keys(
+        self, user_uid: int, keys: Iterable[str]
+    ) -> Dict[str, UserInfo]:
+        """
+        :return: The infos keyed by their `key` column. Unknown keys are omitted.
+        """
+
+        items = list(keys)
+        if not items:
+            return dict()
+        infos = await self.rows(UserInfo, SELECT_USER_INFO_BY_KEYS, user_uid, items)
+        return {info.key: info for info in infos}
+
     async def select_user_infos_like(self, user_uid: int, like: str) -> List[UserInfo]:
         return await self.rows(UserInfo, SELECT_USER_INFO_BY_KEY_LIKE, user_uid, like)
 
@@ -1,10 +1,19 @@
 # -*- coding: utf-8 -*-
 
-from datetime import datetime
 from functools import lru_cache, reduce
-from typing import Optional
+from typing import List, Optional
+
+from asyncpg.connection import Connection
 
 from recc_database.chrono.datetime import tznow
+from recc_database.database.cache.info_cache import InfoCache
+from recc_database.database.cache.invalidation_bus import InvalidationBus
+from recc_database.database.cache.permission_cache import PermissionCache
+from recc_database.database.cache.permission_matrix import PermissionMatrixCache
+from recc_database.database.cache.slug_cache import SlugCache
+from recc_database.database.metrics.metrics_hook import MetricsHookInterface
+from recc_database.database.metrics.slow_query_log import SlowQueryLog
+from recc_database.database.migration import advisory_lock, apply_migrations
 from recc_database.database.mixin._pg_base import PgBase  # noqa
 from recc_database.database.mixin.pg_group import PgGroup
 from recc_database.database.mixin.pg_group_member import PgGroupMember
@@ -18,22 +27,35 @@ from recc_database.database.mixin.pg_role_permission import PgRolePermission
 from recc_database.database.mixin.pg_task import PgTask
 from recc_database.database.mixin.pg_user import PgUser
 from recc_database.database.mixin.pg_user_info import PgUserInfo
+from recc_database.database.pool_options import PgPoolOptions
 from recc_database.database.query.create.functions import (
     CREATE_FUNCTIONS,
     DROP_FUNCTIONS,
 )
 from recc_database.database.query.create.indices import CREATE_INDICES, DROP_INDICES
+from recc_database.database.query.create.project_access import (
+    CREATE_PROJECT_ACCESS,
+    DROP_PROJECT_ACCESS,
+    EXISTS_TABLE_PROJECT_ACCESS,
+    REFRESH_PROJECT_ACCESS,
+)
 from recc_database.database.query.create.tables import CREATE_TABLES, DROP_TABLES
+from recc_database.database.query.create.triggers import DROP_TRIGGERS
 from recc_database.database.query.create.views import CREATE_VIEWS, DROP_VIEWS
-from recc_database.database.query.info import (
-    EXISTS_INFO_BY_KEY,
-    INSERT_INFO,
-    SELECT_INFO_UPDATED_AT_BY_KEY,
-)
-from recc_database.database.query.permission import INSERT_PERMISSION_DEFAULTS
+from recc_database.database.query.info import EXISTS_INFO_BY_KEY, INSERT_INFO
+from recc_database.database.query.permission import SAFE_INSERT_PERMISSION_BY_SLUGS
 from recc_database.database.query.role import INSERT_ROLE_DEFAULTS
-from recc_database.database.query.role_permission import DEFAULT_INSERT_ROLE_PERMISSIONS
-from recc_database.variables.database import INFO_KEY_RECC_DB_VERSION
+from recc_database.database.query.role_permission import (
+    DEFAULT_ROLE_PERMISSION_SLUG_PAIRS,
+    SAFE_INSERT_ROLE_PERMISSION_BY_SLUG_PAIRS,
+)
+from recc_database.variables.database import (
+    DEFAULT_PERMISSION_SLUGS,
+    INFO_CACHE_TTL_SECONDS,
+    INFO_KEY_RECC_DB_VERSION,
+    PERMISSION_CACHE_TTL_SECONDS,
+    SLUG_CACHE_TTL_SECONDS,
+)
 
 
 @lru_cache
@@ -70,6 +92,18 @@ class PgDb(
         pw: Optional[str] = None,
         name: Optional[str] = None,
         timeout: Optional[float] = None,
+        permission_cache_size=0,
+        permission_cache_ttl=PERMISSION_CACHE_TTL_SECONDS,
+        listen_changes=False,
+        pool_options: Optional[PgPoolOptions] = None,
+        metrics: Optional[MetricsHookInterface] = None,
+        slow_query_log: Optional[SlowQueryLog] = None,
+        slotted_packets=False,
+        project_access_table=False,
+        slug_cache_size=0,
+        slug_cache_ttl=SLUG_CACHE_TTL_SECONDS,
+        info_cache=False,
+        info_cache_ttl=INFO_CACHE_TTL_SECONDS,
     ):
         self._pool = None
         self._host = host
@@ -78,6 +112,38 @@ class PgDb(
         self._pw = pw
         self._name = name
         self._timeout = timeout
+        self._pool_options = pool_options if pool_options else PgPoolOptions()
+        self._metrics = metrics
+        self._slow_query_log = slow_query_log
+        self._slotted_packets = slotted_packets
+        self._project_access_table = project_access_table
+
+        self._invalidation_bus = InvalidationBus()
+        self._listener = None
+        self._listen_changes = listen_changes
+
+        self._permission_matrix = PermissionMatrixCache()
+        self._invalidation_bus.register(self._permission_matrix)
+
+        if permission_cache_size >= 1:
+            self._permission_cache = PermissionCache(
+                permission_cache_size, permission_cache_ttl
+            )
+            self._invalidation_bus.register(self._permission_cache)
+        else:
+            self._permission_cache = None
+
+        if slug_cache_size >= 1:
+            self._slug_cache = SlugCache(slug_cache_size, slug_cache_ttl)
+            self._invalidation_bus.register(self._slug_cache)
+        else:
+            self._slug_cache = None
+
+        if info_cache:
+            self._info_cache = InfoCache(info_cache_ttl)
+            self._invalidation_bus.register(self._info_cache)
+        else:
+            self._info_cache = None
 
     def is_open(self) -> bool:
         return PgBase.is_open(self)
@@ -92,54 +158,102 @@ class PgDb(
         await PgBase.drop_database(self)
 
     async def create_tables(self) -> None:
+        """
+        Create the schema of a new database or migrate an existing one.
+        """
+
+        self.clear_caches()
+        try:
+            async with self.conn() as conn:
+                async with advisory_lock(conn):
+                    if await self._create_tables(conn):
+                        await apply_migrations(conn)
+                    if self._project_access_table:
+                        await self._create_project_access(conn)
+                    if self._listen_changes:
+                        await self._create_change_triggers(conn)
+        finally:
+            # Reconnect so that statements which could not be prepared
+            # before the tables existed are warmed up again.
+            assert self._pool is not None
+            await self._pool.expire_connections()
+
+    async def migrate(self) -> List[str]:
+        """
+        :return: The versions of the applied migration steps.
+        """
+
+        self.clear_caches()
         async with self.conn() as conn:
-            async with conn.transaction():
-                create_tables = _merge_queries(*CREATE_TABLES)
-                await conn.execute(create_tables)
+            async with advisory_lock(conn):
+                return await apply_migrations(conn)
+
+    @staticmethod
+    async def _create_tables(conn: Connection) -> bool:
+        """
+        :return: Whether the database was already initialized.
+        """
+
+        async with conn.transaction():
+            create_tables = _merge_queries(*CREATE_TABLES)
+            await conn.execute(create_tables)
 
+            exists_db_version = await conn.fetchval(
+                EXISTS_INFO_BY_KEY, INFO_KEY_RECC_DB_VERSION
+            )
+
+            if not exists_db_version:
+                # The indices of an existing database are changed by the
+                # migration steps, which can build them concurrently.
                 create_indices = _merge_queries(*CREATE_INDICES)
                 await conn.execute(create_indices)
 
-                create_views = _merge_queries(*CREATE_VIEWS)
-                await conn.execute(create_views)
-
-                create_functions = _merge_queries(*CREATE_FUNCTIONS)
-                await conn.execute(create_functions)
-
-                exists_db_version = await conn.fetchval(
-                    EXISTS_INFO_BY_KEY, INFO_KEY_RECC_DB_VERSION
-                )
-                if exists_db_version:
-                    db_version_updated_at = await conn.fetchval(
-                        SELECT_INFO_UPDATED_AT_BY_KEY, INFO_KEY_RECC_DB_VERSION
-                    )
-                    assert isinstance(db_version_updated_at, datetime)
-                    # logger.info(
-                    #   f"Already database updated at: {db_version_updated_at}"
-                    # )
-                    return
-
-                insert_perms = _merge_queries(*INSERT_PERMISSION_DEFAULTS)
-                await conn.execute(insert_perms)
-
-                insert_roles = _merge_queries(*INSERT_ROLE_DEFAULTS)
-                await conn.execute(insert_roles)
-
-                insert_role_perms = _merge_queries(*DEFAULT_INSERT_ROLE_PERMISSIONS)
-                await conn.execute(insert_role_perms)
-
-                await conn.execute(
-                    INSERT_INFO,
-                    INFO_KEY_RECC_DB_VERSION,
-                    version(),
-                    tznow(),
-                )
-                # logger.info("Database initialization complete")
+            create_views = _merge_queries(*CREATE_VIEWS)
+            await conn.execute(create_views)
+
+            create_functions = _merge_queries(*CREATE_FUNCTIONS)
+            await conn.execute(create_functions)
+
+            if exists_db_version:
+                return True
+
+            await conn.execute(
+                SAFE_INSERT_PERMISSION_BY_SLUGS,
+                list(DEFAULT_PERMISSION_SLUGS),
+            )
+
+            insert_roles = _merge_queries(*INSERT_ROLE_DEFAULTS)
+            await conn.execute(insert_roles)
+
+            await conn.execute(
+                SAFE_INSERT_ROLE_PERMISSION_BY_SLUG_PAIRS,
+                *DEFAULT_ROLE_PERMISSION_SLUG_PAIRS,
+            )
+
+            await conn.execute(
+                INSERT_INFO,
+                INFO_KEY_RECC_DB_VERSION,
+                version(),
+                tznow(),
+            )
+            # logger.info("Database initialization complete")
+            return False
+
+    @staticmethod
+    async def _create_project_access(conn: Connection) -> None:
+        async with conn.transaction():
+            exists = await conn.fetchval(EXISTS_TABLE_PROJECT_ACCESS)
+            await conn.execute(_merge_queries(*CREATE_PROJECT_ACCESS))
+            if not exists:
+                await conn.execute(REFRESH_PROJECT_ACCESS)
 
     async def drop_tables(self) -> None:
-        all_drop = DROP_TABLES + DROP_INDICES + DROP_VIEWS + DROP_FUNCTIONS
-        all_drop_reverse = all_drop[::-1]
+        all_drop = (
+            DROP_TABLES + DROP_INDICES + DROP_VIEWS + DROP_FUNCTIONS + DROP_TRIGGERS
+        )
+        all_drop_reverse = DROP_PROJECT_ACCESS + all_drop[::-1]
         queries = _merge_queries(*all_drop_reverse)
         assert isinstance(queries, str)
         await self.execute(queries)
+        self.clear_caches()
         # logger.info("All tables have been successfully dropped")
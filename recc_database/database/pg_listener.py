@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import CancelledError, Task, get_running_loop, sleep
+from typing import Optional
+
+from asyncpg import connect
+from asyncpg.connection import Connection
+
+from recc_database.database.cache.invalidation_bus import InvalidationBus
+from recc_database.variables.database import (
+    CHANNEL_CHANGE,
+    DATABASE_LISTENER_RECONNECT_SECONDS,
+)
+
+
+class PgChangeListener:
+    """
+    A dedicated connection that `LISTEN`s to the change channel
+    and forwards every notification to the :class:`InvalidationBus`.
+    """
+
+    def __init__(
+        self,
+        bus: InvalidationBus,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        database: Optional[str] = None,
+        channel=CHANNEL_CHANGE,
+        reconnect_delay=DATABASE_LISTENER_RECONNECT_SECONDS,
+    ):
+        self._bus = bus
+        self._host = host
+        self._port = port
+        self._user = user
+        self._password = password
+        self._database = database
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+        self._conn: Optional[Connection] = None
+        self._reconnect_task: Optional[Task] = None
+        self._closing = False
+
+    @property
+    def bus(self) -> InvalidationBus:
+        return self._bus
+
+    @property
+    def channel(self) -> str:
+        return self._channel
+
+    def is_open(self) -> bool:
+        # asyncpg closes the connection before it calls the termination
+        # listener, which clears the connection after resetting the caches.
+        return self._conn is not None
+
+    async def _connect(self) -> None:
+        conn = await connect(
+            host=self._host,
+            port=self._port,
+            user=self._user,
+            password=self._password,
+            database=self._database,
+        )
+        try:
+            await conn.add_listener(self._channel, self._on_notification)
+        except BaseException:
+            await conn.close()
+            raise
+        conn.add_termination_listener(self._on_termination)
+        self._conn = conn
+
+    async def open(self) -> None:
+        assert self._conn is None
+        self._closing = False
+        await self._connect()
+
+    async def close(self) -> None:
+        self._closing = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except CancelledError:
+                pass
+            self._reconnect_task = None
+
+        conn = self._conn
+        self._conn = None
+        if conn is not None and not conn.is_closed():
+            conn.remove_termination_listener(self._on_termination)
+            await conn.remove_listener(self._channel, self._on_notification)
+            await conn.close()
+
+    def _on_notification(self, conn, pid: int, channel: str, payload: str) -> None:
+        self._bus.dispatch_payload(payload)
+
+    def _on_termination(self, conn) -> None:
+        self._conn = None
+        # Notifications sent while disconnected are lost.
+        self._bus.reset()
+        if not self._closing and self._reconnect_task is None:
+            loop = get_running_loop()
+            self._reconnect_task = loop.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        try:
+            while not self._closing:
+                await sleep(self._reconnect_delay)
+                try:
+                    await self._connect()
+                except Exception:
+                    continue
+                # Drop anything cached between the termination and now.
+                self._bus.reset()
+                break
+        finally:
+            self._reconnect_task = None
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass
+from typing import Optional
+
+from recc_database.variables.database import (
+    DATABASE_POOL_ADAPTIVE_INACTIVE_CONNECTION_LIFETIME_SECONDS,
+    DATABASE_POOL_ADAPTIVE_MAX_SIZE,
+    DATABASE_POOL_ADAPTIVE_MIN_SIZE,
+    DATABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS,
+    DATABASE_POOL_MAX_QUERIES,
+    DATABASE_POOL_MAX_SIZE,
+    DATABASE_POOL_MIN_SIZE,
+)
+
+
+@dataclass(frozen=True)
+class PgPoolOptions:
+    """
+    The connection pool settings.
+
+    The pool opens `min_size` connections at startup and connects more
+    on demand, up to `max_size`, only when every open connection is busy.
+    A connection that stays idle for `max_inactive_connection_lifetime` seconds
+    is closed. Depending on the asyncpg version, this also closes the ones
+    below `min_size`, so an idle pool may shrink to no open connections and
+    reconnects on the next acquire. `0` keeps the idle connections open.
+    """
+
+    min_size: int = DATABASE_POOL_MIN_SIZE
+    max_size: int = DATABASE_POOL_MAX_SIZE
+    max_queries: int = DATABASE_POOL_MAX_QUERIES
+    max_inactive_connection_lifetime: float = (
+        DATABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS
+    )
+    acquire_timeout: Optional[float] = None
+    """
+    Seconds to wait for a free connection. `None` waits forever.
+    """
+
+    def __post_init__(self):
+        if self.min_size < 0:
+            raise ValueError("The min_size must not be negative")
+        if self.max_size < 1:
+            raise ValueError("The max_size must be at least 1")
+        if self.min_size > self.max_size:
+            raise ValueError("The min_size must not be greater than the max_size")
+        if self.max_queries < 1:
+            raise ValueError("The max_queries must be at least 1")
+        if self.max_inactive_connection_lifetime < 0:
+            raise ValueError(
+                "The max_inactive_connection_lifetime must not be negative"
+            )
+        if self.acquire_timeout is not None and self.acquire_timeout <= 0:
+            raise ValueError("The acquire_timeout must be greater than 0")
+
+    @property
+    def overflow(self) -> int:
+        """
+        The number of connections opened only under acquire-wait pressure.
+        """
+        return self.max_size - self.min_size
+
+    @classmethod
+    def adaptive(
+        cls,
+        min_size=DATABASE_POOL_ADAPTIVE_MIN_SIZE,
+        max_size=DATABASE_POOL_ADAPTIVE_MAX_SIZE,
+        max_queries=DATABASE_POOL_MAX_QUERIES,
+        max_inactive_connection_lifetime=(
+            DATABASE_POOL_ADAPTIVE_INACTIVE_CONNECTION_LIFETIME_SECONDS
+        ),
+        acquire_timeout: Optional[float] = None,
+    ) -> "PgPoolOptions":
+        """
+        A small floor with a large overflow and a short idle lifetime.
+
+        It grows toward `max_size` while the acquirers would otherwise wait
+        and closes the idle connections, possibly even below `min_size`,
+        when the load goes away.
+        """
+        return cls(
+            min_size=min_size,
+            max_size=max_size,
+            max_queries=max_queries,
+            max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+            acquire_timeout=acquire_timeout,
+        )
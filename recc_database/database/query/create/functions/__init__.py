@@ -2,10 +2,24 @@
 
 from recc_database.database.query.create.functions.appropriate_permission import (
     CREATE_FUNC_APPROPRIATE_PERMISSION,
+    CREATE_FUNC_APPROPRIATE_PERMISSIONS,
     DROP_FUNC_APPROPRIATE_PERMISSION,
+    DROP_FUNC_APPROPRIATE_PERMISSIONS,
+)
+from recc_database.database.query.create.functions.notify_change import (
+    CREATE_FUNCS_NOTIFY_CHANGE,
+    DROP_FUNCS_NOTIFY_CHANGE,
 )
 
-CREATE_FUNCTIONS = (CREATE_FUNC_APPROPRIATE_PERMISSION,)
-DROP_FUNCTIONS = (DROP_FUNC_APPROPRIATE_PERMISSION,)
+CREATE_FUNCTIONS = (
+    CREATE_FUNC_APPROPRIATE_PERMISSION,
+    CREATE_FUNC_APPROPRIATE_PERMISSIONS,
+    *CREATE_FUNCS_NOTIFY_CHANGE,
+)
+DROP_FUNCTIONS = (
+    DROP_FUNC_APPROPRIATE_PERMISSION,
+    DROP_FUNC_APPROPRIATE_PERMISSIONS,
+    *DROP_FUNCS_NOTIFY_CHANGE,
+)
 
 __all__ = ("CREATE_FUNCTIONS", "DROP_FUNCTIONS")
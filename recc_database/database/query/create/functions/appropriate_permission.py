@@ -2,6 +2,7 @@
 
 from recc_database.variables.database import (
     FUNC_APPROPRIATE_PERMISSION,
+    FUNC_APPROPRIATE_PERMISSIONS,
     TABLE_GROUP_MEMBER,
     TABLE_PERMISSION,
     TABLE_PROJECT_MEMBER,
@@ -63,33 +64,66 @@ END;
 $function$;
 """
 
+CREATE_FUNC_APPROPRIATE_PERMISSIONS = f"""
+CREATE OR REPLACE FUNCTION {FUNC_APPROPRIATE_PERMISSIONS} (
+    u_uid INTEGER,
+    g_uids INTEGER[],
+    p_uids INTEGER[]
+)
+    RETURNS TABLE (group_uid INTEGER, project_uid INTEGER, permission_uid INTEGER)
+    LANGUAGE sql
+    STABLE
+AS $function$
+    -- It resolves each (group, project) pair like {FUNC_APPROPRIATE_PERMISSION}:
+    -- Administrator has full control, and the project role takes precedence
+    -- over the group role.
+    WITH pairs AS (
+        SELECT DISTINCT t.g, t.p
+        FROM unnest(g_uids, p_uids) AS t(g, p)
+    ), roles AS (
+        SELECT pairs.g, pairs.p, COALESCE(pm.role_uid, gm.role_uid) AS r_uid
+        FROM pairs
+        LEFT JOIN {TABLE_PROJECT_MEMBER} pm
+            ON pm.user_uid=u_uid AND pm.project_uid=pairs.p
+        LEFT JOIN {TABLE_GROUP_MEMBER} gm
+            ON gm.user_uid=u_uid AND gm.group_uid=pairs.g
+    ), is_admin AS (
+        SELECT EXISTS (
+            SELECT *
+            FROM {TABLE_USER}
+            WHERE uid=u_uid AND admin
+        ) AS admin
+    )
+    SELECT roles.g, roles.p, rp.permission_uid
+    FROM roles
+    INNER JOIN {TABLE_ROLE_PERMISSION} rp ON rp.role_uid=roles.r_uid
+    WHERE NOT (SELECT admin FROM is_admin)
+    UNION ALL
+    SELECT pairs.g, pairs.p, perm.uid
+    FROM pairs, {TABLE_PERMISSION} perm
+    WHERE (SELECT admin FROM is_admin);
+$function$;
+"""
+
 DROP_FUNC_APPROPRIATE_PERMISSION = f"""
 DROP FUNCTION IF EXISTS {FUNC_APPROPRIATE_PERMISSION};
 """
 
-_SELECT_APPROPRIATE_PERMISSION_BY_USER_AND_GROUP_FORMAT = f"""
-SELECT * FROM {FUNC_APPROPRIATE_PERMISSION}({{u_uid}}, {{g_uid}});
+DROP_FUNC_APPROPRIATE_PERMISSIONS = f"""
+DROP FUNCTION IF EXISTS {FUNC_APPROPRIATE_PERMISSIONS};
 """
 
-_SELECT_APPROPRIATE_PERMISSION_BY_USER_AND_GROUP_AND_PROJECT_FORMAT = f"""
-SELECT * FROM {FUNC_APPROPRIATE_PERMISSION}({{u_uid}}, {{g_uid}}, {{p_uid}});
+SELECT_APPROPRIATE_PERMISSION_BY_USER_AND_GROUP = f"""
+SELECT * FROM {FUNC_APPROPRIATE_PERMISSION}($1, $2);
 """
 
+SELECT_APPROPRIATE_PERMISSION_BY_USER_AND_GROUP_AND_PROJECT = f"""
+SELECT * FROM {FUNC_APPROPRIATE_PERMISSION}($1, $2, $3);
+"""
 
-def get_select_appropriate_permission_by_user_and_group(
-    user_uid: int, group_uid: int
-) -> str:
-    return _SELECT_APPROPRIATE_PERMISSION_BY_USER_AND_GROUP_FORMAT.format(
-        u_uid=user_uid,
-        g_uid=group_uid,
-    )
-
-
-def get_select_appropriate_permission_by_user_and_group_and_project(
-    user_uid: int, group_uid: int, project_uid: int
-) -> str:
-    return _SELECT_APPROPRIATE_PERMISSION_BY_USER_AND_GROUP_AND_PROJECT_FORMAT.format(
-        u_uid=user_uid,
-        g_uid=group_uid,
-        p_uid=project_uid,
-    )
+SELECT_APPROPRIATE_PERMISSIONS_BY_USER_AND_PAIRS = f"""
+SELECT a.group_uid, a.project_uid, perm.uid, perm.slug, perm.created_at
+FROM {FUNC_APPROPRIATE_PERMISSIONS}($1, $2::INTEGER[], $3::INTEGER[]) a
+INNER JOIN {TABLE_PERMISSION} perm ON perm.uid=a.permission_uid
+ORDER BY perm.uid;
+"""
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Optional, Tuple
+
+from recc_database.variables.database import (
+    CHANNEL_CHANGE,
+    FUNC_NOTIFY_CHANGE,
+    TABLE_GROUP,
+    TABLE_GROUP_MEMBER,
+    TABLE_INFO,
+    TABLE_PERMISSION,
+    TABLE_PIP,
+    TABLE_PREFIX,
+    TABLE_PROJECT,
+    TABLE_PROJECT_MEMBER,
+    TABLE_ROLE,
+    TABLE_ROLE_PERMISSION,
+    TABLE_TASK,
+    TABLE_USER,
+    TABLE_USER_INFO,
+)
+
+NOTIFY_CHANGE_KEY_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    TABLE_INFO: ("key",),
+    TABLE_USER: ("uid",),
+    TABLE_USER_INFO: ("user_uid", "key"),
+    TABLE_GROUP: ("uid",),
+    TABLE_PERMISSION: ("uid",),
+    TABLE_ROLE: ("uid",),
+    TABLE_ROLE_PERMISSION: ("role_uid", "permission_uid"),
+    TABLE_PROJECT: ("uid", "group_uid"),
+    TABLE_TASK: ("uid", "project_uid"),
+    TABLE_GROUP_MEMBER: ("group_uid", "user_uid"),
+    TABLE_PROJECT_MEMBER: ("project_uid", "user_uid"),
+    TABLE_PIP: ("domain", "name"),
+}
+"""
+The columns sent as the `key` of each change notification.
+"""
+
+NOTIFY_CHANGE_WATCHED_COLUMNS: Dict[str, Optional[Tuple[str, ...]]] = {
+    TABLE_INFO: None,
+    TABLE_USER: ("uid", "admin"),
+    TABLE_USER_INFO: None,
+    TABLE_GROUP: ("uid", "slug"),
+    TABLE_PERMISSION: None,
+    TABLE_ROLE: ("uid", "slug"),
+    TABLE_ROLE_PERMISSION: None,
+    TABLE_PROJECT: ("uid", "group_uid", "slug"),
+    TABLE_TASK: ("uid", "project_uid", "slug"),
+    TABLE_GROUP_MEMBER: ("group_uid", "user_uid", "role_uid"),
+    TABLE_PROJECT_MEMBER: ("project_uid", "user_uid", "role_uid"),
+    TABLE_PIP: None,
+}
+"""
+The columns read by the caches. The updates of the other columns, e.g. the
+`last_login` of a user or the `extra` of a task, are not notified.
+`None` notifies the updates of any column.
+"""
+
+_CREATE_FUNC_NOTIFY_CHANGE_FORMAT = """
+CREATE OR REPLACE FUNCTION {function} ()
+    RETURNS TRIGGER
+    LANGUAGE plpgsql
+AS $function$
+DECLARE
+    new_key JSONB := NULL;
+    old_key JSONB := NULL;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        -- The key is unknown, so every cached row of this table is affected.
+        PERFORM pg_notify(
+            '{channel}',
+            json_build_object('table', TG_TABLE_NAME, 'op', TG_OP)::TEXT
+        );
+        RETURN NULL;
+    END IF;
+
+    -- Only the key columns are serialized, not the whole row.
+    IF TG_OP <> 'DELETE' THEN
+        new_key := jsonb_build_object({new_key});
+        PERFORM pg_notify(
+            '{channel}',
+            json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'key', new_key)::TEXT
+        );
+    END IF;
+    IF TG_OP <> 'INSERT' THEN
+        old_key := jsonb_build_object({old_key});
+        IF new_key IS NULL OR old_key <> new_key THEN
+            PERFORM pg_notify(
+                '{channel}',
+                json_build_object(
+                    'table', TG_TABLE_NAME, 'op', TG_OP, 'key', old_key
+                )::TEXT
+            );
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$function$;
+"""
+
+_DROP_FUNC_NOTIFY_CHANGE_FORMAT = """
+DROP FUNCTION IF EXISTS {function};
+"""
+
+
+def get_notify_change_function_name(table: str) -> str:
+    return f"{FUNC_NOTIFY_CHANGE}_{table[len(TABLE_PREFIX):]}"
+
+
+def _build_key(record: str, columns: Tuple[str, ...]) -> str:
+    return ", ".join(f"'{column}', {record}.{column}" for column in columns)
+
+
+def get_create_func_notify_change(table: str) -> str:
+    columns = NOTIFY_CHANGE_KEY_COLUMNS[table]
+    return _CREATE_FUNC_NOTIFY_CHANGE_FORMAT.format(
+        function=get_notify_change_function_name(table),
+        channel=CHANNEL_CHANGE,
+        new_key=_build_key("NEW", columns),
+        old_key=_build_key("OLD", columns),
+    )
+
+
+def get_drop_func_notify_change(table: str) -> str:
+    return _DROP_FUNC_NOTIFY_CHANGE_FORMAT.format(
+        function=get_notify_change_function_name(table)
+    )
+
+
+CREATE_FUNCS_NOTIFY_CHANGE = tuple(
+    get_create_func_notify_change(table) for table in NOTIFY_CHANGE_KEY_COLUMNS
+)
+
+DROP_FUNCS_NOTIFY_CHANGE = (
+    *(get_drop_func_notify_change(table) for table in NOTIFY_CHANGE_KEY_COLUMNS),
+    # The row serializing function shared by the tables in older versions.
+    _DROP_FUNC_NOTIFY_CHANGE_FORMAT.format(function=FUNC_NOTIFY_CHANGE),
+)
@@ -1,70 +1,146 @@
 # -*- coding: utf-8 -*-
 
 from recc_database.variables.database import (
-    INDEX_GROUP_SLUG,
-    INDEX_PROJECT_SLUG,
-    INDEX_ROLE_SLUG,
-    INDEX_TASK_NAME,
-    INDEX_USER_EMAIL,
-    INDEX_USER_NAME,
+    INDEX_GROUP_EXTRA,
+    INDEX_GROUP_FEATURES,
+    INDEX_GROUP_MEMBER_ROLE_UID,
+    INDEX_GROUP_MEMBER_USER_UID,
+    INDEX_PIP_DOMAIN_NAME,
+    INDEX_PROJECT_EXTRA,
+    INDEX_PROJECT_FEATURES,
+    INDEX_PROJECT_MEMBER_ROLE_UID,
+    INDEX_PROJECT_MEMBER_USER_UID,
+    INDEX_ROLE_EXTRA,
+    INDEX_ROLE_PERMISSION_PERMISSION_UID,
+    INDEX_TASK_EXTRA,
     TABLE_GROUP,
+    TABLE_GROUP_MEMBER,
+    TABLE_PIP,
     TABLE_PROJECT,
+    TABLE_PROJECT_MEMBER,
     TABLE_ROLE,
+    TABLE_ROLE_PERMISSION,
     TABLE_TASK,
-    TABLE_USER,
 )
 
-CREATE_INDEX_USER_NAME = f"""
-CREATE INDEX IF NOT EXISTS {INDEX_USER_NAME}
-ON {TABLE_USER} (username);
+# The lookups by a leading key column are served by the primary key and
+# UNIQUE indices, e.g. `recc_project(group_uid)` by `UNIQUE(group_uid, slug)`
+# and `recc_task(project_uid)` by `UNIQUE(project_uid, slug)`. The indices
+# below cover the remaining filters and the ON DELETE CASCADE paths.
+
+CREATE_INDEX_GROUP_MEMBER_USER_UID = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_GROUP_MEMBER_USER_UID}
+ON {TABLE_GROUP_MEMBER} (user_uid);
+"""
+
+CREATE_INDEX_GROUP_MEMBER_ROLE_UID = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_GROUP_MEMBER_ROLE_UID}
+ON {TABLE_GROUP_MEMBER} (role_uid);
+"""
+
+CREATE_INDEX_PROJECT_MEMBER_USER_UID = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_PROJECT_MEMBER_USER_UID}
+ON {TABLE_PROJECT_MEMBER} (user_uid);
 """
 
-CREATE_INDEX_USER_EMAIL = f"""
-CREATE INDEX IF NOT EXISTS {INDEX_USER_EMAIL}
-ON {TABLE_USER} (email);
+CREATE_INDEX_PROJECT_MEMBER_ROLE_UID = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_PROJECT_MEMBER_ROLE_UID}
+ON {TABLE_PROJECT_MEMBER} (role_uid);
 """
 
-CREATE_INDEX_GROUP_SLUG = f"""
-CREATE INDEX IF NOT EXISTS {INDEX_GROUP_SLUG}
-ON {TABLE_GROUP} (slug);
+CREATE_INDEX_ROLE_PERMISSION_PERMISSION_UID = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_ROLE_PERMISSION_PERMISSION_UID}
+ON {TABLE_ROLE_PERMISSION} (permission_uid);
+"""
+
+CREATE_INDEX_PIP_DOMAIN_NAME = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_PIP_DOMAIN_NAME}
+ON {TABLE_PIP} (domain, name);
+"""
+
+# The GIN indices serve the `@>` and `&&` filters of the features arrays and the
+# `@>` filters of the extra documents. Only `@>` is used on the documents,
+# so their indices use the smaller `jsonb_path_ops` operator class.
+
+CREATE_INDEX_GROUP_FEATURES = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_GROUP_FEATURES}
+ON {TABLE_GROUP} USING GIN (features);
 """
 
-CREATE_INDEX_ROLE_NAME = f"""
-CREATE INDEX IF NOT EXISTS {INDEX_ROLE_SLUG}
-ON {TABLE_ROLE} (name);
+CREATE_INDEX_GROUP_EXTRA = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_GROUP_EXTRA}
+ON {TABLE_GROUP} USING GIN (extra jsonb_path_ops);
 """
 
-CREATE_INDEX_PROJECT_NAME = f"""
-CREATE INDEX IF NOT EXISTS {INDEX_PROJECT_SLUG}
-ON {TABLE_PROJECT} (name);
+CREATE_INDEX_PROJECT_FEATURES = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_PROJECT_FEATURES}
+ON {TABLE_PROJECT} USING GIN (features);
 """
 
-CREATE_INDEX_TASK_NAME = f"""
-CREATE INDEX IF NOT EXISTS {INDEX_TASK_NAME}
-ON {TABLE_TASK} (name);
+CREATE_INDEX_PROJECT_EXTRA = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_PROJECT_EXTRA}
+ON {TABLE_PROJECT} USING GIN (extra jsonb_path_ops);
+"""
+
+CREATE_INDEX_ROLE_EXTRA = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_ROLE_EXTRA}
+ON {TABLE_ROLE} USING GIN (extra jsonb_path_ops);
+"""
+
+CREATE_INDEX_TASK_EXTRA = f"""
+CREATE INDEX IF NOT EXISTS {INDEX_TASK_EXTRA}
+ON {TABLE_TASK} USING GIN (extra jsonb_path_ops);
 """
 
 CREATE_INDICES = (
-    CREATE_INDEX_USER_NAME,
-    CREATE_INDEX_USER_EMAIL,
-    CREATE_INDEX_GROUP_SLUG,
-    CREATE_INDEX_ROLE_NAME,
-    CREATE_INDEX_PROJECT_NAME,
-    CREATE_INDEX_TASK_NAME,
+    CREATE_INDEX_GROUP_MEMBER_USER_UID,
+    CREATE_INDEX_GROUP_MEMBER_ROLE_UID,
+    CREATE_INDEX_PROJECT_MEMBER_USER_UID,
+    CREATE_INDEX_PROJECT_MEMBER_ROLE_UID,
+    CREATE_INDEX_ROLE_PERMISSION_PERMISSION_UID,
+    CREATE_INDEX_PIP_DOMAIN_NAME,
+    CREATE_INDEX_GROUP_FEATURES,
+    CREATE_INDEX_GROUP_EXTRA,
+    CREATE_INDEX_PROJECT_FEATURES,
+    CREATE_INDEX_PROJECT_EXTRA,
+    CREATE_INDEX_ROLE_EXTRA,
+    CREATE_INDEX_TASK_EXTRA,
 )
 
-DROP_INDEX_USER_NAME = f"DROP INDEX IF EXISTS {INDEX_USER_NAME};"
-DROP_INDEX_USER_EMAIL = f"DROP INDEX IF EXISTS {INDEX_USER_EMAIL};"
-DROP_INDEX_GROUP_NAME = f"DROP INDEX IF EXISTS {INDEX_GROUP_SLUG};"
-DROP_INDEX_ROLE_NAME = f"DROP INDEX IF EXISTS {INDEX_ROLE_SLUG};"
-DROP_INDEX_PROJECT_NAME = f"DROP INDEX IF EXISTS {INDEX_PROJECT_SLUG};"
-DROP_INDEX_TASK_NAME = f"DROP INDEX IF EXISTS {INDEX_TASK_NAME};"
+DROP_INDEX_GROUP_MEMBER_USER_UID = (
+    f"DROP INDEX IF EXISTS {INDEX_GROUP_MEMBER_USER_UID};"
+)
+DROP_INDEX_GROUP_MEMBER_ROLE_UID = (
+    f"DROP INDEX IF EXISTS {INDEX_GROUP_MEMBER_ROLE_UID};"
+)
+DROP_INDEX_PROJECT_MEMBER_USER_UID = (
+    f"DROP INDEX IF EXISTS {INDEX_PROJECT_MEMBER_USER_UID};"
+)
+DROP_INDEX_PROJECT_MEMBER_ROLE_UID = (
+    f"DROP INDEX IF EXISTS {INDEX_PROJECT_MEMBER_ROLE_UID};"
+)
+DROP_INDEX_ROLE_PERMISSION_PERMISSION_UID = (
+    f"DROP INDEX IF EXISTS {INDEX_ROLE_PERMISSION_PERMISSION_UID};"
+)
+DROP_INDEX_PIP_DOMAIN_NAME = f"DROP INDEX IF EXISTS {INDEX_PIP_DOMAIN_NAME};"
+DROP_INDEX_GROUP_FEATURES = f"DROP INDEX IF EXISTS {INDEX_GROUP_FEATURES};"
+DROP_INDEX_GROUP_EXTRA = f"DROP INDEX IF EXISTS {INDEX_GROUP_EXTRA};"
+DROP_INDEX_PROJECT_FEATURES = f"DROP INDEX IF EXISTS {INDEX_PROJECT_FEATURES};"
+DROP_INDEX_PROJECT_EXTRA = f"DROP INDEX IF EXISTS {INDEX_PROJECT_EXTRA};"
+DROP_INDEX_ROLE_EXTRA = f"DROP INDEX IF EXISTS {INDEX_ROLE_EXTRA};"
+DROP_INDEX_TASK_EXTRA = f"DROP INDEX IF EXISTS {INDEX_TASK_EXTRA};"
 
 DROP_INDICES = (
-    DROP_INDEX_USER_NAME,
-    DROP_INDEX_USER_EMAIL,
-    DROP_INDEX_GROUP_NAME,
-    DROP_INDEX_ROLE_NAME,
-    DROP_INDEX_PROJECT_NAME,
-    DROP_INDEX_TASK_NAME,
+    DROP_INDEX_GROUP_MEMBER_USER_UID,
+    DROP_INDEX_GROUP_MEMBER_ROLE_UID,
+    DROP_INDEX_PROJECT_MEMBER_USER_UID,
+    DROP_INDEX_PROJECT_MEMBER_ROLE_UID,
+    DROP_INDEX_ROLE_PERMISSION_PERMISSION_UID,
+    DROP_INDEX_PIP_DOMAIN_NAME,
+    DROP_INDEX_GROUP_FEATURES,
+    DROP_INDEX_GROUP_EXTRA,
+    DROP_INDEX_PROJECT_FEATURES,
+    DROP_INDEX_PROJECT_EXTRA,
+    DROP_INDEX_ROLE_EXTRA,
+    DROP_INDEX_TASK_EXTRA,
 )
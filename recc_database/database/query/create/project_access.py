@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+from recc_database.database.query.create.triggers import (
+    get_create_trigger_if_not_exists,
+    get_drop_trigger,
+)
+from recc_database.variables.database import (
+    FUNC_PROJECT_ACCESS_GROUP_MEMBER,
+    FUNC_PROJECT_ACCESS_PROJECT,
+    FUNC_PROJECT_ACCESS_PROJECT_MEMBER,
+    FUNC_REFRESH_PROJECT_ACCESS,
+    FUNC_REFRESH_PROJECT_ACCESS_BY_USER,
+    INDEX_PROJECT_ACCESS_PROJECT_UID,
+    TABLE_GROUP,
+    TABLE_GROUP_MEMBER,
+    TABLE_PROJECT,
+    TABLE_PROJECT_ACCESS,
+    TABLE_PROJECT_MEMBER,
+    TABLE_USER,
+    TRIGGER_PROJECT_ACCESS_SUFFIX,
+)
+
+# The optional `user_uid -> project_uid` access table materializes the
+# projects a user can reach through a project or a group membership.
+#
+# Inserts are applied incrementally. Deletes and key changes recompute the
+# affected users, so a project reached through both memberships is kept until
+# the last one is gone. The triggers on the group members and the projects
+# lock the group row, so that a new member and a new project of the same group
+# see each other.
+
+EXISTS_TABLE_PROJECT_ACCESS = f"""
+SELECT to_regclass('{TABLE_PROJECT_ACCESS}') IS NOT NULL;
+"""
+
+CREATE_TABLE_PROJECT_ACCESS = f"""
+CREATE TABLE IF NOT EXISTS {TABLE_PROJECT_ACCESS} (
+    user_uid INTEGER NOT NULL
+        REFERENCES {TABLE_USER} (uid)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    project_uid INTEGER NOT NULL
+        REFERENCES {TABLE_PROJECT} (uid)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    PRIMARY KEY(user_uid, project_uid)
+);
+CREATE INDEX IF NOT EXISTS {INDEX_PROJECT_ACCESS_PROJECT_UID}
+ON {TABLE_PROJECT_ACCESS} (project_uid);
+"""
+
+CREATE_FUNC_REFRESH_PROJECT_ACCESS = f"""
+CREATE OR REPLACE FUNCTION {FUNC_REFRESH_PROJECT_ACCESS} ()
+    RETURNS VOID
+    LANGUAGE plpgsql
+AS $function$
+BEGIN
+    DELETE FROM {TABLE_PROJECT_ACCESS};
+    INSERT INTO {TABLE_PROJECT_ACCESS} (user_uid, project_uid)
+    SELECT user_uid, project_uid
+    FROM {TABLE_PROJECT_MEMBER}
+    UNION
+    SELECT gm.user_uid, p.uid
+    FROM {TABLE_GROUP_MEMBER} gm
+    INNER JOIN {TABLE_PROJECT} p ON p.group_uid=gm.group_uid;
+END;
+$function$;
+"""
+
+CREATE_FUNC_REFRESH_PROJECT_ACCESS_BY_USER = f"""
+CREATE OR REPLACE FUNCTION {FUNC_REFRESH_PROJECT_ACCESS_BY_USER} (
+    target_uid INTEGER
+)
+    RETURNS VOID
+    LANGUAGE plpgsql
+AS $function$
+BEGIN
+    DELETE FROM {TABLE_PROJECT_ACCESS}
+    WHERE user_uid=target_uid;
+
+    -- The joins skip the rows of a user or project deleted by a cascade.
+    INSERT INTO {TABLE_PROJECT_ACCESS} (user_uid, project_uid)
+    SELECT u.uid, a.project_uid
+    FROM {TABLE_USER} u, (
+        SELECT pm.project_uid
+        FROM {TABLE_PROJECT_MEMBER} pm
+        INNER JOIN {TABLE_PROJECT} p ON p.uid=pm.project_uid
+        WHERE pm.user_uid=target_uid
+        UNION
+        SELECT p.uid
+        FROM {TABLE_GROUP_MEMBER} gm
+        INNER JOIN {TABLE_PROJECT} p ON p.group_uid=gm.group_uid
+        WHERE gm.user_uid=target_uid
+    ) a
+    WHERE u.uid=target_uid
+    ON CONFLICT DO NOTHING;
+END;
+$function$;
+"""
+
+CREATE_FUNC_PROJECT_ACCESS_GROUP_MEMBER = f"""
+CREATE OR REPLACE FUNCTION {FUNC_PROJECT_ACCESS_GROUP_MEMBER} ()
+    RETURNS TRIGGER
+    LANGUAGE plpgsql
+AS $function$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM {FUNC_REFRESH_PROJECT_ACCESS}();
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        PERFORM 1 FROM {TABLE_GROUP} WHERE uid=NEW.group_uid FOR NO KEY UPDATE;
+        INSERT INTO {TABLE_PROJECT_ACCESS} (user_uid, project_uid)
+        SELECT NEW.user_uid, uid
+        FROM {TABLE_PROJECT}
+        WHERE group_uid=NEW.group_uid
+        ON CONFLICT DO NOTHING;
+        RETURN NULL;
+    END IF;
+
+    PERFORM 1 FROM {TABLE_GROUP} WHERE uid=OLD.group_uid FOR NO KEY UPDATE;
+    PERFORM {FUNC_REFRESH_PROJECT_ACCESS_BY_USER}(OLD.user_uid);
+    IF TG_OP = 'UPDATE' THEN
+        PERFORM 1 FROM {TABLE_GROUP} WHERE uid=NEW.group_uid FOR NO KEY UPDATE;
+        PERFORM {FUNC_REFRESH_PROJECT_ACCESS_BY_USER}(NEW.user_uid);
+    END IF;
+    RETURN NULL;
+END;
+$function$;
+"""
+
+CREATE_FUNC_PROJECT_ACCESS_PROJECT_MEMBER = f"""
+CREATE OR REPLACE FUNCTION {FUNC_PROJECT_ACCESS_PROJECT_MEMBER} ()
+    RETURNS TRIGGER
+    LANGUAGE plpgsql
+AS $function$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM {FUNC_REFRESH_PROJECT_ACCESS}();
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO {TABLE_PROJECT_ACCESS} (user_uid, project_uid)
+        VALUES (NEW.user_uid, NEW.project_uid)
+        ON CONFLICT DO NOTHING;
+        RETURN NULL;
+    END IF;
+
+    PERFORM {FUNC_REFRESH_PROJECT_ACCESS_BY_USER}(OLD.user_uid);
+    IF TG_OP = 'UPDATE' THEN
+        PERFORM {FUNC_REFRESH_PROJECT_ACCESS_BY_USER}(NEW.user_uid);
+    END IF;
+    RETURN NULL;
+END;
+$function$;
+"""
+
+CREATE_FUNC_PROJECT_ACCESS_PROJECT = f"""
+CREATE OR REPLACE FUNCTION {FUNC_PROJECT_ACCESS_PROJECT} ()
+    RETURNS TRIGGER
+    LANGUAGE plpgsql
+AS $function$
+DECLARE
+    member_uid INTEGER;
+BEGIN
+    -- The deleted projects are removed by the foreign key.
+    IF TG_OP = 'UPDATE' THEN
+        PERFORM 1
+        FROM {TABLE_GROUP}
+        WHERE uid IN (OLD.group_uid, NEW.group_uid)
+        ORDER BY uid
+        FOR NO KEY UPDATE;
+        FOR member_uid IN
+            SELECT user_uid FROM {TABLE_GROUP_MEMBER} WHERE group_uid=OLD.group_uid
+        LOOP
+            PERFORM {FUNC_REFRESH_PROJECT_ACCESS_BY_USER}(member_uid);
+        END LOOP;
+    ELSE
+        PERFORM 1 FROM {TABLE_GROUP} WHERE uid=NEW.group_uid FOR NO KEY UPDATE;
+    END IF;
+
+    INSERT INTO {TABLE_PROJECT_ACCESS} (user_uid, project_uid)
+    SELECT user_uid, NEW.uid
+    FROM {TABLE_GROUP_MEMBER}
+    WHERE group_uid=NEW.group_uid
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$function$;
+"""
+
+
+def get_project_access_trigger_name(table: str) -> str:
+    return f"{table}{TRIGGER_PROJECT_ACCESS_SUFFIX}"
+
+
+def get_project_access_truncate_trigger_name(table: str) -> str:
+    return f"{table}_truncate{TRIGGER_PROJECT_ACCESS_SUFFIX}"
+
+
+def get_create_project_access_trigger(table: str, function: str, *columns: str):
+    events = f"INSERT OR DELETE OR UPDATE OF {', '.join(columns)}"
+    trigger = get_project_access_trigger_name(table)
+    truncate_trigger = get_project_access_truncate_trigger_name(table)
+    return get_create_trigger_if_not_exists(
+        table, trigger, events, function
+    ) + get_create_trigger_if_not_exists(
+        table, truncate_trigger, "TRUNCATE", function, statement=True
+    )
+
+
+def get_drop_project_access_trigger(table: str) -> str:
+    trigger = get_project_access_trigger_name(table)
+    truncate_trigger = get_project_access_truncate_trigger_name(table)
+    return get_drop_trigger(table, trigger) + get_drop_trigger(table, truncate_trigger)
+
+
+# A truncated project cascades to the member tables, whose triggers refresh.
+CREATE_TRIGGER_PROJECT_ACCESS_PROJECT = get_create_trigger_if_not_exists(
+    TABLE_PROJECT,
+    get_project_access_trigger_name(TABLE_PROJECT),
+    "INSERT OR UPDATE OF group_uid",
+    FUNC_PROJECT_ACCESS_PROJECT,
+)
+
+CREATE_PROJECT_ACCESS = (
+    CREATE_TABLE_PROJECT_ACCESS,
+    CREATE_FUNC_REFRESH_PROJECT_ACCESS,
+    CREATE_FUNC_REFRESH_PROJECT_ACCESS_BY_USER,
+    CREATE_FUNC_PROJECT_ACCESS_GROUP_MEMBER,
+    CREATE_FUNC_PROJECT_ACCESS_PROJECT_MEMBER,
+    CREATE_FUNC_PROJECT_ACCESS_PROJECT,
+    get_create_project_access_trigger(
+        TABLE_GROUP_MEMBER,
+        FUNC_PROJECT_ACCESS_GROUP_MEMBER,
+        "group_uid",
+        "user_uid",
+    ),
+    get_create_project_access_trigger(
+        TABLE_PROJECT_MEMBER,
+        FUNC_PROJECT_ACCESS_PROJECT_MEMBER,
+        "project_uid",
+        "user_uid",
+    ),
+    CREATE_TRIGGER_PROJECT_ACCESS_PROJECT,
+)
+
+DROP_PROJECT_ACCESS = (
+    get_drop_project_access_trigger(TABLE_GROUP_MEMBER),
+    get_drop_project_access_trigger(TABLE_PROJECT_MEMBER),
+    get_drop_trigger(TABLE_PROJECT, get_project_access_trigger_name(TABLE_PROJECT)),
+    f"DROP FUNCTION IF EXISTS {FUNC_PROJECT_ACCESS_PROJECT};",
+    f"DROP FUNCTION IF EXISTS {FUNC_PROJECT_ACCESS_PROJECT_MEMBER};",
+    f"DROP FUNCTION IF EXISTS {FUNC_PROJECT_ACCESS_GROUP_MEMBER};",
+    f"DROP FUNCTION IF EXISTS {FUNC_REFRESH_PROJECT_ACCESS_BY_USER};",
+    f"DROP FUNCTION IF EXISTS {FUNC_REFRESH_PROJECT_ACCESS};",
+    f"DROP TABLE IF EXISTS {TABLE_PROJECT_ACCESS};",
+)
+
+REFRESH_PROJECT_ACCESS = f"SELECT {FUNC_REFRESH_PROJECT_ACCESS}();"
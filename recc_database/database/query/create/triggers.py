@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+from typing import Iterable, Mapping, Optional, Tuple
+
+from recc_database.database.query.create.functions.notify_change import (
+    NOTIFY_CHANGE_KEY_COLUMNS,
+    NOTIFY_CHANGE_WATCHED_COLUMNS,
+    get_notify_change_function_name,
+)
+from recc_database.variables.database import (
+    CHANGE_OP_DELETE,
+    CHANGE_OP_INSERT,
+    CHANGE_OP_TRUNCATE,
+    CHANGE_OP_UPDATE,
+    TRIGGER_NOTIFY_CHANGE_SUFFIX,
+)
+
+CHANGE_OPS = (CHANGE_OP_INSERT, CHANGE_OP_UPDATE, CHANGE_OP_DELETE, CHANGE_OP_TRUNCATE)
+
+_CREATE_TRIGGER_IF_NOT_EXISTS_FORMAT = """
+DO $do$
+BEGIN
+    IF to_regclass('{table}') IS NOT NULL
+        AND to_regproc('{function}') IS NOT NULL
+        AND NOT EXISTS (
+            SELECT 1
+            FROM pg_trigger
+            WHERE tgrelid=to_regclass('{table}')
+                AND tgname='{trigger}'
+                AND tgfoid=to_regproc('{function}')
+        )
+    THEN
+        -- A trigger of the same name may still execute an older function.
+        DROP TRIGGER IF EXISTS {trigger} ON {table};
+        CREATE TRIGGER {trigger}
+            AFTER {events} ON {table}
+            FOR EACH {level}{when}
+            EXECUTE FUNCTION {function}();
+    END IF;
+EXCEPTION WHEN duplicate_object THEN
+    NULL;
+END;
+$do$;
+"""
+
+_DROP_TRIGGER_FORMAT = """
+DROP TRIGGER IF EXISTS {trigger} ON {table};
+"""
+
+
+def get_create_trigger_if_not_exists(
+    table: str,
+    trigger: str,
+    events: str,
+    function: str,
+    statement=False,
+    when: Optional[str] = None,
+) -> str:
+    """
+    Unlike a drop and create, an existing trigger does not lock the table.
+    The missing table or function of a database that is not yet initialized
+    is skipped, and so is a trigger created by a concurrent node.
+    """
+
+    return _CREATE_TRIGGER_IF_NOT_EXISTS_FORMAT.format(
+        table=table,
+        trigger=trigger,
+        events=events,
+        level="STATEMENT" if statement else "ROW",
+        when=f"\n            WHEN ({when})" if when else str(),
+        function=function,
+    )
+
+
+def get_drop_trigger(table: str, trigger: str) -> str:
+    return _DROP_TRIGGER_FORMAT.format(table=table, trigger=trigger)
+
+
+def get_notify_change_trigger_name(table: str, op: str) -> str:
+    return f"{table}_{op.lower()}{TRIGGER_NOTIFY_CHANGE_SUFFIX}"
+
+
+def get_notify_change_update_condition(table: str) -> Optional[str]:
+    columns = NOTIFY_CHANGE_WATCHED_COLUMNS[table]
+    if columns is None:
+        return None
+    return " OR ".join(f"OLD.{c} IS DISTINCT FROM NEW.{c}" for c in columns)
+
+
+def get_create_notify_change_trigger(table: str, op: str) -> str:
+    # The key of a truncate is unknown, so it notifies once per statement.
+    # The updates are filtered before the function is executed.
+    update = op == CHANGE_OP_UPDATE
+    return get_create_trigger_if_not_exists(
+        table,
+        get_notify_change_trigger_name(table, op),
+        op,
+        get_notify_change_function_name(table),
+        statement=op == CHANGE_OP_TRUNCATE,
+        when=get_notify_change_update_condition(table) if update else None,
+    )
+
+
+def get_create_notify_change_triggers(
+    change_events: Mapping[str, Iterable[str]],
+) -> Tuple[str, ...]:
+    """
+    Each operation has its own trigger, so the nodes which consume different
+    operations of a table add up to the union of them.
+    """
+
+    return tuple(
+        get_create_notify_change_trigger(table, op)
+        for table, ops in sorted(change_events.items())
+        for op in sorted(ops)
+    )
+
+
+DROP_TRIGGERS = tuple(
+    get_drop_trigger(table, get_notify_change_trigger_name(table, op))
+    for table in NOTIFY_CHANGE_KEY_COLUMNS
+    for op in CHANGE_OPS
+)
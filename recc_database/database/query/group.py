@@ -4,7 +4,13 @@ from datetime import datetime
 from typing import Any, List, Optional
 
 from recc_database.chrono.datetime import tznow
-from recc_database.database.query_builder import BuildResult, UpdateBuilder
+from recc_database.database.query.jsonb import (
+    delete_jsonb_path_by_uid,
+    increment_jsonb_path_by_uid,
+    merge_jsonb_by_uid,
+    set_jsonb_path_by_uid,
+)
+from recc_database.database.query_builder import BuildResult, build_update
 from recc_database.variables.database import TABLE_GROUP, TABLE_GROUP_MEMBER
 
 INSERT_GROUP = f"""
@@ -18,10 +24,21 @@ INSERT INTO {TABLE_GROUP} (
     created_at,
     updated_at
 ) VALUES (
-    $1, $2, $3, $4, $5, $6, $7, $7
+    $1, $2, $3, $4, $5, $6, $7, $8
 ) RETURNING uid;
 """
 
+COPY_GROUP_COLUMNS = (
+    "slug",
+    "name",
+    "description",
+    "features",
+    "visibility",
+    "extra",
+    "created_at",
+    "updated_at",
+)
+
 DELETE_GROUP_BY_UID = f"""
 DELETE FROM {TABLE_GROUP}
 WHERE uid=$1;
@@ -57,22 +74,59 @@ FROM {TABLE_GROUP}
 WHERE uid=$1;
 """
 
+SELECT_GROUP_BY_UIDS = f"""
+SELECT *
+FROM {TABLE_GROUP}
+WHERE uid=ANY($1::INTEGER[]);
+"""
+
 SELECT_GROUP_BY_BELOW_VISIBILITY = f"""
 SELECT *
 FROM {TABLE_GROUP}
 WHERE visibility>=$1;
 """
 
+SELECT_GROUP_BY_FEATURES_ALL = f"""
+SELECT *
+FROM {TABLE_GROUP}
+WHERE features @> $1::VARCHAR[];
+"""
+
+SELECT_GROUP_BY_FEATURES_ANY = f"""
+SELECT *
+FROM {TABLE_GROUP}
+WHERE features && $1::VARCHAR[];
+"""
+
+SELECT_GROUP_BY_EXTRA_CONTAINS = f"""
+SELECT *
+FROM {TABLE_GROUP}
+WHERE extra @> $1::JSONB;
+"""
+
 SELECT_GROUP_ALL = f"""
 SELECT *
 FROM {TABLE_GROUP};
 """
 
+SELECT_GROUP_PAGE = f"""
+SELECT *
+FROM {TABLE_GROUP}
+WHERE uid>$1
+ORDER BY uid
+LIMIT $2;
+"""
+
 SELECT_GROUP_COUNT = f"""
 SELECT count(uid) AS count
 FROM {TABLE_GROUP};
 """
 
+MERGE_GROUP_EXTRA_BY_UID = merge_jsonb_by_uid(TABLE_GROUP, "extra")
+SET_GROUP_EXTRA_PATH_BY_UID = set_jsonb_path_by_uid(TABLE_GROUP, "extra")
+DELETE_GROUP_EXTRA_PATH_BY_UID = delete_jsonb_path_by_uid(TABLE_GROUP, "extra")
+INCREMENT_GROUP_EXTRA_PATH_BY_UID = increment_jsonb_path_by_uid(TABLE_GROUP, "extra")
+
 
 def get_update_group_query_by_uid(
     uid: int,
@@ -85,7 +139,9 @@ def get_update_group_query_by_uid(
     updated_at: Optional[datetime] = None,
 ) -> BuildResult:
     updated = updated_at if updated_at else tznow()
-    builder = UpdateBuilder(
+    return build_update(
+        TABLE_GROUP,
+        dict(uid=uid),
         if_none_skip=True,
         slug=slug,
         name=name,
@@ -95,5 +151,3 @@ def get_update_group_query_by_uid(
         extra=extra,
         updated_at=updated,
     )
-    builder.where().eq(uid=uid)
-    return builder.build(TABLE_GROUP)
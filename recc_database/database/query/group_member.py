@@ -16,6 +16,8 @@ INSERT INTO {TABLE_GROUP_MEMBER} (
 );
 """
 
+COPY_GROUP_MEMBER_COLUMNS = ("group_uid", "user_uid", "role_uid")
+
 UPDATE_GROUP_MEMBER_ROLE = f"""
 UPDATE {TABLE_GROUP_MEMBER}
 SET role_uid=$3
@@ -50,6 +52,14 @@ SELECT group_uid, user_uid, role_uid
 FROM {TABLE_GROUP_MEMBER};
 """
 
+SELECT_GROUP_MEMBER_PAGE = f"""
+SELECT *
+FROM {TABLE_GROUP_MEMBER}
+WHERE (group_uid, user_uid)>($1, $2)
+ORDER BY group_uid, user_uid
+LIMIT $3;
+"""
+
 SELECT_GROUP_MEMBER_JOIN_GROUP_BY_USER_UID = f"""
 WITH gm AS (
     SELECT *
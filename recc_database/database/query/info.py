@@ -70,6 +70,19 @@ SELECT *
 FROM {TABLE_INFO};
 """
 
+SELECT_INFO_VERSION = f"""
+SELECT count(*), max(updated_at)
+FROM {TABLE_INFO};
+"""
+
+SELECT_INFO_PAGE = f"""
+SELECT *
+FROM {TABLE_INFO}
+WHERE key>$1
+ORDER BY key
+LIMIT $2;
+"""
+
 SELECT_INFO_DB_VERSION = f"""
 SELECT version
 FROM {VIEW_INFO_DB_VERSION};
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+from typing import List, Sequence, Union
+
+JsonbPath = Union[str, int, Sequence[Union[str, int]]]
+"""
+A top-level key, or the keys and array indices from the root of the document.
+"""
+
+_MERGE_JSONB_BY_UID_FORMAT = """
+UPDATE {table}
+SET {column}=COALESCE({column}, '{{}}'::JSONB) || COALESCE($2::JSONB, '{{}}'::JSONB),
+    updated_at=$3
+WHERE uid=$1;
+"""
+
+_SET_JSONB_PATH_BY_UID_FORMAT = """
+UPDATE {table}
+SET {column}=jsonb_set(
+        COALESCE({column}, '{{}}'::JSONB),
+        $2::TEXT[],
+        COALESCE($3::JSONB, 'null'::JSONB)
+    ),
+    updated_at=$4
+WHERE uid=$1;
+"""
+
+_DELETE_JSONB_PATH_BY_UID_FORMAT = """
+UPDATE {table}
+SET {column}={column} #- $2::TEXT[], updated_at=$3
+WHERE uid=$1;
+"""
+
+_INCREMENT_JSONB_PATH_BY_UID_FORMAT = """
+UPDATE {table}
+SET {column}=jsonb_set(
+        COALESCE({column}, '{{}}'::JSONB),
+        $2::TEXT[],
+        to_jsonb(
+            COALESCE(({column} #>> $2::TEXT[])::NUMERIC, 0) + COALESCE($3::NUMERIC, 0)
+        )
+    ),
+    updated_at=$4
+WHERE uid=$1
+RETURNING {column} #> $2::TEXT[];
+"""
+
+
+def jsonb_path(path: JsonbPath) -> List[str]:
+    if isinstance(path, (str, int)):
+        return [str(path)]
+    return [str(key) for key in path]
+
+
+def merge_jsonb_by_uid(table: str, column: str) -> str:
+    """
+    Merge the top-level keys of `$2` into the column of the `$1` row.
+    """
+    return _MERGE_JSONB_BY_UID_FORMAT.format(table=table, column=column)
+
+
+def set_jsonb_path_by_uid(table: str, column: str) -> str:
+    """
+    Replace the value at the `$2` path with `$3`.
+    Only the last key of the path is created if missing.
+    """
+    return _SET_JSONB_PATH_BY_UID_FORMAT.format(table=table, column=column)
+
+
+def delete_jsonb_path_by_uid(table: str, column: str) -> str:
+    return _DELETE_JSONB_PATH_BY_UID_FORMAT.format(table=table, column=column)
+
+
+def increment_jsonb_path_by_uid(table: str, column: str) -> str:
+    """
+    Add `$3` to the number at the `$2` path, which is `0` if missing,
+    and return the new number.
+    """
+    return _INCREMENT_JSONB_PATH_BY_UID_FORMAT.format(table=table, column=column)
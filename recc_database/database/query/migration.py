@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+from recc_database.variables.database import (
+    INDEX_GROUP_EXTRA,
+    INDEX_GROUP_FEATURES,
+    INDEX_GROUP_MEMBER_ROLE_UID,
+    INDEX_GROUP_MEMBER_USER_UID,
+    INDEX_GROUP_SLUG,
+    INDEX_PIP_DOMAIN_NAME,
+    INDEX_PREFIX,
+    INDEX_PROJECT_EXTRA,
+    INDEX_PROJECT_FEATURES,
+    INDEX_PROJECT_MEMBER_ROLE_UID,
+    INDEX_PROJECT_MEMBER_USER_UID,
+    INDEX_PROJECT_SLUG,
+    INDEX_ROLE_EXTRA,
+    INDEX_ROLE_PERMISSION_PERMISSION_UID,
+    INDEX_ROLE_SLUG,
+    INDEX_TASK_EXTRA,
+    INDEX_TASK_NAME,
+    INDEX_USER_EMAIL,
+    INDEX_USER_NAME,
+    TABLE_GROUP,
+    TABLE_GROUP_MEMBER,
+    TABLE_PIP,
+    TABLE_PROJECT,
+    TABLE_PROJECT_MEMBER,
+    TABLE_ROLE,
+    TABLE_ROLE_PERMISSION,
+    TABLE_TASK,
+)
+
+SELECT_TRY_ADVISORY_LOCK = "SELECT pg_try_advisory_lock($1);"
+SELECT_ADVISORY_UNLOCK = "SELECT pg_advisory_unlock($1);"
+
+SELECT_INVALID_INDEX_NAMES = f"""
+SELECT c.relname
+FROM pg_index i
+INNER JOIN pg_class c ON i.indexrelid=c.oid
+WHERE NOT i.indisvalid AND c.relname LIKE '{INDEX_PREFIX}%';
+"""
+
+
+def get_drop_index_concurrently_query(name: str) -> str:
+    return f'DROP INDEX CONCURRENTLY IF EXISTS "{name}";'
+
+
+# ---------------------------------------------------------------
+# Version 2.2.0: Replace the redundant indices with the FK indices
+# ---------------------------------------------------------------
+
+MIGRATION_2_2_0 = (
+    f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_USER_NAME};",
+    f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_USER_EMAIL};",
+    f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_GROUP_SLUG};",
+    f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_ROLE_SLUG};",
+    f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_PROJECT_SLUG};",
+    f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_TASK_NAME};",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_GROUP_MEMBER_USER_UID}
+ON {TABLE_GROUP_MEMBER} (user_uid);
+""",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_GROUP_MEMBER_ROLE_UID}
+ON {TABLE_GROUP_MEMBER} (role_uid);
+""",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_PROJECT_MEMBER_USER_UID}
+ON {TABLE_PROJECT_MEMBER} (user_uid);
+""",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_PROJECT_MEMBER_ROLE_UID}
+ON {TABLE_PROJECT_MEMBER} (role_uid);
+""",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_ROLE_PERMISSION_PERMISSION_UID}
+ON {TABLE_ROLE_PERMISSION} (permission_uid);
+""",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_PIP_DOMAIN_NAME}
+ON {TABLE_PIP} (domain, name);
+""",
+)
+
+# --------------------------------------------------------------------
+# Version 2.3.0: GIN indices of the features arrays and extra documents
+# --------------------------------------------------------------------
+
+MIGRATION_2_3_0 = (
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_GROUP_FEATURES}
+ON {TABLE_GROUP} USING GIN (features);
+""",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_GROUP_EXTRA}
+ON {TABLE_GROUP} USING GIN (extra jsonb_path_ops);
+""",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_PROJECT_FEATURES}
+ON {TABLE_PROJECT} USING GIN (features);
+""",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_PROJECT_EXTRA}
+ON {TABLE_PROJECT} USING GIN (extra jsonb_path_ops);
+""",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_ROLE_EXTRA}
+ON {TABLE_ROLE} USING GIN (extra jsonb_path_ops);
+""",
+    f"""
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_TASK_EXTRA}
+ON {TABLE_TASK} USING GIN (extra jsonb_path_ops);
+""",
+)
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 from recc_database.variables.database import (
-    DEFAULT_PERMISSION_SLUGS,
     TABLE_PERMISSION,
     TABLE_ROLE_PERMISSION,
 )
@@ -50,6 +49,14 @@ SELECT *
 FROM {TABLE_PERMISSION};
 """
 
+SELECT_PERMISSION_PAGE = f"""
+SELECT *
+FROM {TABLE_PERMISSION}
+WHERE uid>$1
+ORDER BY uid
+LIMIT $2;
+"""
+
 SELECT_PERMISSION_BY_ROLE_UID = f"""
 SELECT *
 FROM {TABLE_PERMISSION}
@@ -60,26 +67,23 @@ WHERE uid IN (
 );
 """
 
-_SAFE_INSERT_PERMISSION_ONLY_SLUG_FORMAT = f"""
+SAFE_INSERT_PERMISSION_BY_SLUGS = f"""
 INSERT INTO {TABLE_PERMISSION} (
     slug,
     created_at
 ) SELECT
-    '{{slug}}',
+    s.slug,
     NOW()
+FROM (
+    SELECT slug, MIN(n) AS n
+    FROM unnest($1::text[]) WITH ORDINALITY AS u(slug, n)
+    GROUP BY slug
+) s
 WHERE
     NOT EXISTS (
         SELECT *
         FROM {TABLE_PERMISSION}
-        WHERE slug='{{slug}}'
-    );
+        WHERE slug=s.slug
+    )
+ORDER BY s.n;
 """
-
-
-def safe_insert_permission_only_slug(slug: str) -> str:
-    return _SAFE_INSERT_PERMISSION_ONLY_SLUG_FORMAT.format(slug=slug)
-
-
-INSERT_PERMISSION_DEFAULTS = list(
-    map(lambda x: safe_insert_permission_only_slug(x), DEFAULT_PERMISSION_SLUGS)
-)
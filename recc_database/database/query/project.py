@@ -3,10 +3,17 @@
 from datetime import datetime
 from typing import Any, List, Optional
 
-from recc_database.database.query_builder import BuildResult, UpdateBuilder
+from recc_database.database.query.jsonb import (
+    delete_jsonb_path_by_uid,
+    increment_jsonb_path_by_uid,
+    merge_jsonb_by_uid,
+    set_jsonb_path_by_uid,
+)
+from recc_database.database.query_builder import BuildResult, build_update
 from recc_database.variables.database import (
     TABLE_GROUP_MEMBER,
     TABLE_PROJECT,
+    TABLE_PROJECT_ACCESS,
     TABLE_PROJECT_MEMBER,
 )
 
@@ -22,10 +29,22 @@ INSERT INTO {TABLE_PROJECT} (
     created_at,
     updated_at
 ) VALUES (
-    $1, $2, $3, $4, $5, $6, $7, $8, $8
+    $1, $2, $3, $4, $5, $6, $7, $8, $9
 ) RETURNING uid;
 """
 
+COPY_PROJECT_COLUMNS = (
+    "group_uid",
+    "slug",
+    "name",
+    "description",
+    "features",
+    "visibility",
+    "extra",
+    "created_at",
+    "updated_at",
+)
+
 DELETE_PROJECT_BY_UID = f"""
 DELETE FROM {TABLE_PROJECT}
 WHERE uid=$1;
@@ -43,6 +62,12 @@ FROM {TABLE_PROJECT}
 WHERE uid=$1;
 """
 
+SELECT_PROJECT_BY_UIDS = f"""
+SELECT *
+FROM {TABLE_PROJECT}
+WHERE uid=ANY($1::INTEGER[]);
+"""
+
 SELECT_PROJECT_BY_GROUP_ID = f"""
 SELECT *
 FROM {TABLE_PROJECT}
@@ -55,11 +80,37 @@ FROM {TABLE_PROJECT}
 WHERE visibility>=$1;
 """
 
+SELECT_PROJECT_BY_FEATURES_ALL = f"""
+SELECT *
+FROM {TABLE_PROJECT}
+WHERE features @> $1::VARCHAR[];
+"""
+
+SELECT_PROJECT_BY_FEATURES_ANY = f"""
+SELECT *
+FROM {TABLE_PROJECT}
+WHERE features && $1::VARCHAR[];
+"""
+
+SELECT_PROJECT_BY_EXTRA_CONTAINS = f"""
+SELECT *
+FROM {TABLE_PROJECT}
+WHERE extra @> $1::JSONB;
+"""
+
 SELECT_PROJECT_ALL = f"""
 SELECT *
 FROM {TABLE_PROJECT};
 """
 
+SELECT_PROJECT_PAGE = f"""
+SELECT *
+FROM {TABLE_PROJECT}
+WHERE uid>$1
+ORDER BY uid
+LIMIT $2;
+"""
+
 SELECT_PROJECT_COUNT = f"""
 SELECT count(uid) AS count
 FROM {TABLE_PROJECT};
@@ -69,17 +120,33 @@ SELECT_PROJECT_BY_USER_UID = f"""
 SELECT *
 FROM {TABLE_PROJECT}
 WHERE uid IN (
-        SELECT project_uid
-        FROM {TABLE_PROJECT_MEMBER}
-        WHERE user_uid=$1
-    ) OR group_uid IN (
-        SELECT group_uid
-        FROM {TABLE_GROUP_MEMBER}
-        WHERE user_uid=$1
-    )
-GROUP BY uid;
+    SELECT project_uid
+    FROM {TABLE_PROJECT_MEMBER}
+    WHERE user_uid=$1
+    UNION
+    SELECT p.uid
+    FROM {TABLE_GROUP_MEMBER} gm
+    INNER JOIN {TABLE_PROJECT} p ON p.group_uid=gm.group_uid
+    WHERE gm.user_uid=$1
+)
+ORDER BY uid;
 """
 
+SELECT_PROJECT_BY_USER_UID_FROM_ACCESS = f"""
+SELECT p.*
+FROM {TABLE_PROJECT_ACCESS} a
+INNER JOIN {TABLE_PROJECT} p ON p.uid=a.project_uid
+WHERE a.user_uid=$1
+ORDER BY p.uid;
+"""
+
+MERGE_PROJECT_EXTRA_BY_UID = merge_jsonb_by_uid(TABLE_PROJECT, "extra")
+SET_PROJECT_EXTRA_PATH_BY_UID = set_jsonb_path_by_uid(TABLE_PROJECT, "extra")
+DELETE_PROJECT_EXTRA_PATH_BY_UID = delete_jsonb_path_by_uid(TABLE_PROJECT, "extra")
+INCREMENT_PROJECT_EXTRA_PATH_BY_UID = increment_jsonb_path_by_uid(
+    TABLE_PROJECT, "extra"
+)
+
 
 def get_update_project_query_by_uid(
     uid: Optional[int] = None,
@@ -92,7 +159,9 @@ def get_update_project_query_by_uid(
     updated_at: Optional[datetime] = None,
 ) -> BuildResult:
     assert updated_at is not None
-    builder = UpdateBuilder(
+    return build_update(
+        TABLE_PROJECT,
+        dict(uid=uid),
         if_none_skip=True,
         slug=slug,
         name=name,
@@ -102,5 +171,3 @@ def get_update_project_query_by_uid(
         extra=extra,
         updated_at=updated_at,
     )
-    builder.where().eq(uid=uid)
-    return builder.build(TABLE_PROJECT)
@@ -12,6 +12,8 @@ INSERT INTO {TABLE_PROJECT_MEMBER} (
 );
 """
 
+COPY_PROJECT_MEMBER_COLUMNS = ("project_uid", "user_uid", "role_uid")
+
 UPDATE_PROJECT_MEMBER_ROLE = f"""
 UPDATE {TABLE_PROJECT_MEMBER}
 SET role_uid=$3
@@ -45,3 +47,11 @@ SELECT_PROJECT_MEMBER_ALL = f"""
 SELECT *
 FROM {TABLE_PROJECT_MEMBER};
 """
+
+SELECT_PROJECT_MEMBER_PAGE = f"""
+SELECT *
+FROM {TABLE_PROJECT_MEMBER}
+WHERE (project_uid, user_uid)>($1, $2)
+ORDER BY project_uid, user_uid
+LIMIT $3;
+"""
@@ -4,7 +4,13 @@ from datetime import datetime
 from typing import Any, Optional
 
 from recc_database.chrono.datetime import tznow
-from recc_database.database.query_builder import BuildResult, UpdateBuilder
+from recc_database.database.query.jsonb import (
+    delete_jsonb_path_by_uid,
+    increment_jsonb_path_by_uid,
+    merge_jsonb_by_uid,
+    set_jsonb_path_by_uid,
+)
+from recc_database.database.query_builder import BuildResult, build_update
 from recc_database.variables.database import (
     ROLE_SLUG_DEVELOPER,
     ROLE_SLUG_GUEST,
@@ -48,6 +54,12 @@ FROM {TABLE_ROLE}
 WHERE uid=$1;
 """
 
+SELECT_ROLE_SLUG_BY_UIDS = f"""
+SELECT uid, slug
+FROM {TABLE_ROLE}
+WHERE uid=ANY($1::INTEGER[]);
+"""
+
 SELECT_ROLE_BY_UID = f"""
 SELECT *
 FROM {TABLE_ROLE}
@@ -60,11 +72,25 @@ FROM {TABLE_ROLE}
 WHERE uid=$1;
 """
 
+SELECT_ROLE_BY_EXTRA_CONTAINS = f"""
+SELECT *
+FROM {TABLE_ROLE}
+WHERE extra @> $1::JSONB;
+"""
+
 SELECT_ROLE_ALL = f"""
 SELECT *
 FROM {TABLE_ROLE};
 """
 
+SELECT_ROLE_PAGE = f"""
+SELECT *
+FROM {TABLE_ROLE}
+WHERE uid>$1
+ORDER BY uid
+LIMIT $2;
+"""
+
 EXISTS_ROLE_BY_UID = f"""
 SELECT EXISTS(
     SELECT *
@@ -140,6 +166,12 @@ INSERT_ROLE_DEFAULTS = (
 )
 
 
+MERGE_ROLE_EXTRA_BY_UID = merge_jsonb_by_uid(TABLE_ROLE, "extra")
+SET_ROLE_EXTRA_PATH_BY_UID = set_jsonb_path_by_uid(TABLE_ROLE, "extra")
+DELETE_ROLE_EXTRA_PATH_BY_UID = delete_jsonb_path_by_uid(TABLE_ROLE, "extra")
+INCREMENT_ROLE_EXTRA_PATH_BY_UID = increment_jsonb_path_by_uid(TABLE_ROLE, "extra")
+
+
 def get_update_role_query_by_uid(
     uid: int,
     slug: Optional[str] = None,
@@ -151,7 +183,9 @@ def get_update_role_query_by_uid(
     updated_at: Optional[datetime] = None,
 ) -> BuildResult:
     updated = updated_at if updated_at else tznow()
-    builder = UpdateBuilder(
+    return build_update(
+        TABLE_ROLE,
+        dict(uid=uid),
         if_none_skip=True,
         slug=slug,
         name=name,
@@ -161,5 +195,3 @@ def get_update_role_query_by_uid(
         lock=lock,
         updated_at=updated,
     )
-    builder.where().eq(uid=uid)
-    return builder.build(TABLE_ROLE)
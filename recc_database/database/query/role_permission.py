@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from typing import Iterable, List, Optional, Union
+from typing import Iterable, List, Optional, Tuple
 
 from recc_database.variables.database import (
     DEFAULT_ROLE_PERMISSIONS_MAP,
@@ -40,97 +40,118 @@ FROM {TABLE_ROLE_PERMISSION}
 WHERE role_uid=$1;
 """
 
-_DELETE_ROLE_PERMISSION_BY_ROLE_UID_FORMAT = f"""
+DELETE_ROLE_PERMISSION_BY_ROLE_UID = f"""
 DELETE FROM {TABLE_ROLE_PERMISSION}
-WHERE role_uid={{role_uid}};
+WHERE role_uid=$1;
 """
 
-_SAFE_INSERT_ROLE_PERMISSION_BY_PERMISSION_SLUG_FORMAT = f"""
+SAFE_INSERT_ROLE_PERMISSION_BY_ROLE_UID_AND_PERMISSION_SLUGS = f"""
 INSERT INTO {TABLE_ROLE_PERMISSION} (
     role_uid,
     permission_uid
 ) SELECT
-    {{role_uid}},
-    (SELECT uid FROM {TABLE_PERMISSION} WHERE slug='{{permission_slug}}')
+    $1,
+    p.uid
+FROM {TABLE_PERMISSION} p
 WHERE
-    NOT EXISTS (
+    p.slug IN (SELECT unnest($2::text[]))
+    AND NOT EXISTS (
         SELECT *
         FROM {TABLE_ROLE_PERMISSION}
-        WHERE
-            role_uid={{role_uid}}
-            AND permission_uid=(
-                SELECT uid
-                FROM {TABLE_PERMISSION}
-                WHERE slug='{{permission_slug}}'
-            )
+        WHERE role_uid=$1 AND permission_uid=p.uid
     );
 """
 
-_SAFE_INSERT_ROLE_PERMISSION_BY_ONLY_SLUG_FORMAT = f"""
+SAFE_INSERT_ROLE_PERMISSION_BY_ROLE_SLUG_AND_PERMISSION_SLUGS = f"""
 INSERT INTO {TABLE_ROLE_PERMISSION} (
     role_uid,
     permission_uid
 ) SELECT
-    (SELECT uid FROM {TABLE_ROLE} WHERE slug='{{role_slug}}'),
-    (SELECT uid FROM {TABLE_PERMISSION} WHERE slug='{{permission_slug}}')
+    r.uid,
+    p.uid
+FROM {TABLE_ROLE} r, {TABLE_PERMISSION} p
 WHERE
-    NOT EXISTS (
+    r.slug=$1
+    AND p.slug IN (SELECT unnest($2::text[]))
+    AND NOT EXISTS (
         SELECT *
         FROM {TABLE_ROLE_PERMISSION}
-        WHERE
-            role_uid=(
-                SELECT uid
-                FROM {TABLE_ROLE}
-                WHERE slug='{{role_slug}}'
-            )
-            AND permission_uid=(
-                SELECT uid
-                FROM {TABLE_PERMISSION}
-                WHERE slug='{{permission_slug}}'
-            )
+        WHERE role_uid=r.uid AND permission_uid=p.uid
     );
 """
 
+SAFE_INSERT_ROLE_PERMISSION_BY_SLUG_PAIRS = f"""
+INSERT INTO {TABLE_ROLE_PERMISSION} (
+    role_uid,
+    permission_uid
+) SELECT DISTINCT
+    r.uid,
+    p.uid
+FROM unnest($1::text[], $2::text[]) AS s(role_slug, permission_slug)
+JOIN {TABLE_ROLE} r ON r.slug=s.role_slug
+JOIN {TABLE_PERMISSION} p ON p.slug=s.permission_slug
+WHERE
+    NOT EXISTS (
+        SELECT *
+        FROM {TABLE_ROLE_PERMISSION}
+        WHERE role_uid=r.uid AND permission_uid=p.uid
+    );
+"""
 
-def delete_role_permission_by_role_uid(role_uid: int) -> str:
-    return _DELETE_ROLE_PERMISSION_BY_ROLE_UID_FORMAT.format(role_uid=role_uid)
-
-
-def safe_insert_role_permission_by_slug(
-    role_uid_or_slug: Union[int, str],
-    permission_slug: str,
-) -> str:
-    if isinstance(role_uid_or_slug, int):
-        return _SAFE_INSERT_ROLE_PERMISSION_BY_PERMISSION_SLUG_FORMAT.format(
-            role_uid=role_uid_or_slug,
-            permission_slug=permission_slug,
-        )
-    else:
-        assert isinstance(role_uid_or_slug, str)
-        return _SAFE_INSERT_ROLE_PERMISSION_BY_ONLY_SLUG_FORMAT.format(
-            role_slug=role_uid_or_slug,
-            permission_slug=permission_slug,
+# Both statements of the CTE see the same snapshot,
+# so only the permissions missing from the new set are deleted.
+UPDATE_ROLE_PERMISSION_BY_ROLE_UID_AND_PERMISSION_SLUGS = f"""
+WITH deleted AS (
+    DELETE FROM {TABLE_ROLE_PERMISSION}
+    WHERE
+        role_uid=$1
+        AND permission_uid NOT IN (
+            SELECT uid
+            FROM {TABLE_PERMISSION}
+            WHERE slug IN (SELECT unnest($2::text[]))
         )
+)
+INSERT INTO {TABLE_ROLE_PERMISSION} (
+    role_uid,
+    permission_uid
+) SELECT
+    $1,
+    p.uid
+FROM {TABLE_PERMISSION} p
+WHERE
+    p.slug IN (SELECT unnest($2::text[]))
+    AND NOT EXISTS (
+        SELECT *
+        FROM {TABLE_ROLE_PERMISSION}
+        WHERE role_uid=$1 AND permission_uid=p.uid
+    );
+"""
+
+RolePermissionSlugPairs = Tuple[List[str], List[str]]
+"""
+(role_slugs, permission_slugs)
+"""
 
 
-def safe_insert_role_permissions(**kwargs: Iterable[str]) -> List[str]:
-    result = list()
+def get_role_permission_slug_pairs(**kwargs: Iterable[str]) -> RolePermissionSlugPairs:
+    role_slugs = list()
+    permission_slugs = list()
     for role_slug, permissions in kwargs.items():
         assert isinstance(role_slug, str)
         for permission_slug in permissions:
             assert isinstance(permission_slug, str)
-            query = safe_insert_role_permission_by_slug(role_slug, permission_slug)
-            result.append(query)
-    return result
+            role_slugs.append(role_slug)
+            permission_slugs.append(permission_slug)
+    return role_slugs, permission_slugs
 
 
-def safe_insert_role_permissions_for_defaults(
+def get_role_permission_slug_pairs_for_defaults(
     owner: Optional[Iterable[str]] = None,
     maintainer: Optional[Iterable[str]] = None,
     developer: Optional[Iterable[str]] = None,
     reporter: Optional[Iterable[str]] = None,
     guest: Optional[Iterable[str]] = None,
-) -> List[str]:
+) -> RolePermissionSlugPairs:
     permissions = dict()
     if owner:
         permissions[ROLE_SLUG_OWNER] = owner
@@ -142,11 +163,9 @@ def safe_insert_role_permissions_for_defaults(
         permissions[ROLE_SLUG_REPORTER] = reporter
     if guest:
         permissions[ROLE_SLUG_GUEST] = guest
-    return safe_insert_role_permissions(**permissions)
-
+    return get_role_permission_slug_pairs(**permissions)
 
-def _default_safe_insert_role_permissions() -> List[str]:
-    return safe_insert_role_permissions(**DEFAULT_ROLE_PERMISSIONS_MAP)
 
-
-DEFAULT_INSERT_ROLE_PERMISSIONS = _default_safe_insert_role_permissions()
+DEFAULT_ROLE_PERMISSION_SLUG_PAIRS = get_role_permission_slug_pairs(
+    **DEFAULT_ROLE_PERMISSIONS_MAP
+)
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+SELECT_NEXT_SERIAL_UIDS = """
+SELECT nextval(pg_get_serial_sequence($1, 'uid'))::INTEGER
+FROM generate_series(1, $2);
+"""
@@ -4,7 +4,13 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 from recc_database.chrono.datetime import tznow
-from recc_database.database.query_builder import BuildResult, UpdateBuilder
+from recc_database.database.query.jsonb import (
+    delete_jsonb_path_by_uid,
+    increment_jsonb_path_by_uid,
+    merge_jsonb_by_uid,
+    set_jsonb_path_by_uid,
+)
+from recc_database.database.query_builder import BuildResult, build_update
 from recc_database.variables.database import TABLE_GROUP, TABLE_PROJECT, TABLE_TASK
 
 INSERT_TASK = f"""
@@ -25,10 +31,28 @@ INSERT INTO {TABLE_TASK} (
     created_at,
     updated_at
 ) VALUES (
-    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $14
+    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15
 ) RETURNING uid;
 """
 
+COPY_TASK_COLUMNS = (
+    "project_uid",
+    "slug",
+    "name",
+    "description",
+    "extra",
+    "rpc_address",
+    "auth_algorithm",
+    "private_key",
+    "public_key",
+    "maximum_restart_count",
+    "numa_memory_nodes",
+    "base_image_name",
+    "publish_ports",
+    "created_at",
+    "updated_at",
+)
+
 UPDATE_TASK_DESCRIPTION_BY_UID = f"""
 UPDATE {TABLE_TASK}
 SET description=$2, updated_at=$3
@@ -53,6 +77,20 @@ SET extra=$3, updated_at=$4
 WHERE project_uid=$1 AND slug=$2;
 """
 
+MERGE_TASK_EXTRA_BY_UID = merge_jsonb_by_uid(TABLE_TASK, "extra")
+SET_TASK_EXTRA_PATH_BY_UID = set_jsonb_path_by_uid(TABLE_TASK, "extra")
+DELETE_TASK_EXTRA_PATH_BY_UID = delete_jsonb_path_by_uid(TABLE_TASK, "extra")
+INCREMENT_TASK_EXTRA_PATH_BY_UID = increment_jsonb_path_by_uid(TABLE_TASK, "extra")
+
+MERGE_TASK_PUBLISH_PORTS_BY_UID = merge_jsonb_by_uid(TABLE_TASK, "publish_ports")
+SET_TASK_PUBLISH_PORTS_PATH_BY_UID = set_jsonb_path_by_uid(TABLE_TASK, "publish_ports")
+DELETE_TASK_PUBLISH_PORTS_PATH_BY_UID = delete_jsonb_path_by_uid(
+    TABLE_TASK, "publish_ports"
+)
+INCREMENT_TASK_PUBLISH_PORTS_PATH_BY_UID = increment_jsonb_path_by_uid(
+    TABLE_TASK, "publish_ports"
+)
+
 UPDATE_TASK_KEYS_BY_UID = f"""
 UPDATE {TABLE_TASK}
 SET auth_algorithm=$2, private_key=$3, public_key=$4, updated_at=$5
@@ -81,6 +119,12 @@ FROM {TABLE_TASK}
 WHERE uid=$1;
 """
 
+SELECT_TASK_BY_UIDS = f"""
+SELECT *
+FROM {TABLE_TASK}
+WHERE uid=ANY($1::INTEGER[]);
+"""
+
 SELECT_TASK_BY_PROJECT_ID_AND_SLUG = f"""
 SELECT *
 FROM {TABLE_TASK}
@@ -99,6 +143,12 @@ FROM {TABLE_TASK}
 WHERE project_uid=$1;
 """
 
+SELECT_TASK_BY_EXTRA_CONTAINS = f"""
+SELECT *
+FROM {TABLE_TASK}
+WHERE extra @> $1::JSONB;
+"""
+
 SELECT_TASK_BY_FULLPATH = f"""
 WITH rg AS (
     SELECT uid
@@ -129,6 +179,14 @@ FROM {TABLE_TASK} t, rp
 WHERE t.project_uid=rp.uid AND t.slug=$3;
 """
 
+SELECT_TASK_PATH_UIDS_BY_FULLPATH = f"""
+SELECT t.uid, g.uid AS group_uid, p.uid AS project_uid
+FROM {TABLE_GROUP} g
+JOIN {TABLE_PROJECT} p ON p.group_uid=g.uid
+JOIN {TABLE_TASK} t ON t.project_uid=p.uid
+WHERE g.slug=$1 AND p.slug=$2 AND t.slug=$3;
+"""
+
 
 def get_update_task_query_by_uid(
     uid: int,
@@ -147,7 +205,9 @@ def get_update_task_query_by_uid(
     updated_at: Optional[datetime] = None,
 ) -> BuildResult:
     updated = updated_at if updated_at else tznow()
-    builder = UpdateBuilder(
+    return build_update(
+        TABLE_TASK,
+        dict(uid=uid),
         if_none_skip=True,
         slug=slug,
         name=name,
@@ -163,5 +223,3 @@ def get_update_task_query_by_uid(
         publish_ports=publish_ports,
         updated_at=updated,
     )
-    builder.where().eq(uid=uid)
-    return builder.build(TABLE_TASK)
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional
 
 from recc_database.chrono.datetime import tznow
-from recc_database.database.query_builder import BuildResult, UpdateBuilder
+from recc_database.database.query_builder import BuildResult, build_update
 from recc_database.variables.database import (
     TABLE_GROUP_MEMBER,
     TABLE_PROJECT_MEMBER,
@@ -38,10 +38,25 @@ INSERT INTO {TABLE_USER} (
     $9,
     $10,
     $11,
-    $11
+    $12
 ) RETURNING uid;
 """
 
+COPY_USER_COLUMNS = (
+    "username",
+    "password",
+    "salt",
+    "nickname",
+    "email",
+    "phone",
+    "admin",
+    "dark",
+    "lang",
+    "timezone",
+    "created_at",
+    "updated_at",
+)
+
 UPDATE_USER_LAST_LOGIN_BY_UID = f"""
 UPDATE
     {TABLE_USER}
@@ -88,6 +103,12 @@ FROM {TABLE_USER}
 WHERE uid=$1;
 """
 
+SELECT_USER_USERNAME_BY_UIDS = f"""
+SELECT uid, username
+FROM {TABLE_USER}
+WHERE uid=ANY($1::INTEGER[]);
+"""
+
 SELECT_USER_UID_BY_USERNAME = f"""
 SELECT uid
 FROM {TABLE_USER}
@@ -114,11 +135,25 @@ FROM {TABLE_USER}
 WHERE uid=$1;
 """
 
+SELECT_USER_BY_UIDS = f"""
+SELECT *
+FROM {TABLE_USER}
+WHERE uid=ANY($1::INTEGER[]);
+"""
+
 SELECT_USER_ALL = f"""
 SELECT *
 FROM {TABLE_USER};
 """
 
+SELECT_USER_PAGE = f"""
+SELECT *
+FROM {TABLE_USER}
+WHERE uid>$1
+ORDER BY uid
+LIMIT $2;
+"""
+
 SELECT_USER_USERNAME = f"""
 SELECT username
 FROM {TABLE_USER};
@@ -148,7 +183,9 @@ def get_update_user_query_by_uid(
     updated_at: Optional[datetime] = None,
 ) -> BuildResult:
     updated = updated_at if updated_at else tznow()
-    builder = UpdateBuilder(
+    return build_update(
+        TABLE_USER,
+        dict(uid=uid),
         if_none_skip=True,
         username=username,
         nickname=nickname,
@@ -160,5 +197,3 @@ def get_update_user_query_by_uid(
         timezone=timezone,
         updated_at=updated,
     )
-    builder.where().eq(uid=uid)
-    return builder.build(TABLE_USER)
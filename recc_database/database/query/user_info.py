@@ -14,6 +14,8 @@ INSERT INTO {TABLE_USER_INFO} (
 );
 """
 
+COPY_USER_INFO_COLUMNS = ("user_uid", "key", "value", "created_at", "updated_at")
+
 UPSERT_USER_INFO = f"""
 INSERT INTO {TABLE_USER_INFO} (
     user_uid,
@@ -31,6 +33,24 @@ INSERT INTO {TABLE_USER_INFO} (
     updated_at=$4;
 """
 
+UPSERT_USER_INFOS = f"""
+INSERT INTO {TABLE_USER_INFO} (
+    user_uid,
+    key,
+    value,
+    created_at,
+    updated_at
+) SELECT
+    $1, k, v, $4, $4
+FROM unnest($2::VARCHAR[], $3::VARCHAR[]) AS t(k, v)
+ON CONFLICT (
+    user_uid,
+    key
+) DO UPDATE SET
+    value=EXCLUDED.value,
+    updated_at=EXCLUDED.updated_at;
+"""
+
 UPDATE_USER_INFO_VALUE_BY_KEY = f"""
 UPDATE {TABLE_USER_INFO}
 SET value=$3, updated_at=$4
@@ -42,6 +62,11 @@ DELETE FROM {TABLE_USER_INFO}
 WHERE user_uid=$1 AND key=$2;
 """
 
+DELETE_USER_INFO_BY_KEYS = f"""
+DELETE FROM {TABLE_USER_INFO}
+WHERE user_uid=$1 AND key=ANY($2::VARCHAR[]);
+"""
+
 EXISTS_USER_INFO_BY_KEY = f"""
 SELECT EXISTS (
     SELECT *
@@ -62,6 +87,12 @@ FROM {TABLE_USER_INFO}
 WHERE user_uid=$1 AND key=$2;
 """
 
+SELECT_USER_INFO_BY_KEYS = f"""
+SELECT *
+FROM {TABLE_USER_INFO}
+WHERE user_uid=$1 AND key=ANY($2::VARCHAR[]);
+"""
+
 SELECT_USER_INFO_BY_KEY_LIKE = f"""
 SELECT *
 FROM {TABLE_USER_INFO}
@@ -1,13 +1,22 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, List, Tuple
+from functools import lru_cache
+from typing import Any, List, Mapping, Tuple
+
+from recc_database.variables.database import DATABASE_UPDATE_QUERY_CACHE_SIZE
 
 QueryString = str
 Arguments = List[Any]
 BuildResult = Tuple[QueryString, Arguments]
 
+ColumnShape = Tuple[Tuple[str, bool], ...]
+"""
+The `(column, is_null)` of each column, in the order of the statement.
+"""
+
 NO_SKIP_NULL_IN_WHERE = False
 """
 NULLs in the where clause are not skipped.
@@ -171,3 +180,94 @@ class UpdateBuilder(QueryBuilder):
             f"UPDATE {table_name} SET {self.values} WHERE {self.wheres};",
             self.arguments,
         )
+
+
+@dataclass(frozen=True)
+class CompiledUpdate:
+    """
+    An UPDATE statement for one shape of the SET and WHERE columns.
+
+    The WHERE columns are compared with `=` and joined by `AND`.
+    The NULL columns are written into the statement and take no argument.
+    """
+
+    query: QueryString
+    set_columns: Tuple[str, ...]
+    where_columns: Tuple[str, ...]
+    """
+    The columns bound as arguments, in the order of the placeholders.
+    """
+
+    def bind(self, values: Mapping[str, Any], wheres: Mapping[str, Any]) -> Arguments:
+        return [values[c] for c in self.set_columns] + [
+            wheres[c] for c in self.where_columns
+        ]
+
+
+def _column_shape(items: Mapping[str, Any]) -> ColumnShape:
+    return tuple((key, value is None) for key, value in items.items())
+
+
+@lru_cache(maxsize=DATABASE_UPDATE_QUERY_CACHE_SIZE)
+def compile_update(
+    table_name: str, set_shape: ColumnShape, where_shape: ColumnShape
+) -> CompiledUpdate:
+    """
+    The statement is the same text as the one :class:`UpdateBuilder` builds.
+    """
+
+    if not set_shape:
+        raise ValueError("There are no columns to update")
+    if not where_shape:
+        raise ValueError("There are no columns to compare")
+
+    index = 0
+    values = list()
+    set_columns = list()
+    for key, is_null in set_shape:
+        if is_null:
+            values.append(f"{key}=NULL")
+        else:
+            index += 1
+            values.append(f"{key}=${index}")
+            set_columns.append(key)
+
+    wheres = list()
+    where_columns = list()
+    for key, is_null in where_shape:
+        if is_null:
+            wheres.append(f"{key} IS NULL")
+        else:
+            index += 1
+            wheres.append(f"{key} = ${index}")
+            where_columns.append(key)
+
+    set_clause = ",".join(values)
+    where_clause = " AND ".join(wheres)
+    return CompiledUpdate(
+        f"UPDATE {table_name} SET {set_clause} WHERE {where_clause};",
+        tuple(set_columns),
+        tuple(where_columns),
+    )
+
+
+def build_update(
+    table_name: str,
+    wheres: Mapping[str, Any],
+    if_none_skip=False,
+    **kwargs,
+) -> BuildResult:
+    """
+    A cached equivalent of :class:`UpdateBuilder` with `eq()` conditions only.
+
+    .. code-block:: python
+
+        build_update("users", dict(uid=1), if_none_skip=True, email=email)
+    """
+
+    if if_none_skip:
+        values = {k: v for k, v in kwargs.items() if v is not None}
+    else:
+        values = kwargs
+    compiled = compile_update(table_name, _column_shape(values), _column_shape(wheres))
+    return compiled.query, compiled.bind(values, wheres)
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+from types import ModuleType
+from typing import Dict, Optional
+
+from recc_database.database.query import (
+    group,
+    group_member,
+    info,
+    permission,
+    pip,
+    project,
+    project_member,
+    role,
+    role_permission,
+    serial,
+    task,
+    user,
+    user_info,
+)
+from recc_database.database.query.group import (
+    SELECT_GROUP_BY_UID,
+    SELECT_GROUP_UID_BY_SLUG,
+)
+from recc_database.database.query.group_member import (
+    SELECT_GROUP_MEMBER_BY_GROUP_UID_AND_USER_UID,
+)
+from recc_database.database.query.info import SELECT_INFO_BY_KEY
+from recc_database.database.query.permission import SELECT_PERMISSION_UID_BY_SLUG
+from recc_database.database.query.project import (
+    SELECT_PROJECT_BY_UID,
+    SELECT_PROJECT_BY_USER_UID,
+    SELECT_PROJECT_UID_BY_GROUP_UID_AND_SLUG,
+)
+from recc_database.database.query.project_member import (
+    SELECT_PROJECT_MEMBER_BY_PROJECT_UID_AND_USER_UID,
+)
+from recc_database.database.query.role import SELECT_ROLE_UID_BY_SLUG
+from recc_database.database.query.task import (
+    SELECT_TASK_BY_FULLPATH,
+    SELECT_TASK_BY_UID,
+    SELECT_TASK_PATH_UIDS_BY_FULLPATH,
+    SELECT_TASK_UID_BY_FULLPATH,
+)
+from recc_database.database.query.user import (
+    SELECT_USER_BY_UID,
+    SELECT_USER_PASSWORD_AND_SALT_BY_UID,
+    SELECT_USER_UID_BY_USERNAME,
+    SELECT_USER_USERNAME_BY_UID,
+    UPDATE_USER_LAST_LOGIN_BY_UID,
+)
+from recc_database.database.query.user_info import SELECT_USER_INFO_BY_KEY
+from recc_database.database.query_utils import SQL_SEQUENCE_POINT
+
+QUERY_MODULES = (
+    group,
+    group_member,
+    info,
+    permission,
+    pip,
+    project,
+    project_member,
+    role,
+    role_permission,
+    serial,
+    task,
+    user,
+    user_info,
+)
+
+_PREPARABLE_KEYWORDS = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+def is_preparable(query: str) -> bool:
+    """
+    Only a single DML statement can be prepared.
+    """
+
+    statement = query.strip()
+    if statement.endswith(SQL_SEQUENCE_POINT):
+        statement = statement[:-1]
+    if SQL_SEQUENCE_POINT in statement:
+        return False
+    keyword = statement.split(maxsplit=1)[0].upper() if statement else str()
+    return keyword in _PREPARABLE_KEYWORDS
+
+
+def collect_queries(*modules: ModuleType) -> Dict[str, str]:
+    """
+    Collect the public, module-level query constants.
+
+    :return: A mapping of the constant name to the query text.
+    """
+
+    result: Dict[str, str] = dict()
+    for module in modules:
+        for name, value in vars(module).items():
+            if name.startswith("_") or not name.isupper():
+                continue
+            if not isinstance(value, str) or not is_preparable(value):
+                continue
+            if name in result and result[name] != value:
+                raise KeyError(f"Duplicate query name: '{name}'")
+            result[name] = value
+    return result
+
+
+REGISTERED_QUERIES = collect_queries(*QUERY_MODULES)
+"""
+Name to query text of every statement that is prepared on demand.
+"""
+
+_QUERY_NAMES = {query: name for name, query in REGISTERED_QUERIES.items()}
+
+HOT_QUERIES = (
+    SELECT_USER_UID_BY_USERNAME,
+    SELECT_USER_USERNAME_BY_UID,
+    SELECT_USER_PASSWORD_AND_SALT_BY_UID,
+    SELECT_USER_BY_UID,
+    UPDATE_USER_LAST_LOGIN_BY_UID,
+    SELECT_GROUP_UID_BY_SLUG,
+    SELECT_GROUP_BY_UID,
+    SELECT_GROUP_MEMBER_BY_GROUP_UID_AND_USER_UID,
+    SELECT_PROJECT_UID_BY_GROUP_UID_AND_SLUG,
+    SELECT_PROJECT_BY_UID,
+    SELECT_PROJECT_BY_USER_UID,
+    SELECT_PROJECT_MEMBER_BY_PROJECT_UID_AND_USER_UID,
+    SELECT_TASK_UID_BY_FULLPATH,
+    SELECT_TASK_PATH_UIDS_BY_FULLPATH,
+    SELECT_TASK_BY_FULLPATH,
+    SELECT_TASK_BY_UID,
+    SELECT_ROLE_UID_BY_SLUG,
+    SELECT_PERMISSION_UID_BY_SLUG,
+    SELECT_INFO_BY_KEY,
+    SELECT_USER_INFO_BY_KEY,
+)
+"""
+Statements prepared on every new pool connection.
+"""
+
+assert all(query in _QUERY_NAMES for query in HOT_QUERIES)
+
+
+def is_registered_query(query: str) -> bool:
+    return query in _QUERY_NAMES
+
+
+def get_query_name(query: str) -> Optional[str]:
+    return _QUERY_NAMES.get(query)
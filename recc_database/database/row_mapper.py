@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import MISSING, fields, is_dataclass
+from functools import lru_cache
+from keyword import iskeyword
+from typing import Any, Callable, Dict, Tuple, Type, TypeVar, cast
+
+PacketType = TypeVar("PacketType")
+RowMapper = Callable[[Any], Any]
+
+_ROW_MAPPER_CACHE_SIZE = 1024
+
+
+def _kwargs_mapper(cls: type) -> RowMapper:
+    return lambda row: cls(**row)
+
+
+def _is_identifier(name: str) -> bool:
+    return name.isidentifier() and not iskeyword(name)
+
+
+def _compile_dataclass_mapper(cls: type, columns: Tuple[str, ...]) -> RowMapper:
+    if getattr(cls, "__dataclass_params__").frozen:
+        return _kwargs_mapper(cls)
+
+    items = fields(cls)
+    if any(not f.init for f in items):
+        return _kwargs_mapper(cls)
+
+    names = set(f.name for f in items)
+    if len(set(columns)) != len(columns):
+        return _kwargs_mapper(cls)
+    if not all(_is_identifier(c) and c in names for c in columns):
+        # Let the constructor raise the same error as before.
+        return _kwargs_mapper(cls)
+
+    namespace: Dict[str, Any] = {"_new": object.__new__, "_cls": cls}
+    lines = ["def _map(row):", "    obj = _new(_cls)"]
+    for index, column in enumerate(columns):
+        lines.append(f"    obj.{column} = row[{index}]")
+
+    for field in items:
+        if field.name in columns:
+            continue
+        if field.default is not MISSING:
+            namespace[f"_default_{field.name}"] = field.default
+            lines.append(f"    obj.{field.name} = _default_{field.name}")
+        elif field.default_factory is not MISSING:
+            namespace[f"_factory_{field.name}"] = field.default_factory
+            lines.append(f"    obj.{field.name} = _factory_{field.name}()")
+        else:
+            return _kwargs_mapper(cls)
+
+    if hasattr(cls, "__post_init__"):
+        lines.append("    obj.__post_init__()")
+    lines.append("    return obj")
+
+    exec("\n".join(lines), namespace)
+    return namespace["_map"]
+
+
+@lru_cache(maxsize=_ROW_MAPPER_CACHE_SIZE)
+def _get_row_mapper(cls: type, columns: Tuple[str, ...]) -> RowMapper:
+    if is_dataclass(cls):
+        return _compile_dataclass_mapper(cls, columns)
+    return _kwargs_mapper(cls)
+
+
+def get_row_mapper(
+    cls: Type[PacketType], columns: Tuple[str, ...]
+) -> Callable[[Any], PacketType]:
+    """
+    Compile a function that maps a record with the columns to a `cls` object.
+
+    The dataclass mappers assign the fields directly, which skips building
+    a kwargs dict and running the generated `__init__` for every row.
+    Any other class is constructed with the keyword arguments.
+    """
+
+    return _get_row_mapper(cast(type, cls), columns)
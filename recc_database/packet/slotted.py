@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Callable, Type, TypeVar, cast
+
+PacketType = TypeVar("PacketType")
+
+
+def _slotted_eq(cls: type) -> Callable[[Any, Any], Any]:
+    names = tuple(f.name for f in fields(cls) if f.compare)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__ and other.__class__ is not cls:
+            return NotImplemented
+        lhs = tuple(getattr(self, name) for name in names)
+        rhs = tuple(getattr(other, name) for name in names)
+        return lhs == rhs
+
+    return __eq__
+
+
+def _new_slotted(cls: type) -> Any:
+    return object.__new__(_slotted(cls))
+
+
+def _slotted_reduce(cls: type) -> Callable[[Any], Any]:
+    names = tuple(f.name for f in fields(cls))
+
+    def __reduce__(self):
+        # The variant cannot be found by its name, unlike the packet.
+        return _new_slotted, (cls,), (None, {n: getattr(self, n) for n in names})
+
+    return __reduce__
+
+
+@lru_cache(maxsize=None)
+def _slotted(cls: type) -> type:
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        # The defaults are bound to the generated `__init__` already.
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    namespace["__qualname__"] = cls.__qualname__
+    namespace["__reduce__"] = _slotted_reduce(cls)
+    if getattr(cls, "__dataclass_params__").eq:
+        namespace["__eq__"] = _slotted_eq(cls)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def can_slot(cls: type) -> bool:
+    """
+    The bases other than `object` would bring their `__dict__` back.
+    """
+    return is_dataclass(cls) and isinstance(cls, type) and cls.__bases__ == (object,)
+
+
+def slotted(cls: Type[PacketType]) -> Type[PacketType]:
+    """
+    The `__slots__` variant of a packet dataclass.
+
+    The variant is a copy of the packet class whose fields are stored in slots,
+    so its instances have no `__dict__`. It is not a subclass of the packet,
+    so `isinstance()` checks against the packet fail, but the instances
+    compare equal to the packets with the same fields.
+    """
+
+    if not can_slot(cls):
+        raise TypeError(f"The '{cls!r}' is not a dataclass type without bases")
+    return cast(Type[PacketType], _slotted(cast(type, cls)))
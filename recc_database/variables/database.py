@@ -15,8 +15,24 @@ TABLE_GROUP_MEMBER = f"{TABLE_PREFIX}group_member"
 TABLE_PROJECT_MEMBER = f"{TABLE_PREFIX}project_member"
 TABLE_PIP = f"{TABLE_PREFIX}pip"
 TABLE_USER_INFO = f"{TABLE_PREFIX}user_info"
+TABLE_PROJECT_ACCESS = f"{TABLE_PREFIX}project_access"
 
 INDEX_PREFIX = "recc_"
+INDEX_GROUP_MEMBER_USER_UID = f"{INDEX_PREFIX}group_member_user_uid"
+INDEX_GROUP_MEMBER_ROLE_UID = f"{INDEX_PREFIX}group_member_role_uid"
+INDEX_PROJECT_MEMBER_USER_UID = f"{INDEX_PREFIX}project_member_user_uid"
+INDEX_PROJECT_MEMBER_ROLE_UID = f"{INDEX_PREFIX}project_member_role_uid"
+INDEX_ROLE_PERMISSION_PERMISSION_UID = f"{INDEX_PREFIX}role_permission_permission_uid"
+INDEX_PIP_DOMAIN_NAME = f"{INDEX_PREFIX}pip_domain_name"
+INDEX_PROJECT_ACCESS_PROJECT_UID = f"{INDEX_PREFIX}project_access_project_uid"
+INDEX_GROUP_FEATURES = f"{INDEX_PREFIX}group_features"
+INDEX_GROUP_EXTRA = f"{INDEX_PREFIX}group_extra"
+INDEX_PROJECT_FEATURES = f"{INDEX_PREFIX}project_features"
+INDEX_PROJECT_EXTRA = f"{INDEX_PREFIX}project_extra"
+INDEX_ROLE_EXTRA = f"{INDEX_PREFIX}role_extra"
+INDEX_TASK_EXTRA = f"{INDEX_PREFIX}task_extra"
+
+# Removed in 2.2.0: duplicates of UNIQUE constraints or never used by a query.
 INDEX_USER_NAME = f"{INDEX_PREFIX}user_name"
 INDEX_USER_EMAIL = f"{INDEX_PREFIX}user_email"
 INDEX_GROUP_SLUG = f"{INDEX_PREFIX}group_slug"
@@ -31,6 +47,24 @@ VIEW_USER_ADMIN_COUNT = f"{VIEW_PREFIX}user_admin_count"
 
 FUNC_PREFIX = "recc_"
 FUNC_APPROPRIATE_PERMISSION = f"{FUNC_PREFIX}appropriate_permission"
+FUNC_APPROPRIATE_PERMISSIONS = f"{FUNC_PREFIX}appropriate_permissions"
+FUNC_NOTIFY_CHANGE = f"{FUNC_PREFIX}notify_change"
+FUNC_REFRESH_PROJECT_ACCESS = f"{FUNC_PREFIX}refresh_project_access"
+FUNC_REFRESH_PROJECT_ACCESS_BY_USER = f"{FUNC_PREFIX}refresh_project_access_by_user"
+FUNC_PROJECT_ACCESS_GROUP_MEMBER = f"{FUNC_PREFIX}project_access_group_member"
+FUNC_PROJECT_ACCESS_PROJECT_MEMBER = f"{FUNC_PREFIX}project_access_project_member"
+FUNC_PROJECT_ACCESS_PROJECT = f"{FUNC_PREFIX}project_access_project"
+
+TRIGGER_NOTIFY_CHANGE_SUFFIX = "_notify_change"
+TRIGGER_PROJECT_ACCESS_SUFFIX = "_project_access"
+
+CHANNEL_PREFIX = "recc_"
+CHANNEL_CHANGE = f"{CHANNEL_PREFIX}change"
+
+CHANGE_OP_INSERT = "INSERT"
+CHANGE_OP_UPDATE = "UPDATE"
+CHANGE_OP_DELETE = "DELETE"
+CHANGE_OP_TRUNCATE = "TRUNCATE"
 
 INFO_KEY_RECC_DB_VERSION = "recc.db.version"
 INFO_KEY_RECC_ARGPARSE_CONFIG = "recc.argparse.config"
@@ -42,6 +76,35 @@ CONFIG_PREFIX_RECC_ARGPARSE_CONFIG = INFO_KEY_RECC_ARGPARSE_CONFIG + "."
 
 DATABASE_COMMAND_TIMEOUT_SECONDS = 60.0
 DATABASE_CLOSE_TIMEOUT_SECONDS = 60.0
+DATABASE_LISTENER_RECONNECT_SECONDS = 1.0
+DATABASE_STATEMENT_CACHE_SIZE = 512
+"""
+Large enough to keep every registered query constant prepared on a connection.
+"""
+DATABASE_MIGRATION_LOCK_KEY = 0x72656363
+"""
+The advisory lock that serializes the schema creation and migration of the nodes.
+"""
+DATABASE_MIGRATION_LOCK_POLL_SECONDS = 0.2
+DATABASE_UPDATE_QUERY_CACHE_SIZE = 1024
+"""
+The number of compiled UPDATE statements, one for each table and column shape.
+"""
+
+DATABASE_POOL_MIN_SIZE = 10
+DATABASE_POOL_MAX_SIZE = 10
+DATABASE_POOL_MAX_QUERIES = 50000
+DATABASE_POOL_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS = 300.0
+DATABASE_POOL_ADAPTIVE_MIN_SIZE = 2
+DATABASE_POOL_ADAPTIVE_MAX_SIZE = 40
+DATABASE_POOL_ADAPTIVE_INACTIVE_CONNECTION_LIFETIME_SECONDS = 60.0
+
+DATABASE_PAGE_LIMIT = 100
+DATABASE_CURSOR_PREFETCH = 500
+
+PERMISSION_CACHE_TTL_SECONDS = 30.0
+SLUG_CACHE_TTL_SECONDS = 300.0
+INFO_CACHE_TTL_SECONDS = 5.0
 
 SHA256_BYTE = 32
 SHA256_HEX_STR_SIZE = SHA256_BYTE * 2
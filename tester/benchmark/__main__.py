@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from sys import exit as sys_exit
+from typing import List, Optional, Sequence, Tuple
+
+from recc_database.database.pg_db import PgDb
+from recc_database.database.pool_options import PgPoolOptions
+from tester.benchmark.cases import BENCHMARK_CASES
+from tester.benchmark.fixture import seed
+from tester.benchmark.report import (
+    PERCENTILE_METRICS,
+    BenchmarkResult,
+    compare,
+    dumps_report,
+    loads_report,
+)
+from tester.benchmark.runner import BenchmarkCase, run_cases
+from tester.variables import (
+    BENCHMARK_CONCURRENCY,
+    BENCHMARK_DATABASE_NAME,
+    BENCHMARK_ITERATIONS,
+    BENCHMARK_METRIC,
+    BENCHMARK_POOL_SIZES,
+    BENCHMARK_ROWS,
+    BENCHMARK_TOLERANCE,
+    BENCHMARK_WARMUP,
+)
+
+_MILLISECONDS = 1000.0
+
+
+def _int_list(text: str) -> Tuple[int, ...]:
+    return tuple(int(x) for x in text.split(",") if x.strip())
+
+
+def _join(values: Sequence[int]) -> str:
+    return ",".join(str(x) for x in values)
+
+
+def get_default_arguments(cmdline: Optional[List[str]] = None) -> Namespace:
+    parser = ArgumentParser(
+        prog="python -m tester.benchmark",
+        description="Hot-path benchmarks against a local PostgreSQL",
+    )
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=5432)
+    parser.add_argument("--user", default="recc")
+    parser.add_argument("--password", default="recc1234")
+    parser.add_argument(
+        "--database",
+        default=BENCHMARK_DATABASE_NAME,
+        help="It is dropped and recreated for every row count",
+    )
+    parser.add_argument("--iterations", type=int, default=BENCHMARK_ITERATIONS)
+    parser.add_argument("--warmup", type=int, default=BENCHMARK_WARMUP)
+    parser.add_argument(
+        "--concurrency",
+        type=_int_list,
+        default=BENCHMARK_CONCURRENCY,
+        help=f"Comma separated coroutines (default: {_join(BENCHMARK_CONCURRENCY)})",
+    )
+    parser.add_argument(
+        "--pool-sizes",
+        type=_int_list,
+        default=BENCHMARK_POOL_SIZES,
+        help=f"Comma separated pool sizes (default: {_join(BENCHMARK_POOL_SIZES)})",
+    )
+    parser.add_argument(
+        "--rows",
+        type=_int_list,
+        default=BENCHMARK_ROWS,
+        help=f"Comma separated seeded user counts (default: {_join(BENCHMARK_ROWS)})",
+    )
+    parser.add_argument(
+        "--filter",
+        default=None,
+        help="Run only the cases whose name contains this text",
+    )
+    parser.add_argument("--read-only", action="store_true", default=False)
+    parser.add_argument("--output", default=None, help="Write the JSON report")
+    parser.add_argument("--baseline", default=None, help="Compare to a JSON report")
+    parser.add_argument(
+        "--metric", choices=PERCENTILE_METRICS, default=BENCHMARK_METRIC
+    )
+    parser.add_argument("--tolerance", type=float, default=BENCHMARK_TOLERANCE)
+    return parser.parse_args(cmdline)
+
+
+def select_cases(
+    name_filter: Optional[str] = None, read_only=False
+) -> List[BenchmarkCase]:
+    cases = BENCHMARK_CASES
+    if name_filter:
+        cases = tuple(c for c in cases if name_filter in c.name)
+    if read_only:
+        cases = tuple(c for c in cases if not c.write)
+    return list(cases)
+
+
+async def run_benchmarks(args: Namespace) -> List[BenchmarkResult]:
+    cases = select_cases(args.filter, args.read_only)
+    results: List[BenchmarkResult] = list()
+    for pool_size in args.pool_sizes:
+        pool_options = PgPoolOptions(
+            min_size=min(pool_size, PgPoolOptions.min_size), max_size=pool_size
+        )
+        db = PgDb(
+            args.host,
+            args.port,
+            args.user,
+            args.password,
+            args.database,
+            pool_options=pool_options,
+        )
+        await db.open()
+        try:
+            for rows in args.rows:
+                await db.drop_tables()
+                await db.create_tables()
+                fixture = await seed(db, rows)
+                results += await run_cases(
+                    db,
+                    fixture,
+                    cases,
+                    args.iterations,
+                    args.concurrency,
+                    args.warmup,
+                    pool_size,
+                )
+        finally:
+            await db.close()
+    return results
+
+
+def print_results(results: Sequence[BenchmarkResult]) -> None:
+    header = f"{'p50':>9} {'p90':>9} {'p99':>9} {'ops/s':>10}  benchmark (ms)"
+    print(header)
+    for r in results:
+        p50 = r.p50 * _MILLISECONDS
+        p90 = r.p90 * _MILLISECONDS
+        p99 = r.p99 * _MILLISECONDS
+        ops = r.ops_per_second
+        print(f"{p50:9.3f} {p90:9.3f} {p99:9.3f} {ops:10.1f}  {r.key}")
+
+
+def main(cmdline: Optional[List[str]] = None) -> int:
+    args = get_default_arguments(cmdline)
+    results = run(run_benchmarks(args))
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(dumps_report(results))
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = loads_report(f.read())
+    regressions = compare(results, baseline, args.metric, args.tolerance)
+    for regression in regressions:
+        print(
+            f"[REGRESSION] {regression.key} {regression.metric} "
+            f"{regression.baseline * _MILLISECONDS:.3f}ms -> "
+            f"{regression.current * _MILLISECONDS:.3f}ms "
+            f"(x{regression.ratio:.2f})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys_exit(main())
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Sequence, Tuple, TypeVar
+
+from recc_database.chrono.datetime import tznow
+from recc_database.database.pg_db import PgDb
+from tester.benchmark.fixture import BENCHMARK_PIP_DOMAIN, BenchmarkFixture
+from tester.benchmark.runner import BenchmarkCase
+
+_T = TypeVar("_T")
+
+_PAGE_SIZE = 200
+
+
+def _pick(items: Sequence[_T], index: int) -> _T:
+    return items[index % len(items)]
+
+
+async def _select_user_uid_by_username(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_user_uid_by_username(_pick(f.usernames, i))
+
+
+async def _select_user_by_uid(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_user_by_uid(_pick(f.user_uids, i))
+
+
+async def _select_user_password(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_user_password_and_salt_by_uid(_pick(f.user_uids, i))
+
+
+async def _select_users_page(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_users_page(_pick(f.user_uids, i))
+
+
+async def _select_users_by_uids(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    start = i % len(f.user_uids)
+    return await db.select_users_by_uids(f.user_uids[start : start + _PAGE_SIZE])
+
+
+async def _select_user_info(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    user_uid = _pick(f.user_uids, i)
+    return await db.select_user_info_by_key(user_uid, _pick(f.user_info_keys, i))
+
+
+async def _select_group_uid_by_slug(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_group_uid_by_slug(_pick(f.group_slugs, i))
+
+
+async def _select_group_by_uid(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_group_by_uid(_pick(f.group_uids, i))
+
+
+async def _select_group_member(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    user_uid, group_uid = _pick(f.group_members, i)
+    return await db.select_group_member(group_uid, user_uid)
+
+
+async def _select_project_uid(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    group_uid, slug = _pick(f.project_keys, i)
+    return await db.select_project_uid_by_group_uid_and_slug(group_uid, slug)
+
+
+async def _select_projects_by_user(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_projects_by_user_uid(_pick(f.user_uids, i))
+
+
+async def _select_project_member(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    user_uid, _, project_uid = _pick(f.memberships, i)
+    return await db.select_project_member(project_uid, user_uid)
+
+
+async def _select_task_uid_by_fullpath(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_task_uid_by_fullpath(*_pick(f.task_paths, i))
+
+
+async def _select_task_by_uid(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_task_by_uid(_pick(f.task_uids, i))
+
+
+async def _select_role_uid_by_slug(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_role_uid_by_slug("guest")
+
+
+async def _select_role_permissions(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_role_permission_by_role_uid(_pick(f.role_uids, i))
+
+
+async def _select_permission_uid(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_permission_uid_by_slug(_pick(f.permission_slugs, i))
+
+
+async def _select_permissions(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    user_uid, group_uid, project_uid = _pick(f.memberships, i)
+    return await db.select_appropriate_permission_by_user_and_group_and_project(
+        user_uid, group_uid, project_uid
+    )
+
+
+async def _select_info_by_key(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.select_info_by_key(_pick(f.info_keys, i))
+
+
+async def _select_pip(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    name = _pick(f.pip_names, i)
+    return await db.select_pip_by_domain_and_name(BENCHMARK_PIP_DOMAIN, name)
+
+
+async def _insert_user(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.insert_user(f"new{next(f.serial)}", "password", "salt")
+
+
+async def _update_last_login(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.update_user_last_login_by_uid(_pick(f.user_uids, i), tznow())
+
+
+async def _upsert_user_info(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    user_uid = _pick(f.user_uids, i)
+    return await db.upsert_user_info(user_uid, "benchmark.key", str(i))
+
+
+async def _update_group_member_role(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    user_uid, group_uid = _pick(f.group_members, i)
+    role_uid = _pick(f.role_uids, i // len(f.group_members))
+    return await db.update_group_member_role(group_uid, user_uid, role_uid)
+
+
+async def _update_task_extra(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.update_task_extra_by_uid(_pick(f.task_uids, i), {"index": i})
+
+
+async def _upsert_info(db: PgDb, f: BenchmarkFixture, i: int) -> Any:
+    return await db.upsert_info(_pick(f.info_keys, i), str(i))
+
+
+BENCHMARK_CASES: Tuple[BenchmarkCase, ...] = (
+    BenchmarkCase("user.select_user_uid_by_username", _select_user_uid_by_username),
+    BenchmarkCase("user.select_user_by_uid", _select_user_by_uid),
+    BenchmarkCase("user.select_user_password_and_salt_by_uid", _select_user_password),
+    BenchmarkCase("user.select_users_page", _select_users_page),
+    BenchmarkCase("user.select_users_by_uids", _select_users_by_uids),
+    BenchmarkCase("user_info.select_user_info_by_key", _select_user_info),
+    BenchmarkCase("group.select_group_uid_by_slug", _select_group_uid_by_slug),
+    BenchmarkCase("group.select_group_by_uid", _select_group_by_uid),
+    BenchmarkCase("group_member.select_group_member", _select_group_member),
+    BenchmarkCase(
+        "project.select_project_uid_by_group_uid_and_slug", _select_project_uid
+    ),
+    BenchmarkCase("project.select_projects_by_user_uid", _select_projects_by_user),
+    BenchmarkCase("project_member.select_project_member", _select_project_member),
+    BenchmarkCase("task.select_task_uid_by_fullpath", _select_task_uid_by_fullpath),
+    BenchmarkCase("task.select_task_by_uid", _select_task_by_uid),
+    BenchmarkCase("role.select_role_uid_by_slug", _select_role_uid_by_slug),
+    BenchmarkCase(
+        "role_permission.select_role_permission_by_role_uid", _select_role_permissions
+    ),
+    BenchmarkCase("permission.select_permission_uid_by_slug", _select_permission_uid),
+    BenchmarkCase(
+        "permission.select_appropriate_permission_by_user_and_group_and_project",
+        _select_permissions,
+    ),
+    BenchmarkCase("info.select_info_by_key", _select_info_by_key),
+    BenchmarkCase("pip.select_pip_by_domain_and_name", _select_pip),
+    BenchmarkCase("user.insert_user", _insert_user, write=True),
+    BenchmarkCase("user.update_user_last_login_by_uid", _update_last_login, write=True),
+    BenchmarkCase("user_info.upsert_user_info", _upsert_user_info, write=True),
+    BenchmarkCase(
+        "group_member.update_group_member_role",
+        _update_group_member_role,
+        write=True,
+    ),
+    BenchmarkCase("task.update_task_extra_by_uid", _update_task_extra, write=True),
+    BenchmarkCase("info.upsert_info", _upsert_info, write=True),
+)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Iterator, List, Tuple
+
+from recc_database.database.pg_db import PgDb
+from recc_database.variables.database import (
+    DEFAULT_PERMISSION_SLUGS,
+    ROLE_SLUG_GUEST,
+    ROLE_SLUG_REPORTER,
+)
+from tester.dataset import DatasetOptions, generate_dataset
+
+BENCHMARK_INFO_KEY_COUNT = 10
+BENCHMARK_PIP_COUNT = 10
+BENCHMARK_PIP_DOMAIN = "benchmark"
+
+
+@dataclass
+class BenchmarkFixture:
+    rows: int
+    usernames: List[str]
+    user_uids: List[int]
+    user_info_keys: List[str]
+    group_slugs: List[str]
+    group_uids: List[int]
+    group_members: List[Tuple[int, int]]
+    """
+    The `(user_uid, group_uid)` of each group member.
+    """
+
+    project_keys: List[Tuple[int, str]]
+    """
+    The `(group_uid, slug)` of each project.
+    """
+
+    memberships: List[Tuple[int, int, int]]
+    """
+    The `(user_uid, group_uid, project_uid)` of each project member.
+    """
+
+    task_uids: List[int]
+    task_paths: List[Tuple[str, str, str]]
+    role_uids: Tuple[int, int]
+    permission_slugs: List[str]
+    info_keys: List[str]
+    pip_names: List[str]
+    serial: Iterator[int] = field(default_factory=count)
+    """
+    Unique numbers for the inserted rows, across every measured run.
+    """
+
+
+async def seed(db: PgDb, rows: int) -> BenchmarkFixture:
+    """
+    Generate a dataset of `rows` users, scaled by :meth:`DatasetOptions.scaled`.
+    """
+
+    dataset = await generate_dataset(db, DatasetOptions.scaled(rows))
+
+    project_groups = [dataset.group_uids[i] for i in dataset.project_groups]
+    project_keys = list(zip(project_groups, dataset.project_slugs))
+    group_of_project = dict(zip(dataset.project_uids, project_groups))
+    memberships = [(u, group_of_project[p], p) for p, u, _ in dataset.project_members]
+
+    task_paths = list()
+    for project_index, task_slug in zip(dataset.task_projects, dataset.task_slugs):
+        group_slug = dataset.group_slugs[dataset.project_groups[project_index]]
+        project_slug = dataset.project_slugs[project_index]
+        task_paths.append((group_slug, project_slug, task_slug))
+
+    guest = await db.select_role_uid_by_slug(ROLE_SLUG_GUEST)
+    reporter = await db.select_role_uid_by_slug(ROLE_SLUG_REPORTER)
+
+    info_keys = [f"benchmark.info{i}" for i in range(BENCHMARK_INFO_KEY_COUNT)]
+    for key in info_keys:
+        await db.insert_info(key, "value")
+
+    pip_names = [f"package{i}" for i in range(BENCHMARK_PIP_COUNT)]
+    for name in pip_names:
+        await db.insert_pip(BENCHMARK_PIP_DOMAIN, name, f"{name}.whl", "sha256", "0")
+
+    return BenchmarkFixture(
+        rows=rows,
+        usernames=dataset.usernames,
+        user_uids=dataset.user_uids,
+        user_info_keys=dataset.user_info_keys,
+        group_slugs=dataset.group_slugs,
+        group_uids=dataset.group_uids,
+        group_members=[(u, g) for g, u, _ in dataset.group_members],
+        project_keys=project_keys,
+        memberships=memberships,
+        task_uids=dataset.task_uids,
+        task_paths=task_paths,
+        role_uids=(guest, reporter),
+        permission_slugs=list(DEFAULT_PERMISSION_SLUGS),
+        info_keys=info_keys,
+        pip_names=pip_names,
+    )
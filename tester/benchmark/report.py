@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import asdict, dataclass
+from json import dumps, loads
+from math import ceil
+from typing import Dict, Iterable, List, Sequence
+
+REPORT_VERSION = 1
+
+PERCENTILE_METRICS = ("p50", "p90", "p99", "max", "mean")
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """
+    The nearest-rank percentile of the sorted samples.
+    """
+
+    if not samples:
+        return 0.0
+    if not 0.0 <= q <= 1.0:
+        raise ValueError("The q must be in the range [0, 1]")
+    rank = max(ceil(q * len(samples)), 1)
+    return samples[rank - 1]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    concurrency: int
+    pool_size: int
+    rows: int
+    count: int
+    seconds: float
+    """
+    The wall time of all iterations.
+    """
+
+    p50: float
+    p90: float
+    p99: float
+    max: float
+    mean: float
+
+    @property
+    def key(self) -> str:
+        return (
+            f"{self.name}[c={self.concurrency},pool={self.pool_size},rows={self.rows}]"
+        )
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.count / self.seconds if self.seconds > 0 else 0.0
+
+
+def summarize(
+    name: str,
+    samples: Iterable[float],
+    seconds: float,
+    concurrency: int,
+    pool_size: int,
+    rows: int,
+) -> BenchmarkResult:
+    ordered = sorted(samples)
+    count = len(ordered)
+    return BenchmarkResult(
+        name=name,
+        concurrency=concurrency,
+        pool_size=pool_size,
+        rows=rows,
+        count=count,
+        seconds=seconds,
+        p50=percentile(ordered, 0.50),
+        p90=percentile(ordered, 0.90),
+        p99=percentile(ordered, 0.99),
+        max=ordered[-1] if ordered else 0.0,
+        mean=sum(ordered) / count if count else 0.0,
+    )
+
+
+def dumps_report(results: Iterable[BenchmarkResult]) -> str:
+    items = [asdict(result) for result in results]
+    return dumps({"version": REPORT_VERSION, "results": items}, indent=2)
+
+
+def loads_report(text: str) -> Dict[str, BenchmarkResult]:
+    obj = loads(text)
+    if obj.get("version") != REPORT_VERSION:
+        raise ValueError(f"Unsupported report version: {obj.get('version')}")
+    results = (BenchmarkResult(**item) for item in obj["results"])
+    return {result.key: result for result in results}
+
+
+@dataclass(frozen=True)
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+
+def compare(
+    results: Iterable[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    metric="p90",
+    tolerance=0.2,
+) -> List[Regression]:
+    """
+    :param tolerance: The allowed relative slowdown, e.g. `0.2` is 20%.
+    :return: The results slower than the baseline by more than the tolerance.
+        Results without a baseline are not compared.
+    """
+
+    if metric not in PERCENTILE_METRICS:
+        raise ValueError(f"Unknown metric: '{metric}'")
+
+    regressions = list()
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None:
+            continue
+        before = getattr(previous, metric)
+        after = getattr(result, metric)
+        if after > before * (1.0 + tolerance):
+            regressions.append(Regression(result.key, metric, before, after))
+    return regressions
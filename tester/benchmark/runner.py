@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import gather
+from dataclasses import dataclass
+from itertools import count
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterable, List, Tuple
+
+from recc_database.database.pg_db import PgDb
+from tester.benchmark.fixture import BenchmarkFixture
+from tester.benchmark.report import BenchmarkResult, summarize
+
+Operation = Callable[[PgDb, BenchmarkFixture, int], Awaitable[Any]]
+"""
+Called with the database, the seeded rows and the iteration index.
+"""
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    operation: Operation
+    write: bool = False
+
+
+async def measure(
+    db: PgDb,
+    fixture: BenchmarkFixture,
+    operation: Operation,
+    iterations: int,
+    concurrency=1,
+    warmup=0,
+) -> Tuple[List[float], float]:
+    """
+    Run the operation from `concurrency` coroutines until `iterations` calls end.
+
+    :return: The latency of each call and the wall time of all calls, in seconds.
+    """
+
+    if iterations < 1:
+        raise ValueError("The iterations must be at least 1")
+    if concurrency < 1:
+        raise ValueError("The concurrency must be at least 1")
+
+    for index in range(warmup):
+        await operation(db, fixture, index)
+
+    indices = count()
+    samples: List[float] = list()
+
+    async def _worker() -> None:
+        while True:
+            index = next(indices)
+            if index >= iterations:
+                return
+            begin = perf_counter()
+            await operation(db, fixture, index)
+            samples.append(perf_counter() - begin)
+
+    begin = perf_counter()
+    await gather(*(_worker() for _ in range(concurrency)))
+    return samples, perf_counter() - begin
+
+
+async def run_cases(
+    db: PgDb,
+    fixture: BenchmarkFixture,
+    cases: Iterable[BenchmarkCase],
+    iterations: int,
+    concurrency_levels: Iterable[int] = (1,),
+    warmup=0,
+    pool_size=0,
+) -> List[BenchmarkResult]:
+    results = list()
+    for case in cases:
+        for concurrency in concurrency_levels:
+            samples, seconds = await measure(
+                db, fixture, case.operation, iterations, concurrency, warmup
+            )
+            results.append(
+                summarize(
+                    case.name,
+                    samples,
+                    seconds,
+                    concurrency,
+                    pool_size,
+                    fixture.rows,
+                )
+            )
+    return results
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from unittest import main
+
+from tester.benchmark.__main__ import select_cases
+from tester.benchmark.cases import BENCHMARK_CASES
+from tester.benchmark.fixture import seed
+from tester.benchmark.runner import measure, run_cases
+from tester.postgresql_test_case import PostgresqlTestCase
+
+
+class BenchmarkTestCase(PostgresqlTestCase):
+    async def test_every_case(self):
+        fixture = await seed(self.db, 20)
+        results = await run_cases(self.db, fixture, BENCHMARK_CASES, 4, (1, 2), 1)
+        self.assertEqual(len(BENCHMARK_CASES) * 2, len(results))
+        self.assertTrue(all(r.count == 4 for r in results))
+        self.assertEqual(len(results), len(set(r.key for r in results)))
+
+    async def test_measure(self):
+        fixture = await seed(self.db, 1)
+        calls = list()
+
+        async def _operation(db, f, index):
+            calls.append(index)
+
+        samples, seconds = await measure(self.db, fixture, _operation, 10, 3)
+        self.assertEqual(10, len(samples))
+        self.assertListEqual(list(range(10)), sorted(calls))
+        self.assertLessEqual(sum(samples), seconds * 3)
+
+    def test_select_cases(self):
+        self.assertTrue(all(not c.write for c in select_cases(read_only=True)))
+        self.assertEqual(1, len(select_cases("task.select_task_by_uid")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from tester.benchmark.report import (
+    compare,
+    dumps_report,
+    loads_report,
+    percentile,
+    summarize,
+)
+
+
+class ReportTestCase(TestCase):
+    def test_percentile(self):
+        samples = [float(x) for x in range(1, 101)]
+        self.assertEqual(50.0, percentile(samples, 0.5))
+        self.assertEqual(99.0, percentile(samples, 0.99))
+        self.assertEqual(1.0, percentile(samples, 0.0))
+        self.assertEqual(100.0, percentile(samples, 1.0))
+        self.assertEqual(0.0, percentile([], 0.5))
+        with self.assertRaises(ValueError):
+            percentile(samples, 1.5)
+
+    def test_summarize(self):
+        result = summarize("case", [0.3, 0.1, 0.2, 0.4], 0.5, 2, 10, 100)
+        self.assertEqual(4, result.count)
+        self.assertEqual(0.2, result.p50)
+        self.assertEqual(0.4, result.max)
+        self.assertAlmostEqual(0.25, result.mean)
+        self.assertAlmostEqual(8.0, result.ops_per_second)
+        self.assertEqual("case[c=2,pool=10,rows=100]", result.key)
+
+    def test_round_trip(self):
+        results = [summarize("a", [0.1], 0.1, 1, 10, 100)]
+        self.assertEqual(
+            {results[0].key: results[0]}, loads_report(dumps_report(results))
+        )
+        with self.assertRaises(ValueError):
+            loads_report('{"version": 0, "results": []}')
+
+    def test_compare(self):
+        baseline = loads_report(
+            dumps_report(
+                [
+                    summarize("a", [0.10], 0.1, 1, 10, 100),
+                    summarize("b", [0.10], 0.1, 1, 10, 100),
+                ]
+            )
+        )
+        results = [
+            summarize("a", [0.11], 0.1, 1, 10, 100),
+            summarize("b", [0.13], 0.1, 1, 10, 100),
+            summarize("c", [9.00], 0.1, 1, 10, 100),
+        ]
+        regressions = compare(results, baseline, "p90", 0.2)
+        self.assertEqual(["b[c=1,pool=10,rows=100]"], [r.key for r in regressions])
+        self.assertAlmostEqual(1.3, regressions[0].ratio)
+        with self.assertRaises(ValueError):
+            compare(results, baseline, "unknown")
+
+
+if __name__ == "__main__":
+    main()
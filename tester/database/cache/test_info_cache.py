@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, main
+
+from recc_database.database.cache.info_cache import (
+    InfoCache,
+    InfoSnapshot,
+    split_like_pattern,
+)
+from recc_database.database.cache.invalidation_bus import ChangeEvent
+from recc_database.packet.info import Info
+from recc_database.variables.database import (
+    CHANGE_OP_UPDATE,
+    TABLE_INFO,
+    TABLE_USER_INFO,
+)
+
+_NOW = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+
+def _info(key: str, days=0) -> Info:
+    updated_at = _NOW + timedelta(days=days)
+    return Info(key, f"{key}.value", _NOW, updated_at)
+
+
+class SplitLikePatternTestCase(TestCase):
+    def test_split(self):
+        self.assertEqual(("a.b", ""), split_like_pattern("a.b"))
+        self.assertEqual(("a.b", ".*"), split_like_pattern("a.b%"))
+        self.assertEqual(("", ".*"), split_like_pattern("%"))
+        self.assertEqual(("a", ".\\.b.*"), split_like_pattern("a_.b%"))
+        self.assertEqual(("a%_", ".*"), split_like_pattern("a\\%\\_%"))
+
+
+class InfoSnapshotTestCase(TestCase):
+    def setUp(self):
+        keys = ["b.x", "a.y", "a.x", "a.x.z", "ab", "a_x"]
+        self.snapshot = InfoSnapshot(_info(k, i) for i, k in enumerate(keys))
+
+    def keys(self, pattern: str):
+        return [info.key for info in self.snapshot.like(pattern)]
+
+    def test_lookup(self):
+        self.assertEqual(6, len(self.snapshot))
+        self.assertEqual((6, _NOW + timedelta(days=5)), self.snapshot.version)
+        self.assertTrue(self.snapshot.exists("a.x"))
+        self.assertFalse(self.snapshot.exists("a"))
+        self.assertEqual("ab.value", self.snapshot.get("ab").value)
+        self.assertIsNone(self.snapshot.get("c"))
+
+    def test_like(self):
+        self.assertEqual(["a.x", "a.x.z", "a.y"], self.keys("a.%"))
+        self.assertEqual(["a_x"], self.keys("a\\_x"))
+        self.assertEqual(["a.x", "a_x"], self.keys("a_x"))
+        self.assertEqual(["a.x", "a.y"], self.keys("a._"))
+        self.assertEqual(["a.x", "a.x.z", "b.x"], self.keys("%.x%"))
+        self.assertEqual(["ab"], self.keys("ab"))
+        self.assertEqual([], self.keys("c%"))
+        self.assertEqual(6, len(self.keys("%")))
+
+    def test_copies(self):
+        self.snapshot.get("ab").value = "changed"
+        self.snapshot.like("a.%")[0].value = "changed"
+        self.snapshot.like("b.x")[0].value = "changed"
+        self.assertEqual("ab.value", self.snapshot.get("ab").value)
+        self.assertEqual("a.x.value", self.snapshot.get("a.x").value)
+        self.assertEqual("b.x.value", self.snapshot.get("b.x").value)
+
+    def test_empty(self):
+        snapshot = InfoSnapshot([])
+        self.assertEqual((0, None), snapshot.version)
+        self.assertEqual([], snapshot.like("%"))
+
+
+class InfoCacheTestCase(TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.cache = InfoCache(10.0, lambda: self.now)
+
+    def test_stale(self):
+        self.cache.set(InfoSnapshot([_info("a")]))
+        self.assertFalse(self.cache.is_stale())
+        self.now = 10.0
+        self.assertTrue(self.cache.is_stale())
+        self.cache.touch()
+        self.assertFalse(self.cache.is_stale())
+
+    def test_generation(self):
+        generation = self.cache.generation
+        self.cache.clear()
+        self.cache.set(InfoSnapshot([_info("a")]), generation)
+        self.assertIsNone(self.cache.snapshot)
+
+        self.cache.set(InfoSnapshot([_info("a")]), self.cache.generation)
+        self.assertIsNotNone(self.cache.snapshot)
+
+    def test_on_change(self):
+        self.cache.set(InfoSnapshot([_info("a")]))
+        self.cache.on_change(ChangeEvent(TABLE_USER_INFO, CHANGE_OP_UPDATE))
+        self.assertIsNotNone(self.cache.snapshot)
+        self.cache.on_change(ChangeEvent(TABLE_INFO, CHANGE_OP_UPDATE, {"key": "a"}))
+        self.assertIsNone(self.cache.snapshot)
+
+        self.cache.set(InfoSnapshot([_info("a")]))
+        self.cache.on_reset()
+        self.assertIsNone(self.cache.snapshot)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+from typing import List
+from unittest import TestCase, main
+
+from recc_database.database.cache.invalidation_bus import (
+    CHANGE_OPS_ALL,
+    CHANGE_OPS_EXCEPT_INSERT,
+    CacheInvalidatorInterface,
+    ChangeEvent,
+    ChangeEvents,
+    InvalidationBus,
+    parse_change_payload,
+)
+from recc_database.database.cache.permission_cache import PermissionCache
+from recc_database.database.cache.permission_matrix import PermissionMatrixCache
+from recc_database.packet.permission import Permission
+from recc_database.variables.database import (
+    CHANGE_OP_DELETE,
+    CHANGE_OP_INSERT,
+    TABLE_GROUP_MEMBER,
+    TABLE_INFO,
+    TABLE_PERMISSION,
+    TABLE_ROLE,
+    TABLE_USER,
+)
+
+
+class _RecordInvalidator(CacheInvalidatorInterface):
+    def __init__(self):
+        self.events: List[ChangeEvent] = list()
+        self.resets = 0
+
+    @property
+    def change_events(self) -> ChangeEvents:
+        return {TABLE_INFO: CHANGE_OPS_ALL}
+
+    def on_change(self, event: ChangeEvent) -> None:
+        self.events.append(event)
+
+    def on_reset(self) -> None:
+        self.resets += 1
+
+
+class InvalidationBusTestCase(TestCase):
+    def test_parse_change_payload(self):
+        payload = '{"table":"recc_user","op":"UPDATE","key":{"uid":3}}'
+        event = parse_change_payload(payload)
+        self.assertEqual(ChangeEvent("recc_user", "UPDATE", {"uid": 3}), event)
+        self.assertEqual(3, event.get("uid"))
+        self.assertIsNone(event.get("slug"))
+
+        truncate = parse_change_payload('{"table":"recc_user","op":"TRUNCATE"}')
+        self.assertIsNotNone(truncate)
+        self.assertTrue(truncate.is_truncate)
+
+        self.assertIsNone(parse_change_payload("[]"))
+        self.assertIsNone(parse_change_payload("{"))
+        self.assertIsNone(parse_change_payload('{"table":"recc_user"}'))
+
+    def test_dispatch(self):
+        bus = InvalidationBus()
+        invalidator = _RecordInvalidator()
+        bus.register(invalidator)
+        bus.register(invalidator)
+        self.assertEqual(1, len(bus))
+
+        bus.dispatch_payload('{"table":"recc_user","op":"DELETE","key":{"uid":1}}')
+        self.assertEqual(1, len(invalidator.events))
+        self.assertEqual(0, invalidator.resets)
+
+        bus.dispatch_payload("unknown")
+        self.assertEqual(1, len(invalidator.events))
+        self.assertEqual(1, invalidator.resets)
+
+        bus.unregister(invalidator)
+        bus.reset()
+        self.assertEqual(1, invalidator.resets)
+
+    def test_change_events(self):
+        bus = InvalidationBus()
+        self.assertDictEqual({}, bus.change_events())
+
+        bus.register(PermissionCache(100, 60.0))
+        events = bus.change_events()
+        self.assertEqual(CHANGE_OPS_EXCEPT_INSERT, events[TABLE_ROLE])
+        self.assertEqual(CHANGE_OPS_ALL, events[TABLE_GROUP_MEMBER])
+        self.assertNotIn(TABLE_INFO, events)
+
+        bus.register(PermissionMatrixCache())
+        bus.register(_RecordInvalidator())
+        events = bus.change_events()
+        self.assertEqual(CHANGE_OPS_ALL, events[TABLE_ROLE])
+        self.assertEqual(CHANGE_OPS_ALL, events[TABLE_INFO])
+
+    def test_permission_cache(self):
+        perms = [Permission(1, "perm1")]
+        cache = PermissionCache(100, 60.0)
+        cache.set(perms, 1, 10, 100)
+        cache.set(perms, 2, 10, 100)
+
+        cache.on_change(ChangeEvent(TABLE_USER, CHANGE_OP_INSERT, {"uid": 1}))
+        self.assertEqual(2, len(cache))
+
+        key = {"group_uid": 10, "user_uid": 1}
+        cache.on_change(ChangeEvent(TABLE_GROUP_MEMBER, CHANGE_OP_DELETE, key))
+        self.assertIsNone(cache.get(1, 10, 100))
+        self.assertIsNotNone(cache.get(2, 10, 100))
+
+        cache.on_change(ChangeEvent(TABLE_PERMISSION, CHANGE_OP_INSERT, {"uid": 9}))
+        self.assertEqual(0, len(cache))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from recc_database.database.cache.permission_cache import PermissionCache
+from recc_database.packet.permission import Permission
+
+
+class PermissionCacheTestCase(TestCase):
+    def setUp(self):
+        self.perms = [Permission(1, "perm1"), Permission(2, "perm2")]
+        self.cache = PermissionCache(100, 60.0)
+        self.cache.set(self.perms, 1, 10)
+        self.cache.set(self.perms, 1, 10, 100)
+        self.cache.set(self.perms, 1, 20, 200)
+        self.cache.set(self.perms, 2, 10, 100)
+
+    def test_get(self):
+        self.assertListEqual(self.perms, self.cache.get(1, 10))
+        self.assertListEqual(self.perms, self.cache.get(1, 10, 100))
+        self.assertIsNone(self.cache.get(1, 10, 200))
+
+    def test_copies(self):
+        self.perms[0].slug = "changed"
+        self.cache.get(1, 10)[1].slug = "changed"
+        self.cache.get(1, 10).clear()
+        permissions = self.cache.get(1, 10)
+        self.assertListEqual(["perm1", "perm2"], [p.slug for p in permissions])
+
+    def test_invalidate_group_member(self):
+        self.cache.invalidate_group_member(10, 1)
+        self.assertIsNone(self.cache.get(1, 10))
+        self.assertIsNone(self.cache.get(1, 10, 100))
+        self.assertIsNotNone(self.cache.get(1, 20, 200))
+        self.assertIsNotNone(self.cache.get(2, 10, 100))
+
+    def test_invalidate_project_member(self):
+        self.cache.invalidate_project_member(100, 1)
+        self.assertIsNotNone(self.cache.get(1, 10))
+        self.assertIsNone(self.cache.get(1, 10, 100))
+        self.assertIsNotNone(self.cache.get(2, 10, 100))
+
+    def test_invalidate_user(self):
+        self.cache.invalidate_user(1)
+        self.assertEqual(1, len(self.cache))
+        self.assertIsNotNone(self.cache.get(2, 10, 100))
+
+    def test_stale_generation(self):
+        generation = self.cache.generation
+        self.cache.invalidate_user(3)
+        self.cache.set(self.perms, 3, 10, None, generation)
+        self.assertIsNone(self.cache.get(3, 10))
+        self.cache.set(self.perms, 3, 10, None, self.cache.generation)
+        self.assertIsNotNone(self.cache.get(3, 10))
+
+
+if __name__ == "__main__":
+    main()
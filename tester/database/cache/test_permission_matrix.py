@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from recc_database.database.cache.invalidation_bus import ChangeEvent
+from recc_database.database.cache.permission_matrix import (
+    PermissionMatrix,
+    PermissionMatrixCache,
+)
+from recc_database.packet.permission import Permission
+from recc_database.packet.role_permission import RolePermission
+from recc_database.variables.database import TABLE_ROLE_PERMISSION, TABLE_USER
+
+
+class PermissionMatrixTestCase(TestCase):
+    def setUp(self):
+        permissions = [Permission(3, "perm3"), Permission(1, "perm1")]
+        permissions.append(Permission(2, "perm2"))
+        role_permissions = [
+            RolePermission(10, 1),
+            RolePermission(10, 3),
+            RolePermission(20, 2),
+            RolePermission(20, 99),
+        ]
+        self.matrix = PermissionMatrix(permissions, role_permissions)
+
+    def test_has_permission(self):
+        self.assertEqual(3, len(self.matrix))
+        self.assertTrue(self.matrix.has_permission(10, "perm1"))
+        self.assertFalse(self.matrix.has_permission(10, "perm2"))
+        self.assertTrue(self.matrix.has_permission(10, "perm3"))
+        self.assertTrue(self.matrix.has_permission(20, "perm2"))
+        self.assertFalse(self.matrix.has_permission(20, "unknown"))
+        self.assertFalse(self.matrix.has_permission(30, "perm1"))
+        self.assertTrue(self.matrix.has_permission_uid(20, 2))
+        self.assertFalse(self.matrix.has_permission_uid(20, 99))
+
+    def test_mask(self):
+        mask = self.matrix.slug_mask("perm1", "perm3")
+        self.assertTrue(self.matrix.has_mask(10, mask))
+        self.assertFalse(self.matrix.has_mask(20, mask))
+        self.assertEqual(0b101, self.matrix.role_mask(10))
+        with self.assertRaises(KeyError):
+            self.matrix.slug_mask("unknown")
+
+    def test_permission_slugs(self):
+        self.assertListEqual(["perm1", "perm3"], self.matrix.permission_slugs(10))
+        self.assertListEqual(["perm2"], self.matrix.permission_slugs(20))
+        self.assertListEqual([], self.matrix.permission_slugs(30))
+
+
+class PermissionMatrixCacheTestCase(TestCase):
+    def test_generation(self):
+        cache = PermissionMatrixCache()
+        matrix = PermissionMatrix([], [])
+
+        generation = cache.generation
+        cache.clear()
+        cache.set(matrix, generation)
+        self.assertIsNone(cache.matrix)
+
+        cache.set(matrix, cache.generation)
+        self.assertIs(matrix, cache.matrix)
+
+    def test_on_change(self):
+        cache = PermissionMatrixCache()
+        cache.set(PermissionMatrix([], []))
+        cache.on_change(ChangeEvent(TABLE_USER, "UPDATE"))
+        self.assertIsNotNone(cache.matrix)
+        cache.on_change(ChangeEvent(TABLE_ROLE_PERMISSION, "DELETE"))
+        self.assertIsNone(cache.matrix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from recc_database.database.cache.invalidation_bus import ChangeEvent
+from recc_database.database.cache.slug_cache import SlugCache, SlugMap
+from recc_database.variables.database import (
+    CHANGE_OP_DELETE,
+    CHANGE_OP_INSERT,
+    CHANGE_OP_TRUNCATE,
+    TABLE_GROUP,
+    TABLE_PROJECT,
+    TABLE_ROLE,
+)
+
+
+class SlugMapTestCase(TestCase):
+    def test_bidirectional(self):
+        slug_map = SlugMap[str](2, 60.0)
+        slug_map.set("a", (1,))
+        slug_map.set("b", (2,))
+        self.assertEqual(1, slug_map.get_uid("a"))
+        self.assertEqual("b", slug_map.get_key(2))
+
+        # The lookups of both directions refresh the same entry.
+        slug_map.set("c", (3,))
+        self.assertEqual(2, len(slug_map))
+        self.assertIsNone(slug_map.get_uid("a"))
+        self.assertIsNone(slug_map.get_key(1))
+
+        slug_map.pop_uid(2)
+        self.assertIsNone(slug_map.get_uid("b"))
+        self.assertIsNone(slug_map.get_key(2))
+        self.assertEqual(3, slug_map.get_uid("c"))
+
+    def test_rename(self):
+        slug_map = SlugMap[str](10, 60.0)
+        slug_map.set("a", (1,))
+        slug_map.set("b", (1,))
+        self.assertIsNone(slug_map.get_uid("a"))
+        self.assertEqual("b", slug_map.get_key(1))
+
+        slug_map.set("b", (2,))
+        self.assertIsNone(slug_map.get_key(1))
+        self.assertEqual("b", slug_map.get_key(2))
+
+        slug_map.pop_uid(2)
+        self.assertEqual(0, len(slug_map))
+
+    def test_expired(self):
+        now = [0.0]
+        slug_map = SlugMap[str](10, 1.0, lambda: now[0])
+        slug_map.set("a", (1,))
+        now[0] = 2.0
+        self.assertIsNone(slug_map.get_key(1))
+        self.assertIsNone(slug_map.get_uid("a"))
+
+
+class SlugCacheTestCase(TestCase):
+    def setUp(self):
+        self.cache = SlugCache(100, 60.0)
+        self.cache.set(self.cache.groups, "g1", (1,))
+        self.cache.set(self.cache.groups, "g2", (2,))
+        self.cache.set(self.cache.projects, (1, "p1"), (10, 1))
+        self.cache.set(self.cache.projects, (2, "p2"), (20, 2))
+        self.cache.set(self.cache.tasks, ("g1", "p1", "t1"), (100, 1, 10))
+        self.cache.set(self.cache.tasks, ("g2", "p2", "t2"), (200, 2, 20))
+        self.cache.set(self.cache.roles, "r1", (5,))
+
+    def test_generation(self):
+        generation = self.cache.generation
+        self.cache.invalidate_role(5)
+        self.cache.set(self.cache.roles, "r1", (5,), generation)
+        self.assertIsNone(self.cache.roles.get_uid("r1"))
+
+    def test_invalidate_group(self):
+        self.cache.invalidate_group(1)
+        self.assertIsNone(self.cache.groups.get_uid("g1"))
+        self.assertIsNone(self.cache.projects.get_uid((1, "p1")))
+        self.assertIsNone(self.cache.tasks.get_uid(("g1", "p1", "t1")))
+        self.assertEqual(20, self.cache.projects.get_uid((2, "p2")))
+        self.assertEqual(200, self.cache.tasks.get_uid(("g2", "p2", "t2")))
+
+    def test_invalidate_project(self):
+        self.cache.invalidate_project(20)
+        self.assertEqual(2, self.cache.groups.get_uid("g2"))
+        self.assertIsNone(self.cache.projects.get_key(20))
+        self.assertIsNone(self.cache.tasks.get_uid(("g2", "p2", "t2")))
+        self.assertEqual(100, self.cache.tasks.get_uid(("g1", "p1", "t1")))
+
+    def test_invalidate_task_by_slug(self):
+        self.cache.invalidate_task_by_slug(10, "t1")
+        self.assertIsNone(self.cache.tasks.get_uid(("g1", "p1", "t1")))
+        self.assertEqual(1, len(self.cache.tasks))
+
+    def test_on_change(self):
+        self.cache.on_change(ChangeEvent(TABLE_GROUP, CHANGE_OP_INSERT, {"uid": 1}))
+        self.assertEqual(1, self.cache.groups.get_uid("g1"))
+        self.cache.on_change(ChangeEvent(TABLE_PROJECT, CHANGE_OP_DELETE, {"uid": 10}))
+        self.assertIsNone(self.cache.tasks.get_uid(("g1", "p1", "t1")))
+        self.cache.on_change(ChangeEvent(TABLE_ROLE, CHANGE_OP_TRUNCATE))
+        self.assertEqual(0, len(self.cache.groups))
+
+
+if __name__ == "__main__":
+    main()
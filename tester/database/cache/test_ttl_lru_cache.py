@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from recc_database.database.cache.ttl_lru_cache import TtlLruCache
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TtlLruCacheTestCase(TestCase):
+    def setUp(self):
+        self.clock = _FakeClock()
+
+    def test_expire(self):
+        cache = TtlLruCache[str, int](10, 1.0, self.clock)
+        cache.set("a", 1)
+        self.assertEqual(1, cache.get("a"))
+        self.clock.now = 0.5
+        self.assertEqual(1, cache.get("a"))
+        self.clock.now = 1.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(0, len(cache))
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_evict_least_recently_used(self):
+        cache = TtlLruCache[str, int](2, 10.0, self.clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.set("c", 3)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(3, cache.get("c"))
+
+    def test_pop_if(self):
+        cache = TtlLruCache[int, int](10, 10.0, self.clock)
+        for i in range(6):
+            cache.set(i, i)
+        self.assertEqual(3, cache.pop_if(lambda k: k % 2 == 0))
+        self.assertEqual(3, len(cache))
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(3, cache.get(3))
+        self.assertEqual(3, cache.pop(3))
+        self.assertIsNone(cache.pop(3))
+
+    def test_on_remove(self):
+        removed = list()
+        cache = TtlLruCache[str, int](
+            2, 1.0, self.clock, lambda k, v: removed.append(k)
+        )
+        cache.set("a", 1)
+        cache.set("a", 2)
+        cache.set("b", 3)
+        cache.set("c", 4)
+        cache.pop("c")
+        self.clock.now = 1.0
+        self.assertIsNone(cache.get("b"))
+        self.assertListEqual(["a", "a", "c", "b"], removed)
+
+        cache.set("d", 5)
+        cache.clear()
+        self.assertEqual(4, len(removed))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TtlLruCache(0, 1.0)
+        with self.assertRaises(ValueError):
+            TtlLruCache(1, 0.0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+from math import inf
+from unittest import TestCase, main
+
+from recc_database.database.metrics.histogram import Histogram
+
+
+class HistogramTestCase(TestCase):
+    def test_observe(self):
+        histogram = Histogram([0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        self.assertTupleEqual((0.1, 1.0, inf), snapshot.bounds)
+        self.assertTupleEqual((2, 1, 1), snapshot.counts)
+        self.assertListEqual([2, 3, 4], snapshot.cumulative_counts())
+        self.assertEqual(4, snapshot.count)
+        self.assertAlmostEqual(2.65, snapshot.sum)
+        self.assertAlmostEqual(2.65 / 4, snapshot.mean)
+
+    def test_quantile(self):
+        histogram = Histogram([1.0, 2.0, 4.0])
+        self.assertEqual(0.0, histogram.snapshot().quantile(0.99))
+
+        for _ in range(50):
+            histogram.observe(0.5)
+        for _ in range(50):
+            histogram.observe(3.0)
+
+        snapshot = histogram.snapshot()
+        self.assertAlmostEqual(0.5, snapshot.quantile(0.25))
+        self.assertAlmostEqual(1.0, snapshot.quantile(0.5))
+        self.assertAlmostEqual(3.96, snapshot.quantile(0.99))
+
+        histogram.observe(100.0)
+        self.assertEqual(4.0, histogram.snapshot().quantile(1.0))
+
+        with self.assertRaises(ValueError):
+            snapshot.quantile(1.5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from recc_database.database.metrics.in_memory_metrics import InMemoryMetrics
+from recc_database.database.metrics.metrics_hook import UNREGISTERED_QUERY_NAME
+from recc_database.database.metrics.prometheus import export_prometheus_text
+from recc_database.database.query.user import SELECT_USER_BY_UID
+
+
+class PrometheusTestCase(TestCase):
+    def test_export(self):
+        metrics = InMemoryMetrics(latency_buckets=[0.01, 0.1])
+        metrics.on_acquire(0.002)
+        metrics.on_acquire(1.0, TimeoutError())
+        metrics.on_query(SELECT_USER_BY_UID, 0.005, 1)
+        metrics.on_query(SELECT_USER_BY_UID, 0.05, 0, LookupError())
+        metrics.on_query("SELECT 1;", 0.2, 1)
+
+        snapshot = metrics.snapshot(pool_size=4, pool_idle_size=1)
+        self.assertEqual(3, snapshot.pool_in_use)
+        self.assertEqual(1, snapshot.acquire_errors)
+        self.assertDictEqual(
+            {"TimeoutError": 1, "LookupError": 1}, snapshot.error_types
+        )
+        user = snapshot.queries["SELECT_USER_BY_UID"]
+        self.assertEqual(2, user.latency.count)
+        self.assertEqual(1, user.rows)
+        self.assertEqual(1, user.errors)
+        self.assertIn(UNREGISTERED_QUERY_NAME, snapshot.queries)
+        slowest = list(snapshot.slowest(limit=1).keys())
+        self.assertListEqual([UNREGISTERED_QUERY_NAME], slowest)
+
+        text = export_prometheus_text(snapshot)
+        lines = text.splitlines()
+        self.assertIn("# TYPE recc_db_query_duration_seconds histogram", lines)
+        self.assertIn(
+            "recc_db_query_duration_seconds_bucket"
+            '{query="SELECT_USER_BY_UID",le="0.01"} 1',
+            lines,
+        )
+        self.assertIn(
+            "recc_db_query_duration_seconds_bucket"
+            '{query="SELECT_USER_BY_UID",le="+Inf"} 2',
+            lines,
+        )
+        self.assertIn(
+            'recc_db_query_duration_seconds_count{query="SELECT_USER_BY_UID"} 2', lines
+        )
+        self.assertIn('recc_db_query_errors_total{query="SELECT_USER_BY_UID"} 1', lines)
+        self.assertIn("recc_db_pool_acquire_wait_seconds_count 2", lines)
+        self.assertIn("recc_db_pool_acquire_errors_total 1", lines)
+        self.assertIn('recc_db_pool_connections{state="in_use"} 3', lines)
+        self.assertIn('recc_db_pool_connections{state="idle"} 1', lines)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_reset(self):
+        metrics = InMemoryMetrics()
+        metrics.on_query(SELECT_USER_BY_UID, 0.005, 1)
+        metrics.on_acquire(0.001)
+        metrics.reset()
+        snapshot = metrics.snapshot()
+        self.assertDictEqual({}, snapshot.queries)
+        self.assertEqual(0, snapshot.acquire_wait.count)
+        self.assertIsNone(snapshot.pool_in_use)
+
+
+if __name__ == "__main__":
+    main()
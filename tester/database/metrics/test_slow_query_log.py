@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from recc_database.database.metrics.slow_query_log import (
+    REDACTED_VALUE,
+    SlowQueryLog,
+    find_sensitive_arguments,
+    is_read_only,
+    redact_arguments,
+)
+from recc_database.database.query.task import UPDATE_TASK_KEYS_BY_UID
+from recc_database.database.query.user import (
+    INSERT_USER,
+    SELECT_USER_BY_UID,
+    UPDATE_USER_PASSWORD_AND_SALT_BY_UID,
+)
+
+
+class SlowQueryLogTestCase(TestCase):
+    def test_find_sensitive_arguments(self):
+        self.assertSetEqual({1, 2}, set(find_sensitive_arguments(INSERT_USER)))
+        self.assertSetEqual(
+            {1, 2}, set(find_sensitive_arguments(UPDATE_USER_PASSWORD_AND_SALT_BY_UID))
+        )
+        self.assertSetEqual(set(), set(find_sensitive_arguments(SELECT_USER_BY_UID)))
+        self.assertIn(2, find_sensitive_arguments(UPDATE_TASK_KEYS_BY_UID))
+        built = "UPDATE recc_user SET nickname=$2, salt=$3 WHERE uid=$1;"
+        self.assertSetEqual({2}, set(find_sensitive_arguments(built)))
+
+    def test_redact_arguments(self):
+        args = ("user", "pass", "salt", "nick")
+        redacted = redact_arguments(INSERT_USER, args)
+        self.assertTupleEqual(
+            ("user", REDACTED_VALUE, REDACTED_VALUE, "nick"), redacted
+        )
+
+    def test_is_read_only(self):
+        self.assertTrue(is_read_only(SELECT_USER_BY_UID))
+        self.assertTrue(is_read_only("WITH x AS (SELECT 1) SELECT * FROM x"))
+        self.assertFalse(is_read_only(INSERT_USER))
+        self.assertFalse(is_read_only("WITH x AS (DELETE FROM t) SELECT 1"))
+
+    def test_ring_buffer(self):
+        log = SlowQueryLog(0.1, capacity=2, log=None)
+        self.assertFalse(log.is_slow(0.05))
+        self.assertTrue(log.is_slow(0.1))
+
+        log.record(SELECT_USER_BY_UID, (1,), 0.1)
+        log.record(SELECT_USER_BY_UID, (2,), 0.2)
+        log.record(INSERT_USER, ("u", "p", "s"), 0.3, plan="plan")
+        records = log.records()
+        self.assertEqual(2, len(records))
+        self.assertTupleEqual((2,), records[0].args)
+        self.assertEqual("INSERT_USER", records[1].name)
+        self.assertEqual(1, len(log.plans()))
+
+        log.clear()
+        self.assertEqual(0, len(log))
+
+    def test_sample_explain(self):
+        values = iter([0.1, 0.9])
+        log = SlowQueryLog(
+            0.0, explain_sample_rate=0.5, random_func=lambda: next(values)
+        )
+        self.assertTrue(log.sample_explain(SELECT_USER_BY_UID))
+        self.assertFalse(log.sample_explain(SELECT_USER_BY_UID))
+        self.assertFalse(log.sample_explain("COPY recc_user"))
+        self.assertFalse(SlowQueryLog(0.0).sample_explain(SELECT_USER_BY_UID))
+
+        with self.assertRaises(ValueError):
+            SlowQueryLog(0.0, explain_sample_rate=1.5)
+
+
+if __name__ == "__main__":
+    main()
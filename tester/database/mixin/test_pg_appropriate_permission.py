@@ -3,6 +3,7 @@
 from typing import List
 from unittest import main
 
+from recc_database.database.pg_db import PgDb
 from recc_database.packet.permission import Permission
 from recc_database.variables.database import (
     ROLE_SLUG_DEVELOPER,
@@ -119,6 +120,105 @@ class PgAppropriatePermissionTestCase(PostgresqlTestCase):
         self.assertListEqual(self.owner, perms11)
         self.assertListEqual(self.developer, perms12)
 
+    async def test_batched(self):
+        user0 = await self.db.insert_user("user0", "p", "s", admin=True)
+        pairs = [
+            (self.group1, None),
+            (self.group1, self.project1),
+            (self.group2, None),
+            (self.group2, self.project2),
+            (self.group2, self.project2),
+        ]
+        for user_uid in (user0, self.user1, self.user2, self.user3):
+            result = (
+                await self.db.select_appropriate_permission_slugs_by_user_and_pairs(
+                    user_uid, pairs
+                )
+            )
+            self.assertEqual(4, len(result))
+            for group_uid, project_uid in pairs:
+                if project_uid is None:
+                    expected = await self._group_perms(user_uid, group_uid)
+                else:
+                    expected = await self._project_perms(
+                        user_uid, group_uid, project_uid
+                    )
+                actual = result[group_uid, project_uid]
+                self.assertListEqual(sorted(expected), sorted(actual))
+
+
+class PgAppropriatePermissionCacheTestCase(PgAppropriatePermissionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            permission_cache_size=100,
+        )
+
+    async def test_cache_hit(self):
+        cache = self.db.permission_cache
+        assert cache is not None
+        perms1 = await self._project_perms(self.user1, self.group1, self.project1)
+        hits = cache.hits
+        perms2 = await self._project_perms(self.user1, self.group1, self.project1)
+        self.assertEqual(hits + 1, cache.hits)
+        self.assertListEqual(perms1, perms2)
+
+    async def test_batched_cache(self):
+        cache = self.db.permission_cache
+        assert cache is not None
+        perms = await self._project_perms(self.user1, self.group1, self.project1)
+        pairs = [(self.group1, self.project1), (self.group2, self.project2)]
+        hits = cache.hits
+        result = await self.db.select_appropriate_permission_slugs_by_user_and_pairs(
+            self.user1, pairs
+        )
+        self.assertEqual(hits + 1, cache.hits)
+        self.assertListEqual(sorted(perms), sorted(result[pairs[0]]))
+        self.assertListEqual(sorted(self.guest), sorted(result[pairs[1]]))
+
+        hits = cache.hits
+        perms = await self._project_perms(self.user1, self.group2, self.project2)
+        self.assertEqual(hits + 1, cache.hits)
+        self.assertListEqual(sorted(self.guest), sorted(perms))
+
+    async def test_invalidate_members(self):
+        guest = await self.db.select_role_uid_by_slug(ROLE_SLUG_GUEST)
+        self.assertFalse(await self._group_perms(self.user3, self.group1))
+
+        await self.db.insert_group_member(self.group1, self.user3, guest)
+        self.assertListEqual(
+            self.guest, await self._group_perms(self.user3, self.group1)
+        )
+
+        await self.db.delete_project_member(self.project1, self.user3)
+        perms = await self._project_perms(self.user3, self.group1, self.project1)
+        self.assertListEqual(self.guest, perms)
+
+        await self.db.delete_group_member(self.group1, self.user3)
+        perms = await self._project_perms(self.user3, self.group1, self.project1)
+        self.assertFalse(perms)
+
+    async def test_invalidate_admin(self):
+        self.assertFalse(await self._group_perms(self.user1, self.group2))
+        await self.db.update_user_by_uid(self.user1, admin=True)
+        self.assertListEqual(
+            self.admin, await self._group_perms(self.user1, self.group2)
+        )
+
+    async def test_invalidate_role_permission(self):
+        guest = await self.db.select_role_uid_by_slug(ROLE_SLUG_GUEST)
+        perms = await self._project_perms(self.user1, self.group2, self.project2)
+        self.assertListEqual(self.guest, perms)
+
+        await self.db.update_role_permissions_by_slug(guest, self.reporter)
+        perms = await self._project_perms(self.user1, self.group2, self.project2)
+        self.assertListEqual(sorted(self.reporter), sorted(perms))
+
 
 if __name__ == "__main__":
     main()
@@ -3,6 +3,8 @@
 from datetime import datetime, timedelta
 from unittest import main
 
+from asyncpg.exceptions import UniqueViolationError
+
 from tester.postgresql_test_case import PostgresqlTestCase
 
 
@@ -113,6 +115,72 @@ class PgGroupTestCase(PostgresqlTestCase):
         groups2_ids = [g.uid for g in groups2]
         self.assertNotIn(group1_uid, groups2_ids)
 
+    async def test_insert_groups(self):
+        groups = [
+            dict(slug="group1"),
+            dict(slug="group2", features=["a", "b"], extra={"key": [1, 2]}),
+        ]
+        uids = await self.db.insert_groups(groups)
+        self.assertEqual(2, len(uids))
+
+        group1 = await self.db.select_group_by_uid(uids[0])
+        group2 = await self.db.select_group_by_uid(uids[1])
+        self.assertEqual("group1", group1.slug)
+        self.assertEqual("group2", group2.slug)
+        self.assertListEqual(["a", "b"], group2.features)
+        self.assertDictEqual({"key": [1, 2]}, group2.extra)
+
+        with self.assertRaises(UniqueViolationError):
+            await self.db.insert_groups([dict(slug="group3"), dict(slug="group1")])
+        with self.assertRaises(LookupError):
+            await self.db.select_group_uid_by_slug("group3")
+
+    async def test_select_groups_by_uids(self):
+        uids = await self.db.insert_groups([dict(slug="group1"), dict(slug="group2")])
+        groups = await self.db.select_groups_by_uids(uids + [uids[-1] + 100])
+        self.assertListEqual(sorted(uids), sorted(groups.keys()))
+        self.assertEqual("group1", groups[uids[0]].slug)
+
+    async def test_partial_update_extra(self):
+        uid = await self.db.insert_group("group1", extra={"a": 1})
+        await self.db.merge_group_extra_by_uid(uid, {"b": {"c": 1}})
+        await self.db.update_group_extra_path_by_uid(uid, ["b", "d"], 2)
+        await self.db.delete_group_extra_path_by_uid(uid, ["b", "c"])
+        self.assertEqual(
+            2, await self.db.increment_group_extra_path_by_uid(uid, "n", 2)
+        )
+        extra = (await self.db.select_group_by_uid(uid)).extra
+        self.assertEqual({"a": 1, "b": {"d": 2}, "n": 2}, extra)
+
+    async def test_select_groups_by_features(self):
+        group1 = await self.db.insert_group("group1", features=["a", "b"])
+        group2 = await self.db.insert_group("group2", features=["b", "c"])
+        await self.db.insert_group("group3")
+
+        def uids(groups):
+            return sorted(g.uid for g in groups)
+
+        self.assertEqual([group1], uids(await self.db.select_groups_by_feature("a")))
+        self.assertEqual(
+            [group1, group2], uids(await self.db.select_groups_by_feature("b"))
+        )
+        self.assertEqual(
+            [group2], uids(await self.db.select_groups_by_features_all(["b", "c"]))
+        )
+        self.assertEqual(
+            [group1, group2],
+            uids(await self.db.select_groups_by_features_any(["a", "c"])),
+        )
+        self.assertEqual([], await self.db.select_groups_by_features_any([]))
+
+    async def test_select_groups_by_extra_contains(self):
+        extra = {"gpu": True, "tags": ["x", "y"]}
+        group1 = await self.db.insert_group("group1", extra=extra)
+        await self.db.insert_group("group2", extra={"gpu": False})
+        groups = await self.db.select_groups_by_extra_contains({"tags": ["y"]})
+        self.assertEqual([group1], [g.uid for g in groups])
+        self.assertEqual([], await self.db.select_groups_by_extra_contains({"a": 1}))
+
 
 if __name__ == "__main__":
     main()
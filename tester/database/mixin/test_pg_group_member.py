@@ -88,6 +88,19 @@ class PgGroupMemberTestCase(PostgresqlTestCase):
         await self.db.delete_group_member(self.group_uid, self.user2_uid)
         self.assertEqual(0, len(await self.db.select_group_members()))
 
+    async def test_insert_group_members(self):
+        await self.db.insert_group_members([])
+        await self.db.insert_group_members(
+            [
+                (self.group_uid, self.user1_uid, self.guest),
+                (self.group_uid, self.user2_uid, self.reporter),
+            ]
+        )
+        member1 = await self.db.select_group_member(self.group_uid, self.user1_uid)
+        member2 = await self.db.select_group_member(self.group_uid, self.user2_uid)
+        self.assertEqual(self.guest, member1.role_uid)
+        self.assertEqual(self.reporter, member2.role_uid)
+
 
 if __name__ == "__main__":
     main()
@@ -2,7 +2,7 @@
 
 from unittest import main
 
-from recc_database.database.query.permission import safe_insert_permission_only_slug
+from recc_database.database.query.permission import SAFE_INSERT_PERMISSION_BY_SLUGS
 from recc_database.variables.database import (
     DEFAULT_PERMISSION_SLUGS,
     DEFAULT_ROLE_SLUGS,
@@ -29,12 +29,11 @@ class PgPermissionTestCase(PostgresqlTestCase):
 
     async def test_safe_insert(self):
         perm_slug = "test.safe.insert"
-        query1 = safe_insert_permission_only_slug(perm_slug)
-        await self.db.execute(query1)
+        await self.db.execute(SAFE_INSERT_PERMISSION_BY_SLUGS, [perm_slug])
         items1 = await self.db.select_permission_all()
+        self.assertIn(perm_slug, [p.slug for p in items1])
 
-        query2 = safe_insert_permission_only_slug(perm_slug)
-        await self.db.execute(query2)
+        await self.db.execute(SAFE_INSERT_PERMISSION_BY_SLUGS, [perm_slug, perm_slug])
         items2 = await self.db.select_permission_all()
 
         self.assertListEqual(items1, items2)
@@ -128,6 +128,57 @@ class PgProjectTestCase(PostgresqlTestCase):
         projects2 = await self.db.select_projects_by_group_uid(self.group.uid)
         self.assertEqual(0, len(projects2))
 
+    async def test_insert_projects(self):
+        projects = [
+            dict(group_uid=self.group_uid, slug="project1"),
+            dict(group_uid=self.group_uid, slug="project2", extra={"a": 1}),
+        ]
+        uids = await self.db.insert_projects(projects)
+        self.assertEqual(2, len(uids))
+
+        for uid, project in zip(uids, projects):
+            self.assertEqual(
+                uid,
+                await self.db.select_project_uid_by_group_uid_and_slug(
+                    self.group_uid, project["slug"]
+                ),
+            )
+        project2 = await self.db.select_project_by_uid(uids[1])
+        self.assertDictEqual({"a": 1}, project2.extra)
+
+    async def test_select_projects_by_uids(self):
+        uid1 = await self.db.insert_project(self.group_uid, "project1")
+        uid2 = await self.db.insert_project(self.group_uid, "project2")
+        projects = await self.db.select_projects_by_uids([uid2, uid1])
+        self.assertListEqual([uid1, uid2], sorted(projects.keys()))
+        self.assertEqual("project2", projects[uid2].slug)
+
+    async def test_partial_update_extra(self):
+        uid = await self.db.insert_project(self.group_uid, "project1")
+        await self.db.merge_project_extra_by_uid(uid, {"b": {"c": 1}})
+        await self.db.update_project_extra_path_by_uid(uid, ["b", "d"], 2)
+        await self.db.delete_project_extra_path_by_uid(uid, ["b", "c"])
+        self.assertEqual(
+            2, await self.db.increment_project_extra_path_by_uid(uid, "n", 2)
+        )
+        extra = (await self.db.select_project_by_uid(uid)).extra
+        self.assertEqual({"b": {"d": 2}, "n": 2}, extra)
+
+    async def test_select_projects_by_features(self):
+        uid1 = await self.db.insert_project(self.group_uid, "p1", features=["a"])
+        uid2 = await self.db.insert_project(self.group_uid, "p2", features=["a", "b"])
+        await self.db.insert_project(self.group_uid, "p3", extra={"k": {"v": 1}})
+
+        projects = await self.db.select_projects_by_feature("a")
+        self.assertEqual([uid1, uid2], sorted(p.uid for p in projects))
+        projects = await self.db.select_projects_by_features_all(["a", "b"])
+        self.assertEqual([uid2], [p.uid for p in projects])
+        projects = await self.db.select_projects_by_features_any(["b", "c"])
+        self.assertEqual([uid2], [p.uid for p in projects])
+
+        projects = await self.db.select_projects_by_extra_contains({"k": {"v": 1}})
+        self.assertEqual(["p3"], [p.slug for p in projects])
+
 
 if __name__ == "__main__":
     main()
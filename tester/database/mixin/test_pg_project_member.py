@@ -86,6 +86,19 @@ class PgProjectMemberTestCase(PostgresqlTestCase):
         await self.db.delete_project_member(self.project_uid, self.user2_uid)
         self.assertEqual(0, len(await self.db.select_project_members()))
 
+    async def test_insert_project_members(self):
+        await self.db.insert_project_members(
+            [
+                (self.project_uid, self.user1_uid, self.role1_uid),
+                (self.project_uid, self.user2_uid, self.role2_uid),
+            ]
+        )
+        members = await self.db.select_project_members_by_project_uid(self.project_uid)
+        roles = {m.user_uid: m.role_uid for m in members}
+        self.assertDictEqual(
+            {self.user1_uid: self.role1_uid, self.user2_uid: self.role2_uid}, roles
+        )
+
 
 if __name__ == "__main__":
     main()
@@ -131,6 +131,26 @@ class PgRoleTestCase(PostgresqlTestCase):
         )
         self.assertEqual(role2_uid, role.uid)
 
+    async def test_select_role_slugs_by_uids(self):
+        role1 = await self.db.insert_role("role1")
+        slugs = await self.db.select_role_slugs_by_uids([ROLE_UID_OWNER, role1])
+        self.assertDictEqual({ROLE_UID_OWNER: ROLE_SLUG_OWNER, role1: "role1"}, slugs)
+        self.assertDictEqual(dict(), await self.db.select_role_slugs_by_uids([]))
+
+    async def test_partial_update_extra(self):
+        uid = await self.db.insert_role("role1")
+        await self.db.merge_role_extra_by_uid(uid, {"b": {"c": 1}})
+        await self.db.update_role_extra_path_by_uid(uid, ["b", "d"], 2)
+        await self.db.delete_role_extra_path_by_uid(uid, ["b", "c"])
+        self.assertEqual(2, await self.db.increment_role_extra_path_by_uid(uid, "n", 2))
+        extra = (await self.db.select_role_by_uid(uid)).extra
+        self.assertEqual({"b": {"d": 2}, "n": 2}, extra)
+
+    async def test_select_roles_by_extra_contains(self):
+        role1 = await self.db.insert_role("role1", extra={"scope": ["a", "b"]})
+        roles = await self.db.select_roles_by_extra_contains({"scope": ["b"]})
+        self.assertEqual([role1], [r.uid for r in roles])
+
 
 if __name__ == "__main__":
     main()
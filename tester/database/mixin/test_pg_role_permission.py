@@ -3,8 +3,10 @@
 from unittest import main
 
 from recc_database.database.query.role_permission import (
-    safe_insert_role_permission_by_slug,
+    SAFE_INSERT_ROLE_PERMISSION_BY_ROLE_SLUG_AND_PERMISSION_SLUGS,
+    SAFE_INSERT_ROLE_PERMISSION_BY_ROLE_UID_AND_PERMISSION_SLUGS,
 )
+from recc_database.variables.database import ROLE_SLUG_GUEST, ROLE_SLUG_OWNER
 from tester.postgresql_test_case import PostgresqlTestCase
 
 
@@ -16,12 +18,12 @@ class PgRolePermissionTestCase(PostgresqlTestCase):
         role1_uid = await self.db.insert_role(role1_slug)
         await self.db.select_role_permission_all()
 
-        query1 = safe_insert_role_permission_by_slug(role1_uid, perm1_slug)
-        await self.db.execute(query1)
+        query1 = SAFE_INSERT_ROLE_PERMISSION_BY_ROLE_UID_AND_PERMISSION_SLUGS
+        await self.db.execute(query1, role1_uid, [perm1_slug])
         items1 = await self.db.select_role_permission_all()
 
-        query2 = safe_insert_role_permission_by_slug(role1_slug, perm1_slug)
-        await self.db.execute(query2)
+        query2 = SAFE_INSERT_ROLE_PERMISSION_BY_ROLE_SLUG_AND_PERMISSION_SLUGS
+        await self.db.execute(query2, role1_slug, [perm1_slug, perm1_slug])
         items2 = await self.db.select_role_permission_all()
 
         self.assertListEqual(items1, items2)
@@ -41,6 +43,62 @@ class PgRolePermissionTestCase(PostgresqlTestCase):
         items3 = await self.db.select_role_permission_all()
         self.assertEqual(len(items3), len(items1))
 
+    async def test_insert_and_update_by_slug(self):
+        perm1_uid = await self.db.insert_permission("test.perm1")
+        perm2_uid = await self.db.insert_permission("test.perm2")
+        perm3_uid = await self.db.insert_permission("test.perm3")
+        role1_uid = await self.db.insert_role("role1")
+
+        async def _permission_uids():
+            items = await self.db.select_role_permission_by_role_uid(role1_uid)
+            return set(item.permission_uid for item in items)
+
+        slugs1 = ["test.perm1", "test.perm2", "test.unknown"]
+        await self.db.insert_role_permissions_by_slug(role1_uid, slugs1)
+        self.assertSetEqual({perm1_uid, perm2_uid}, await _permission_uids())
+
+        await self.db.insert_role_permissions_by_slug(role1_uid, slugs1)
+        self.assertSetEqual({perm1_uid, perm2_uid}, await _permission_uids())
+
+        slugs2 = ["test.perm2", "test.perm3"]
+        await self.db.update_role_permissions_by_slug(role1_uid, slugs2)
+        self.assertSetEqual({perm2_uid, perm3_uid}, await _permission_uids())
+
+        await self.db.update_role_permissions_by_slug(role1_uid, [])
+        self.assertSetEqual(set(), await _permission_uids())
+
+    async def test_permission_matrix(self):
+        self.assertIsNone(self.db.permission_matrix)
+        matrix = await self.db.select_permission_matrix()
+        self.assertIs(matrix, self.db.permission_matrix)
+
+        for slug in (ROLE_SLUG_GUEST, ROLE_SLUG_OWNER):
+            role_uid = await self.db.select_role_uid_by_slug(slug)
+            permissions = await self.db.select_permission_by_role_uid(role_uid)
+            slugs = sorted(p.slug for p in permissions if p.slug)
+            self.assertListEqual(slugs, sorted(matrix.permission_slugs(role_uid)))
+            for p in permissions:
+                self.assertTrue(matrix.has_permission(role_uid, p.slug))
+
+        # The changes reload the matrix that was in use.
+        perm1_uid = await self.db.insert_permission("test.perm1")
+        matrix = self.db.permission_matrix
+        self.assertIsNotNone(matrix)
+        self.assertNotEqual(0, matrix.slug_mask("test.perm1"))
+        role1_uid = await self.db.insert_role("role1")
+        matrix = await self.db.select_permission_matrix()
+        self.assertFalse(matrix.has_permission(role1_uid, "test.perm1"))
+
+        await self.db.update_role_permissions_by_slug(role1_uid, ["test.perm1"])
+        matrix = self.db.permission_matrix
+        self.assertIsNotNone(matrix)
+        self.assertTrue(matrix.has_permission_uid(role1_uid, perm1_uid))
+
+        await self.db.delete_role_by_uid(role1_uid)
+        matrix = self.db.permission_matrix
+        self.assertIsNotNone(matrix)
+        self.assertFalse(matrix.has_permission_uid(role1_uid, perm1_uid))
+
 
 if __name__ == "__main__":
     main()
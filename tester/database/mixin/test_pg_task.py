@@ -150,6 +150,44 @@ class PgTaskTestCase(PostgresqlTestCase):
         self.assertEqual(updated_at1, task1.updated_at)
         self.assertEqual(updated_at2, task2.updated_at)
 
+    async def test_partial_update_extra(self):
+        uid = await self.db.insert_task(self.project.uid, "task1")
+        await self.db.merge_task_extra_by_uid(uid, {"a": 1, "b": {"c": 2}})
+        await self.db.merge_task_extra_by_uid(uid, {"d": [1, 2]})
+        await self.db.update_task_extra_path_by_uid(uid, ["b", "c"], "x")
+        await self.db.update_task_extra_path_by_uid(uid, ["d", 0], None)
+        await self.db.update_task_extra_path_by_uid(uid, ["e", "f"], 1)
+        await self.db.delete_task_extra_path_by_uid(uid, "a")
+        task = await self.db.select_task_by_uid(uid)
+        self.assertEqual({"b": {"c": "x"}, "d": [None, 2]}, task.extra)
+
+        self.assertEqual(1, await self.db.increment_task_extra_path_by_uid(uid, "n"))
+        self.assertEqual(
+            11, await self.db.increment_task_extra_path_by_uid(uid, ["n"], 10)
+        )
+        self.assertEqual(
+            0.5, await self.db.increment_task_extra_path_by_uid(uid, "m", 0.5)
+        )
+        with self.assertRaises(LookupError):
+            await self.db.increment_task_extra_path_by_uid(uid, ["e", "f"])
+        with self.assertRaises(LookupError):
+            await self.db.increment_task_extra_path_by_uid(uid + 100, "n")
+
+        updated_at = datetime.now().astimezone() + timedelta(days=1)
+        await self.db.delete_task_extra_path_by_uid(uid, ["b", "c"], updated_at)
+        task = await self.db.select_task_by_uid(uid)
+        self.assertEqual({"b": {}, "d": [None, 2], "n": 11, "m": 0.5}, task.extra)
+        self.assertEqual(updated_at, task.updated_at)
+
+    async def test_partial_update_publish_ports(self):
+        ports = {"8080/tcp": 30000}
+        uid = await self.db.insert_task(self.project.uid, "task1", publish_ports=ports)
+        await self.db.merge_task_publish_ports_by_uid(uid, {"9090/tcp": 30001})
+        await self.db.update_task_publish_ports_path_by_uid(uid, "8080/tcp", 30002)
+        await self.db.delete_task_publish_ports_path_by_uid(uid, "9090/tcp")
+        task = await self.db.select_task_by_uid(uid)
+        self.assertEqual({"8080/tcp": 30002}, task.publish_ports)
+
     async def test_update_keys(self):
         slug1 = "task1"
         slug2 = "task2"
@@ -257,6 +295,34 @@ class PgTaskTestCase(PostgresqlTestCase):
         tasks2 = await self.db.select_task_by_project_uid(self.project.uid)
         self.assertEqual(0, len(tasks2))
 
+    async def test_insert_tasks(self):
+        tasks = [dict(project_uid=self.project_uid, slug=f"task{i}") for i in range(10)]
+        tasks[3]["publish_ports"] = {"8080": 80}
+        uids = await self.db.insert_tasks(tasks)
+        self.assertEqual(10, len(uids))
+        self.assertEqual(10, len(set(uids)))
+
+        for uid, task in zip(uids, tasks):
+            selected = await self.db.select_task_by_uid(uid)
+            self.assertEqual(task["slug"], selected.slug)
+            self.assertEqual(self.project_uid, selected.project_uid)
+        task3 = await self.db.select_task_by_uid(uids[3])
+        self.assertDictEqual({"8080": 80}, task3.publish_ports)
+
+    async def test_select_tasks_by_uids(self):
+        uid1 = await self.db.insert_task(self.project_uid, "task1")
+        uid2 = await self.db.insert_task(self.project_uid, "task2", extra={"a": 1})
+        tasks = await self.db.select_tasks_by_uids([uid1, uid2])
+        self.assertListEqual([uid1, uid2], sorted(tasks.keys()))
+        self.assertDictEqual({"a": 1}, tasks[uid2].extra)
+
+    async def test_select_tasks_by_extra_contains(self):
+        uid1 = await self.db.insert_task(self.project.uid, "t1", extra={"gpu": True})
+        await self.db.insert_task(self.project.uid, "t2", extra={"gpu": False})
+        await self.db.insert_task(self.project.uid, "t3")
+        tasks = await self.db.select_tasks_by_extra_contains({"gpu": True})
+        self.assertEqual([uid1], [t.uid for t in tasks])
+
 
 if __name__ == "__main__":
     main()
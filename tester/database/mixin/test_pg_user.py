@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
 
 from datetime import datetime, timedelta
-from unittest import main, skipIf
+from unittest import main
 
 from tester.postgresql_test_case import PostgresqlTestCase
-from tester.variables import UID_PERFORMANCE_ITERATION, UID_PERFORMANCE_TEST_SKIP
 
 
 class PgUserTestCase(PostgresqlTestCase):
@@ -53,23 +52,6 @@ class PgUserTestCase(PostgresqlTestCase):
         username2 = await self.db.select_user_username_by_uid(user_uid)
         self.assertEqual(username, username2)
 
-    @skipIf(UID_PERFORMANCE_TEST_SKIP, "UID performance testing is off")
-    async def test_user_uid_by_username(self):
-        user1 = "user1"
-        user1_uid1 = await self.db.insert_user(user1, "pw", "salt")
-        user1_uid2 = await self.db.select_user_uid_by_username(user1)
-        self.assertEqual(user1_uid1, user1_uid2)
-
-        total_count = UID_PERFORMANCE_ITERATION
-        total_seconds = 0
-        for n in range(total_count):
-            begin = datetime.now()
-            await self.db.select_user_uid_by_username(user1)
-            total_seconds += (datetime.now() - begin).total_seconds()
-
-        avg_duration = total_seconds / total_count
-        print(f"PgSQL UID Performance: {avg_duration}s ({total_count}itr)")
-
     async def test_last_login(self):
         username = "admin"
         password = "password"
@@ -117,6 +99,43 @@ class PgUserTestCase(PostgresqlTestCase):
         self.assertTrue(await self.db.select_exists_admin_user())
         self.assertTrue(await self.db.select_exists_admin_user())
 
+    async def test_insert_users(self):
+        self.assertListEqual([], await self.db.insert_users([]))
+
+        users = [
+            dict(username="user1", password="pass1", salt="salt1"),
+            dict(username="user2", password="pass2", salt="salt2", admin=True),
+            dict(username="user3", password="pass3", salt="salt3", nickname="n3"),
+        ]
+        uids = await self.db.insert_users(users)
+        self.assertEqual(3, len(uids))
+
+        for uid, user in zip(uids, users):
+            self.assertEqual(
+                uid, await self.db.select_user_uid_by_username(user["username"])
+            )
+
+        user2 = await self.db.select_user_by_uid(uids[1])
+        self.assertTrue(user2.admin)
+        self.assertEqual(str(), user2.nickname)
+        self.assertEqual(user2.created_at, user2.updated_at)
+
+        uid4 = await self.db.insert_user("user4", "pass4", "salt4")
+        self.assertNotIn(uid4, uids)
+
+    async def test_select_by_uids(self):
+        uid1 = await self.db.insert_user("user1", "pw", "salt")
+        uid2 = await self.db.insert_user("user2", "pw", "salt")
+        unknown = uid2 + 100
+
+        users = await self.db.select_users_by_uids([uid1, uid2, uid1, unknown])
+        self.assertSetEqual({uid1, uid2}, set(users.keys()))
+        self.assertEqual("user2", users[uid2].username)
+
+        names = await self.db.select_user_usernames_by_uids([uid2, unknown])
+        self.assertDictEqual({uid2: "user2"}, names)
+        self.assertDictEqual(dict(), await self.db.select_users_by_uids([]))
+
 
 if __name__ == "__main__":
     main()
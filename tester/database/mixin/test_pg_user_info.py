@@ -79,6 +79,36 @@ class PgUserInfoTestCase(PostgresqlTestCase):
         self.assertEqual(created_at, info1.created_at)
         self.assertEqual(updated_at, info1.updated_at)
 
+    async def test_multi_key_user_info(self):
+        user_uid = self.user_uid
+        created_at = datetime.now().astimezone()
+        await self.db.upsert_user_infos(user_uid, {})
+        await self.db.upsert_user_infos(user_uid, {"k1": "v1", "k2": "v2"}, created_at)
+        self.assertEqual(2, len(await self.db.select_user_infos(user_uid)))
+
+        updated_at = created_at + timedelta(days=2)
+        infos = {"k2": "v2-2", "k3": "v3"}
+        await self.db.upsert_user_infos(user_uid, infos, updated_at)
+
+        result = await self.db.select_user_infos_by_keys(user_uid, ["k1", "k2", "k3"])
+        self.assertEqual(
+            {"k1": "v1", "k2": "v2-2", "k3": "v3"},
+            {k: v.value for k, v in result.items()},
+        )
+        self.assertEqual(created_at, result["k1"].updated_at)
+        self.assertEqual(created_at, result["k2"].created_at)
+        self.assertEqual(updated_at, result["k2"].updated_at)
+        self.assertEqual(updated_at, result["k3"].created_at)
+
+        result = await self.db.select_user_infos_by_keys(user_uid, ["k1", "unknown"])
+        self.assertEqual(["k1"], list(result.keys()))
+        self.assertEqual({}, await self.db.select_user_infos_by_keys(user_uid, []))
+
+        await self.db.delete_user_infos_by_keys(user_uid, [])
+        await self.db.delete_user_infos_by_keys(user_uid, ["k1", "k3", "unknown"])
+        infos = await self.db.select_user_infos(user_uid)
+        self.assertEqual(["k2"], [info.key for info in infos])
+
     async def test_like_user_info(self):
         user_uid = self.user_uid
         self.assertEqual(0, len(await self.db.select_user_infos(user_uid)))
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+from unittest import main
+
+from recc_database.database.pg_db import PgDb
+from recc_database.variables.database import TABLE_INFO
+from tester.postgresql_test_case import PostgresqlTestCase
+
+_UPDATE_INFO = f"UPDATE {TABLE_INFO} SET value=$2, updated_at=now() WHERE key=$1;"
+_DELETE_INFO = f"DELETE FROM {TABLE_INFO} WHERE key=$1;"
+
+
+class PgInfoCacheTestCase(PostgresqlTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            info_cache=True,
+            info_cache_ttl=3600.0,
+        )
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.cache = self.db.info_cache
+        assert self.cache is not None
+        await self.db.insert_info("test.key1", "value1")
+        await self.db.insert_info("test.key2", "value2")
+        await self.db.insert_info("other.key", "value3")
+
+    async def test_snapshot(self):
+        self.assertIsNone(self.cache.snapshot)
+        version = await self.db.select_database_version()
+        snapshot = self.cache.snapshot
+        self.assertIsNotNone(snapshot)
+
+        infos = await self.db.select_infos_like("test.%")
+        self.assertEqual(["test.key1", "test.key2"], [i.key for i in infos])
+        self.assertTrue(await self.db.exists_info_by_key("other.key"))
+        self.assertFalse(await self.db.exists_info_by_key("unknown"))
+        self.assertEqual(
+            "value1", (await self.db.select_info_by_key("test.key1")).value
+        )
+        with self.assertRaises(LookupError):
+            await self.db.select_info_by_key("unknown")
+        self.assertEqual(version, await self.db.select_database_version())
+        self.assertIs(snapshot, self.cache.snapshot)
+
+        # A write outside of PgInfo is not seen until the snapshot is revalidated.
+        await self.db.execute(_UPDATE_INFO, "test.key1", "changed")
+        self.assertEqual(
+            "value1", (await self.db.select_info_by_key("test.key1")).value
+        )
+
+    async def test_writes(self):
+        await self.db.select_infos()
+        await self.db.upsert_info("test.key1", "changed")
+        self.assertIsNone(self.cache.snapshot)
+        self.assertEqual(
+            "changed", (await self.db.select_info_by_key("test.key1")).value
+        )
+
+        await self.db.delete_info_by_key("test.key2")
+        self.assertFalse(await self.db.exists_info_by_key("test.key2"))
+
+        await self.db.insert_info("test.key3", "value3")
+        await self.db.update_info_value_by_key("test.key3", "changed")
+        infos = await self.db.select_infos_like("test.%")
+        self.assertEqual(["changed", "changed"], [i.value for i in infos])
+
+    async def test_revalidate(self):
+        db = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            info_cache=True,
+            info_cache_ttl=0.0,
+        )
+        await db.open()
+        try:
+            snapshot = await db.select_info_snapshot()
+            self.assertIs(snapshot, await db.select_info_snapshot())
+
+            await self.db.execute(_UPDATE_INFO, "test.key1", "changed")
+            self.assertEqual(
+                "changed", (await db.select_info_by_key("test.key1")).value
+            )
+            await self.db.execute(_DELETE_INFO, "test.key2")
+            self.assertFalse(await db.exists_info_by_key("test.key2"))
+        finally:
+            await db.close()
+
+    async def test_session(self):
+        await self.db.select_infos()
+        async with self.db.session(transaction=True) as session:
+            self.assertIsNone(await session.select_info_snapshot())
+            await session.upsert_info("test.key1", "changed")
+            value = (await session.select_info_by_key("test.key1")).value
+            self.assertEqual("changed", value)
+        self.assertIsNone(self.cache.snapshot)
+        self.assertEqual(
+            "changed", (await self.db.select_info_by_key("test.key1")).value
+        )
+
+
+if __name__ == "__main__":
+    main()
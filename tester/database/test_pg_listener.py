@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import sleep
+from typing import Callable
+from unittest import main
+
+from recc_database.database.pg_db import PgDb
+from recc_database.database.query.create.triggers import (
+    get_notify_change_trigger_name,
+)
+from recc_database.variables.database import (
+    CHANGE_OP_INSERT,
+    CHANGE_OP_UPDATE,
+    ROLE_SLUG_GUEST,
+    TABLE_ROLE,
+    TABLE_TASK,
+    TABLE_USER,
+    TRIGGER_NOTIFY_CHANGE_SUFFIX,
+)
+from tester.postgresql_test_case import PostgresqlTestCase
+
+_WAIT_STEP_SECONDS = 0.01
+_WAIT_TIMEOUT_SECONDS = 2.0
+_SELECT_NOTIFY_CHANGE_TRIGGERS = f"""
+SELECT tgname
+FROM pg_trigger
+WHERE tgname LIKE '%{TRIGGER_NOTIFY_CHANGE_SUFFIX}';
+"""
+
+
+async def _wait_until(predicate: Callable[[], bool]) -> bool:
+    elapsed = 0.0
+    while not predicate():
+        if elapsed >= _WAIT_TIMEOUT_SECONDS:
+            return False
+        await sleep(_WAIT_STEP_SECONDS)
+        elapsed += _WAIT_STEP_SECONDS
+    return True
+
+
+class PgListenerTestCase(PostgresqlTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.node = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            permission_cache_size=100,
+            listen_changes=True,
+        )
+        await self.node.open()
+        self.assertIsNotNone(self.node.listener)
+        self.assertTrue(self.node.listener.is_open())
+
+    async def asyncTearDown(self):
+        await self.node.close()
+        self.assertIsNone(self.node.listener)
+        await super().asyncTearDown()
+
+    async def test_cross_process_invalidation(self):
+        user = await self.db.insert_user("user1", "p", "s")
+        group = await self.db.insert_group("group1")
+        guest = await self.db.select_role_uid_by_slug(ROLE_SLUG_GUEST)
+
+        cache = self.node.permission_cache
+        assert cache is not None
+        perms = await self.node.select_appropriate_permission_by_user_and_group(
+            user, group
+        )
+        self.assertFalse(perms)
+        self.assertEqual(1, len(cache))
+
+        # Written by another node; only the notification can invalidate the cache.
+        await self.db.insert_group_member(group, user, guest)
+        self.assertTrue(await _wait_until(lambda: len(cache) == 0))
+
+        perms = await self.node.select_appropriate_permission_by_user_and_group(
+            user, group
+        )
+        self.assertEqual(1, len(perms))
+
+    async def test_received(self):
+        bus = self.node.invalidation_bus
+        assert bus is not None
+        received = bus.received
+        await self.db.insert_permission("test.perm1")
+        self.assertTrue(await _wait_until(lambda: bus.received > received))
+
+    async def test_unwatched_updates(self):
+        bus = self.node.invalidation_bus
+        assert bus is not None
+        user = await self.db.insert_user("user1", "p", "s")
+        received = bus.received
+
+        # The notifications arrive in commit order, so the permission insert
+        # would follow the notification of the login update.
+        await self.db.update_user_last_login_by_uid(user)
+        await self.db.insert_permission("test.perm1")
+        self.assertTrue(await _wait_until(lambda: bus.received > received))
+        await sleep(_WAIT_STEP_SECONDS * 10)
+        self.assertEqual(received + 1, bus.received)
+
+    async def test_consumed_triggers_only(self):
+        triggers = await self.db.fetch_rows(_SELECT_NOTIFY_CHANGE_TRIGGERS)
+        names = {r["tgname"] for r in triggers}
+        role_insert = get_notify_change_trigger_name(TABLE_ROLE, CHANGE_OP_INSERT)
+        user_insert = get_notify_change_trigger_name(TABLE_USER, CHANGE_OP_INSERT)
+        user_update = get_notify_change_trigger_name(TABLE_USER, CHANGE_OP_UPDATE)
+        task_update = get_notify_change_trigger_name(TABLE_TASK, CHANGE_OP_UPDATE)
+        self.assertIn(role_insert, names)  # The matrix consumes the new roles.
+        self.assertIn(user_update, names)
+        self.assertNotIn(user_insert, names)
+        self.assertNotIn(task_update, names)
+
+        # Installing the existing triggers again changes nothing.
+        await self.node.create_tables()
+        triggers = await self.db.fetch_rows(_SELECT_NOTIFY_CHANGE_TRIGGERS)
+        self.assertSetEqual(names, {r["tgname"] for r in triggers})
+
+    async def test_reconnect(self):
+        listener = self.node.listener
+        cache = self.node.permission_cache
+        assert listener is not None
+        assert cache is not None
+
+        user = await self.db.insert_user("user1", "p", "s")
+        group = await self.db.insert_group("group1")
+        await self.node.select_appropriate_permission_by_user_and_group(user, group)
+        self.assertEqual(1, len(cache))
+
+        assert listener._conn is not None
+        pid = listener._conn.get_server_pid()
+        await self.db.execute("SELECT pg_terminate_backend($1);", pid)
+        self.assertTrue(await _wait_until(lambda: not listener.is_open()))
+        self.assertEqual(0, len(cache))
+        self.assertTrue(await _wait_until(listener.is_open))
+
+
+if __name__ == "__main__":
+    main()
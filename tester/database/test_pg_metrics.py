@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+from unittest import main
+
+from recc_database.database.metrics.in_memory_metrics import InMemoryMetrics
+from recc_database.database.metrics.prometheus import export_prometheus_text
+from recc_database.database.pg_db import PgDb
+from tester.postgresql_test_case import PostgresqlTestCase
+
+
+class PgMetricsTestCase(PostgresqlTestCase):
+    def setUp(self):
+        super().setUp()
+        self.metrics = InMemoryMetrics()
+        self.db = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            metrics=self.metrics,
+        )
+
+    async def test_queries(self):
+        self.metrics.reset()
+        uid = await self.db.insert_user("user1", "pass1", "salt1")
+        await self.db.select_user_by_uid(uid)
+        with self.assertRaises(LookupError):
+            await self.db.select_user_by_uid(uid + 1)
+        await self.db.insert_users([dict(username="u2", password="p", salt="s")])
+        await self.db.select_users()
+
+        snapshot = self.db.metrics_snapshot()
+        self.assertEqual(1, snapshot.queries["INSERT_USER"].latency.count)
+        self.assertEqual(1, snapshot.queries["INSERT_USER"].rows)
+        self.assertEqual(2, snapshot.queries["SELECT_USER_BY_UID"].latency.count)
+        self.assertEqual(1, snapshot.queries["SELECT_USER_BY_UID"].rows)
+        self.assertEqual(1, snapshot.queries["COPY recc_user"].rows)
+        self.assertEqual(2, snapshot.queries["SELECT_USER_ALL"].rows)
+        self.assertLessEqual(4, snapshot.acquire_wait.count)
+        self.assertIsNotNone(snapshot.pool_in_use)
+
+        text = export_prometheus_text(snapshot)
+        self.assertIn('recc_db_query_rows_total{query="SELECT_USER_ALL"} 2', text)
+
+    async def test_session_acquire(self):
+        self.metrics.reset()
+        async with self.db.session(transaction=True) as session:
+            uid = await session.insert_user("user1", "pass1", "salt1")
+            await session.select_user_by_uid(uid)
+        snapshot = self.db.metrics_snapshot()
+        self.assertEqual(1, snapshot.acquire_wait.count)
+
+    async def test_errors(self):
+        self.metrics.reset()
+        with self.assertRaises(Exception):
+            await self.db.execute("SELECT * FROM _unknown_table_;")
+        snapshot = self.db.metrics_snapshot()
+        self.assertEqual(1, snapshot.queries["unregistered"].errors)
+        self.assertEqual(1, snapshot.error_types["UndefinedTableError"])
+
+
+if __name__ == "__main__":
+    main()
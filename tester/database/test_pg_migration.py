@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import gather
+from unittest import TestCase, main
+
+from asyncpg.exceptions import UndefinedTableError
+
+from recc_database import __version__
+from recc_database.database.migration import (
+    MIGRATION_STEPS,
+    MigrationStep,
+    advisory_lock,
+    apply_migrations,
+    parse_version,
+)
+from recc_database.variables.database import (
+    INDEX_GROUP_FEATURES,
+    INDEX_GROUP_MEMBER_USER_UID,
+    INDEX_PROJECT_MEMBER_USER_UID,
+    INDEX_TASK_EXTRA,
+    INDEX_USER_NAME,
+    INFO_KEY_RECC_DB_VERSION,
+    TABLE_GROUP,
+    TABLE_GROUP_MEMBER,
+    TABLE_TASK,
+    TABLE_USER,
+)
+from tester.postgresql_test_case import PostgresqlTestCase
+
+_EXISTS_INDEX = "SELECT EXISTS (SELECT * FROM pg_indexes WHERE indexname=$1);"
+_TEST_TABLE = "recc_migration_test"
+
+
+class MigrationTestCase(TestCase):
+    def test_parse_version(self):
+        self.assertEqual((2, 2, 0), parse_version("2.2.0"))
+        self.assertLess(parse_version("2.9.0"), parse_version("2.10.0"))
+        self.assertEqual((2, 3, 0), parse_version("2.3.0rc1"))
+        self.assertEqual((2, 3, 0), parse_version("2.3.0.dev0"))
+        self.assertEqual((2, 3, 0), parse_version("2.3.0.post1"))
+        with self.assertRaises(ValueError):
+            parse_version("unknown")
+
+    def test_ordered(self):
+        versions = [parse_version(s.version) for s in MIGRATION_STEPS]
+        self.assertEqual(sorted(versions), versions)
+        self.assertLessEqual(versions[-1], parse_version(__version__))
+
+
+class PgMigrationTestCase(PostgresqlTestCase):
+    async def asyncTearDown(self):
+        await self.db.execute(f"DROP TABLE IF EXISTS {_TEST_TABLE};")
+        await super().asyncTearDown()
+
+    async def exists_index(self, name: str) -> bool:
+        return await self.db.column(bool, _EXISTS_INDEX, name)
+
+    async def test_fresh_database(self):
+        self.assertEqual(__version__, await self.db.select_database_version())
+        self.assertTrue(await self.exists_index(INDEX_GROUP_MEMBER_USER_UID))
+        self.assertTrue(await self.exists_index(INDEX_PROJECT_MEMBER_USER_UID))
+        self.assertFalse(await self.exists_index(INDEX_USER_NAME))
+        self.assertEqual([], await self.db.migrate())
+
+    async def test_upgrade_from_2_1_0(self):
+        await self.db.execute(
+            f"CREATE INDEX {INDEX_USER_NAME} ON {TABLE_USER} (username);"
+        )
+        await self.db.execute(f"DROP INDEX {INDEX_GROUP_MEMBER_USER_UID};")
+        await self.db.update_info_value_by_key(INFO_KEY_RECC_DB_VERSION, "2.1.0")
+
+        await self.db.create_tables()
+        self.assertEqual(__version__, await self.db.select_database_version())
+        self.assertFalse(await self.exists_index(INDEX_USER_NAME))
+        self.assertTrue(await self.exists_index(INDEX_GROUP_MEMBER_USER_UID))
+
+    async def test_upgrade_from_2_2_0(self):
+        await self.db.execute(f"DROP INDEX {INDEX_TASK_EXTRA};")
+        await self.db.update_info_value_by_key(INFO_KEY_RECC_DB_VERSION, "2.2.0")
+        self.assertEqual(["2.3.0"], await self.db.migrate())
+        self.assertTrue(await self.exists_index(INDEX_TASK_EXTRA))
+
+    async def test_step_transaction(self):
+        steps = (
+            MigrationStep("9.0.0", (f"CREATE TABLE {_TEST_TABLE} (v INTEGER);",)),
+            MigrationStep(
+                "9.1.0",
+                (
+                    f"INSERT INTO {_TEST_TABLE} VALUES (1);",
+                    "SELECT * FROM recc_unknown_table;",
+                ),
+            ),
+        )
+        async with self.db.conn() as conn:
+            with self.assertRaises(UndefinedTableError):
+                await apply_migrations(conn, steps)
+            self.assertEqual("9.0.0", await self.db.select_database_version())
+            self.assertEqual(
+                0, await conn.fetchval(f"SELECT count(*) FROM {_TEST_TABLE};")
+            )
+
+            steps = steps[0], MigrationStep("9.1.0", steps[1].queries[:1])
+            self.assertEqual(["9.1.0"], await apply_migrations(conn, steps))
+        self.assertEqual("9.1.0", await self.db.select_database_version())
+
+    async def test_concurrent_nodes(self):
+        steps = (
+            MigrationStep(
+                "9.0.0",
+                (f"CREATE TABLE {_TEST_TABLE} (v INTEGER);",),
+            ),
+            MigrationStep(
+                "9.1.0",
+                (f"CREATE INDEX CONCURRENTLY {_TEST_TABLE}_v ON {_TEST_TABLE} (v);",),
+                transaction=False,
+            ),
+        )
+
+        async def _node():
+            async with self.db.conn() as conn:
+                async with advisory_lock(conn):
+                    return await apply_migrations(conn, steps)
+
+        results = await gather(_node(), _node())
+        self.assertIn(["9.0.0", "9.1.0"], results)
+        self.assertIn([], results)
+        self.assertTrue(await self.exists_index(f"{_TEST_TABLE}_v"))
+
+    async def test_cascade_uses_user_uid_index(self):
+        query = f"EXPLAIN SELECT * FROM {TABLE_GROUP_MEMBER} WHERE user_uid=$1;"
+        async with self.db.conn() as conn:
+            async with conn.transaction():
+                await conn.execute("SET LOCAL enable_seqscan=off;")
+                plan = "\n".join(row[0] for row in await conn.fetch(query, 1))
+        self.assertIn(INDEX_GROUP_MEMBER_USER_UID, plan)
+
+    async def test_containment_uses_gin_index(self):
+        queries = (
+            (f"SELECT * FROM {TABLE_GROUP} WHERE features @> $1::VARCHAR[];", ["a"]),
+            (f"SELECT * FROM {TABLE_TASK} WHERE extra @> $1::JSONB;", {"a": 1}),
+        )
+        plans = list()
+        async with self.db.conn() as conn:
+            async with conn.transaction():
+                await conn.execute("SET LOCAL enable_seqscan=off;")
+                for query, arg in queries:
+                    rows = await conn.fetch(f"EXPLAIN {query}", arg)
+                    plans.append("\n".join(row[0] for row in rows))
+        self.assertIn(INDEX_GROUP_FEATURES, plans[0])
+        self.assertIn(INDEX_TASK_EXTRA, plans[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+from unittest import main
+
+from recc_database.variables.database import ROLE_SLUG_GUEST
+from tester.postgresql_test_case import PostgresqlTestCase
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class PgPaginationTestCase(PostgresqlTestCase):
+    async def test_users_page(self):
+        users = [dict(username=f"user{i}", password="pw", salt="s") for i in range(5)]
+        uids = await self.db.insert_users(users)
+
+        page1 = await self.db.select_users_page(limit=2)
+        page2 = await self.db.select_users_page(page1[-1].uid, 2)
+        page3 = await self.db.select_users_page(page2[-1].uid, 2)
+        page4 = await self.db.select_users_page(page3[-1].uid, 2)
+        self.assertEqual(uids[:2], [u.uid for u in page1])
+        self.assertEqual(uids[2:4], [u.uid for u in page2])
+        self.assertEqual(uids[4:], [u.uid for u in page3])
+        self.assertEqual([], page4)
+
+    async def test_stream_users(self):
+        users = [dict(username=f"user{i}", password="pw", salt="s") for i in range(7)]
+        uids = await self.db.insert_users(users)
+
+        streamed = await _collect(self.db.stream_users())
+        self.assertEqual(uids, [u.uid for u in streamed])
+        self.assertEqual(await self.db.select_users(), streamed)
+
+    async def test_stream_break(self):
+        users = [dict(username=f"user{i}", password="pw", salt="s") for i in range(3)]
+        await self.db.insert_users(users)
+        idle_size = self.db.pool_idle_size()
+
+        iterator = self.db.stream_users()
+        async for user in iterator:
+            self.assertEqual("user0", user.username)
+            break
+        await iterator.aclose()
+        self.assertEqual(idle_size, self.db.pool_idle_size())
+
+    async def test_infos_page(self):
+        infos = await self.db.select_infos()
+        keys = sorted(i.key for i in infos)
+
+        page1 = await self.db.select_infos_page(limit=1)
+        page2 = await self.db.select_infos_page(page1[-1].key)
+        self.assertEqual(keys, [i.key for i in page1 + page2])
+        self.assertEqual(len(infos), len(await _collect(self.db.stream_infos())))
+
+    async def test_roles_and_permissions(self):
+        roles = await self.db.select_role_all()
+        page = await self.db.select_role_page(roles[0].uid, len(roles))
+        self.assertEqual([r.uid for r in roles[1:]], [r.uid for r in page])
+        self.assertEqual(roles, await _collect(self.db.stream_role_all()))
+
+        permissions = await self.db.select_permission_all()
+        streamed = await _collect(self.db.stream_permission_all())
+        self.assertEqual(permissions, streamed)
+        page = await self.db.select_permission_page(limit=len(permissions))
+        self.assertEqual(permissions, page)
+
+    async def test_members_page(self):
+        user_uids = await self.db.insert_users(
+            dict(username=f"user{i}", password="pw", salt="s") for i in range(3)
+        )
+        group_uid = await self.db.insert_group("group1")
+        project_uid = await self.db.insert_project(group_uid, "project1")
+        guest_uid = await self.db.select_role_uid_by_slug(ROLE_SLUG_GUEST)
+        await self.db.insert_group_members((group_uid, u, guest_uid) for u in user_uids)
+        await self.db.insert_project_members(
+            (project_uid, u, guest_uid) for u in user_uids
+        )
+
+        page1 = await self.db.select_group_members_page(limit=2)
+        last = page1[-1]
+        page2 = await self.db.select_group_members_page(
+            last.group_uid, last.user_uid, 2
+        )
+        self.assertEqual(user_uids, [m.user_uid for m in page1 + page2])
+        members = await _collect(self.db.stream_group_members())
+        self.assertEqual(user_uids, [m.user_uid for m in members])
+
+        page1 = await self.db.select_project_members_page(limit=2)
+        last = page1[-1]
+        page2 = await self.db.select_project_members_page(
+            last.project_uid, last.user_uid, 2
+        )
+        self.assertEqual(user_uids, [m.user_uid for m in page1 + page2])
+        members = await _collect(self.db.stream_project_members())
+        self.assertEqual(user_uids, [m.user_uid for m in members])
+
+    async def test_stream_pip_all(self):
+        await self.db.insert_pip("domain", "name", "file", "sha256", "0")
+        streamed = await _collect(self.db.stream_pip_all())
+        self.assertEqual(await self.db.select_pip_all(), streamed)
+
+
+if __name__ == "__main__":
+    main()
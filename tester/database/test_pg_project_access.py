@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+from unittest import main
+
+from recc_database.database.pg_db import PgDb
+from recc_database.variables.database import (
+    ROLE_SLUG_GUEST,
+    TABLE_GROUP_MEMBER,
+    TABLE_PROJECT,
+    TABLE_PROJECT_ACCESS,
+)
+from tester.postgresql_test_case import PostgresqlTestCase
+
+_SELECT_ACCESS = f"""
+SELECT user_uid, project_uid
+FROM {TABLE_PROJECT_ACCESS}
+ORDER BY user_uid, project_uid;
+"""
+
+
+class PgProjectAccessTestCase(PostgresqlTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            project_access_table=True,
+        )
+        self.plain_db = PgDb(self.host, self.port, self.user, self.pw, self.name)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.plain_db.open()
+
+        self.user1 = await self.db.insert_user("user1", "pass1", "salt1")
+        self.user2 = await self.db.insert_user("user2", "pass2", "salt2")
+        self.group1 = await self.db.insert_group("group1")
+        self.group2 = await self.db.insert_group("group2")
+        self.project1 = await self.db.insert_project(self.group1, "project1")
+        self.project2 = await self.db.insert_project(self.group1, "project2")
+        self.project3 = await self.db.insert_project(self.group2, "project3")
+        self.guest = await self.db.select_role_uid_by_slug(ROLE_SLUG_GUEST)
+
+    async def asyncTearDown(self):
+        await self.plain_db.close()
+        await super().asyncTearDown()
+
+    async def access(self):
+        async with self.db.conn() as conn:
+            return [tuple(r) for r in await conn.fetch(_SELECT_ACCESS)]
+
+    async def assertProjects(self, user_uid: int, *project_uids: int):
+        projects = await self.db.select_projects_by_user_uid(user_uid)
+        plain_projects = await self.plain_db.select_projects_by_user_uid(user_uid)
+        self.assertEqual(list(project_uids), [p.uid for p in projects])
+        self.assertEqual(projects, plain_projects)
+
+    async def test_memberships(self):
+        await self.db.insert_group_member(self.group1, self.user1, self.guest)
+        await self.db.insert_project_member(self.project3, self.user1, self.guest)
+        await self.db.insert_project_member(self.project1, self.user2, self.guest)
+        await self.assertProjects(
+            self.user1, self.project1, self.project2, self.project3
+        )
+        await self.assertProjects(self.user2, self.project1)
+
+        # The project1 is still reached through the project membership.
+        await self.db.insert_group_member(self.group1, self.user2, self.guest)
+        await self.db.delete_group_member(self.group1, self.user2)
+        await self.assertProjects(self.user2, self.project1)
+
+        await self.db.delete_project_member(self.project1, self.user2)
+        await self.assertProjects(self.user2)
+
+        # A role change keeps the access.
+        await self.db.update_group_member_role(self.group1, self.user1, self.guest)
+        await self.assertProjects(
+            self.user1, self.project1, self.project2, self.project3
+        )
+
+    async def test_projects(self):
+        await self.db.insert_group_member(self.group1, self.user1, self.guest)
+        project4 = await self.db.insert_project(self.group1, "project4")
+        await self.assertProjects(self.user1, self.project1, self.project2, project4)
+
+        await self.db.insert_group_member(self.group2, self.user2, self.guest)
+        await self.db.execute(
+            f"UPDATE {TABLE_PROJECT} SET group_uid=$1 WHERE uid=$2;",
+            self.group2,
+            project4,
+        )
+        await self.assertProjects(self.user1, self.project1, self.project2)
+        await self.assertProjects(self.user2, self.project3, project4)
+
+        await self.db.delete_project_by_uid(self.project1)
+        await self.assertProjects(self.user1, self.project2)
+
+        await self.db.delete_group_by_uid(self.group1)
+        await self.assertProjects(self.user1)
+        self.assertEqual(
+            [(self.user2, self.project3), (self.user2, project4)], await self.access()
+        )
+
+    async def test_delete_user(self):
+        await self.db.insert_group_member(self.group1, self.user1, self.guest)
+        await self.db.insert_project_member(self.project1, self.user1, self.guest)
+        await self.db.insert_group_member(self.group2, self.user2, self.guest)
+        await self.db.delete_user_by_uid(self.user1)
+        self.assertEqual([(self.user2, self.project3)], await self.access())
+
+    async def test_bulk_and_truncate(self):
+        await self.db.insert_group_members(
+            [
+                (self.group1, self.user1, self.guest),
+                (self.group2, self.user2, self.guest),
+            ]
+        )
+        expected = [
+            (self.user1, self.project1),
+            (self.user1, self.project2),
+            (self.user2, self.project3),
+        ]
+        self.assertEqual(expected, await self.access())
+
+        await self.db.execute(f"TRUNCATE {TABLE_GROUP_MEMBER};")
+        self.assertEqual([], await self.access())
+
+        await self.db.insert_group_member(self.group2, self.user2, self.guest)
+        await self.db.execute(f"DELETE FROM {TABLE_PROJECT_ACCESS};")
+        await self.db.refresh_project_access()
+        self.assertEqual([(self.user2, self.project3)], await self.access())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+from collections import defaultdict
+from random import Random
+from typing import Dict, Set
+from unittest import main, skipIf
+
+from tester.dataset import DatasetOptions, generate_dataset
+from tester.postgresql_test_case import PostgresqlTestCase
+from tester.variables import SCALE_TEST_SKIP, SCALE_TEST_USERS
+
+_SAMPLE_USERS = 100
+
+
+@skipIf(SCALE_TEST_SKIP, "Scale testing is off")
+class PgScaleTestCase(PostgresqlTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        options = DatasetOptions.scaled(SCALE_TEST_USERS)
+        self.dataset = await generate_dataset(self.db, options)
+        self.sample = Random(options.seed).sample(self.dataset.user_uids, _SAMPLE_USERS)
+
+    def expected_projects(self) -> Dict[int, Set[int]]:
+        dataset = self.dataset
+        group_projects: Dict[int, Set[int]] = defaultdict(set)
+        for project_uid, group_index in zip(
+            dataset.project_uids, dataset.project_groups
+        ):
+            group_projects[dataset.group_uids[group_index]].add(project_uid)
+
+        result: Dict[int, Set[int]] = defaultdict(set)
+        for group_uid, user_uid, _ in dataset.group_members:
+            result[user_uid] |= group_projects[group_uid]
+        for project_uid, user_uid, _ in dataset.project_members:
+            result[user_uid].add(project_uid)
+        return result
+
+    async def test_projects_by_user_uid(self):
+        expected = self.expected_projects()
+        for user_uid in self.sample:
+            projects = await self.db.select_projects_by_user_uid(user_uid)
+            self.assertSetEqual(expected[user_uid], {p.uid for p in projects})
+
+    async def test_appropriate_permissions(self):
+        for group_uid, user_uid, _ in self.dataset.group_members[:_SAMPLE_USERS]:
+            single = await self.db.select_appropriate_permission_by_user_and_group(
+                user_uid, group_uid
+            )
+            batched = (
+                await self.db.select_appropriate_permission_slugs_by_user_and_pairs(
+                    user_uid, [(group_uid, None)]
+                )
+            )
+            slugs = sorted(p.slug for p in single if p.slug)
+            self.assertListEqual(slugs, sorted(batched[(group_uid, None)]))
+
+    async def test_select_all(self):
+        count = 0
+        async for _ in self.db.stream_users():
+            count += 1
+        self.assertEqual(SCALE_TEST_USERS, count)
+
+        after_uid = 0
+        count = 0
+        while True:
+            page = await self.db.select_users_page(after_uid)
+            if not page:
+                break
+            count += len(page)
+            after_uid = page[-1].uid
+        self.assertEqual(SCALE_TEST_USERS, count)
+
+        members = await self.db.select_group_members()
+        self.assertEqual(len(self.dataset.group_members), len(members))
+
+
+if __name__ == "__main__":
+    main()
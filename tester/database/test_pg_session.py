@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+from unittest import main
+
+from recc_database.database.pg_db import PgDb
+from recc_database.variables.database import ROLE_SLUG_GUEST
+from tester.postgresql_test_case import PostgresqlTestCase
+
+_SELECT_BACKEND_PID = "SELECT pg_backend_pid();"
+
+
+class _RollbackError(Exception):
+    pass
+
+
+class PgSessionTestCase(PostgresqlTestCase):
+    async def test_pinned_connection(self):
+        self.assertFalse(self.db.in_session())
+        async with self.db.session() as session:
+            self.assertTrue(session.in_session())
+            self.assertFalse(self.db.in_session())
+
+            pid1 = await session.column(int, _SELECT_BACKEND_PID)
+            uid = await session.insert_user("user1", "pass1", "salt1")
+            pid2 = await session.column(int, _SELECT_BACKEND_PID)
+            self.assertEqual(pid1, pid2)
+            self.assertEqual(uid, await session.select_user_uid_by_username("user1"))
+
+            async with session.session() as nested:
+                self.assertEqual(pid1, await nested.column(int, _SELECT_BACKEND_PID))
+        self.assertFalse(session.in_session())
+
+    async def test_commit(self):
+        group_uid = await self.db.insert_group("group1")
+        guest_uid = await self.db.select_role_uid_by_slug(ROLE_SLUG_GUEST)
+
+        async with self.db.session(transaction=True) as session:
+            uid = await session.insert_user("user1", "pass1", "salt1")
+            await session.insert_group_member(group_uid, uid, guest_uid)
+
+        member = await self.db.select_group_member(group_uid, uid)
+        self.assertEqual(guest_uid, member.role_uid)
+
+    async def test_rollback(self):
+        with self.assertRaises(_RollbackError):
+            async with self.db.session(transaction=True) as session:
+                await session.insert_user("user1", "pass1", "salt1")
+                raise _RollbackError
+        self.assertFalse(await self.db.select_user_exists_by_username("user1"))
+
+    async def test_nested_rollback(self):
+        async with self.db.session(transaction=True) as session:
+            await session.insert_user("user1", "pass1", "salt1")
+            with self.assertRaises(_RollbackError):
+                async with session.session(transaction=True) as nested:
+                    await nested.insert_user("user2", "pass2", "salt2")
+                    raise _RollbackError
+        self.assertTrue(await self.db.select_user_exists_by_username("user1"))
+        self.assertFalse(await self.db.select_user_exists_by_username("user2"))
+
+
+class PgSessionCacheTestCase(PostgresqlTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            permission_cache_size=100,
+        )
+
+    async def test_rollback_clears_permission_cache(self):
+        group_uid = await self.db.insert_group("group1")
+        user_uid = await self.db.insert_user("user1", "pass1", "salt1")
+        guest_uid = await self.db.select_role_uid_by_slug(ROLE_SLUG_GUEST)
+        cache = self.db.permission_cache
+        self.assertIsNotNone(cache)
+        assert cache is not None
+
+        with self.assertRaises(_RollbackError):
+            async with self.db.session(transaction=True) as session:
+                await session.insert_group_member(group_uid, user_uid, guest_uid)
+                perms = await session.select_appropriate_permission_by_user_and_group(
+                    user_uid, group_uid
+                )
+                self.assertLess(0, len(perms))
+                self.assertEqual(0, len(cache))
+                raise _RollbackError
+
+        self.assertEqual(0, len(cache))
+        perms = await self.db.select_appropriate_permission_by_user_and_group(
+            user_uid, group_uid
+        )
+        self.assertListEqual([], perms)
+
+    async def test_session_does_not_store_permission_matrix(self):
+        role1_uid = await self.db.insert_role("role1")
+        await self.db.insert_permission("test.perm1")
+
+        with self.assertRaises(_RollbackError):
+            async with self.db.session(transaction=True) as session:
+                await session.insert_role_permissions_by_slug(role1_uid, ["test.perm1"])
+                matrix = await session.select_permission_matrix()
+                self.assertTrue(matrix.has_permission(role1_uid, "test.perm1"))
+                self.assertIsNone(self.db.permission_matrix)
+                raise _RollbackError
+
+        matrix = await self.db.select_permission_matrix()
+        self.assertFalse(matrix.has_permission(role1_uid, "test.perm1"))
+
+
+if __name__ == "__main__":
+    main()
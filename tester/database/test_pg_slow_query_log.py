@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from unittest import main
+
+from recc_database.database.metrics.slow_query_log import REDACTED_VALUE, SlowQueryLog
+from recc_database.database.pg_db import PgDb
+from tester.postgresql_test_case import PostgresqlTestCase
+
+
+class PgSlowQueryLogTestCase(PostgresqlTestCase):
+    def setUp(self):
+        super().setUp()
+        self.log = SlowQueryLog(0.0, explain_sample_rate=1.0, log=None)
+        self.db = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            slow_query_log=self.log,
+        )
+
+    async def test_explain(self):
+        self.log.clear()
+        uid = await self.db.insert_user("user1", "pass1", "salt1")
+        await self.db.select_projects_by_user_uid(uid)
+
+        records = self.log.records()
+        self.assertListEqual(
+            ["INSERT_USER", "SELECT_PROJECT_BY_USER_UID"], [r.name for r in records]
+        )
+
+        insert, select = records
+        self.assertEqual("user1", insert.args[0])
+        self.assertEqual(REDACTED_VALUE, insert.args[1])
+        self.assertEqual(REDACTED_VALUE, insert.args[2])
+        assert insert.plan is not None
+        self.assertNotIn("actual time", insert.plan)
+        assert select.plan is not None
+        self.assertIn("actual time", select.plan)
+
+        # The plan of a write must not be executed.
+        self.assertEqual(1, await self.db.select_users_count())
+
+
+if __name__ == "__main__":
+    main()
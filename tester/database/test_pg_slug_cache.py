@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+from unittest import main
+
+from recc_database.database.pg_db import PgDb
+from recc_database.variables.database import ROLE_SLUG_GUEST
+from tester.postgresql_test_case import PostgresqlTestCase
+
+
+class PgSlugCacheTestCase(PostgresqlTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            slug_cache_size=100,
+        )
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.cache = self.db.slug_cache
+        assert self.cache is not None
+
+        self.group1 = await self.db.insert_group("group1")
+        self.project1 = await self.db.insert_project(self.group1, "project1")
+        self.task1 = await self.db.insert_task(self.project1, "task1")
+
+    async def test_hits(self):
+        for _ in range(2):
+            self.assertEqual(
+                self.group1, await self.db.select_group_uid_by_slug("group1")
+            )
+            self.assertEqual(
+                self.project1,
+                await self.db.select_project_uid_by_group_uid_and_slug(
+                    self.group1, "project1"
+                ),
+            )
+            self.assertEqual(
+                self.task1,
+                await self.db.select_task_uid_by_fullpath(
+                    "group1", "project1", "task1"
+                ),
+            )
+        self.assertEqual(1, self.cache.groups.hits)
+        self.assertEqual(1, self.cache.projects.hits)
+        self.assertEqual(1, self.cache.tasks.hits)
+
+        # The reverse lookup is served by the same entry.
+        self.assertEqual("group1", await self.db.select_group_slug_by_uid(self.group1))
+        self.assertEqual(2, self.cache.groups.hits)
+
+        guest = await self.db.select_role_uid_by_slug(ROLE_SLUG_GUEST)
+        self.assertEqual(ROLE_SLUG_GUEST, await self.db.select_role_slug_by_uid(guest))
+        self.assertEqual(1, self.cache.roles.hits)
+
+    async def test_rename(self):
+        await self.db.select_task_uid_by_fullpath("group1", "project1", "task1")
+        await self.db.update_group_by_uid(self.group1, slug="group2")
+        with self.assertRaises(LookupError):
+            await self.db.select_group_uid_by_slug("group1")
+        with self.assertRaises(LookupError):
+            await self.db.select_task_uid_by_fullpath("group1", "project1", "task1")
+        self.assertEqual(
+            self.task1,
+            await self.db.select_task_uid_by_fullpath("group2", "project1", "task1"),
+        )
+
+        await self.db.update_task_by_uid(self.task1, slug="task2")
+        with self.assertRaises(LookupError):
+            await self.db.select_task_uid_by_fullpath("group2", "project1", "task1")
+
+        role = await self.db.insert_role("role1")
+        await self.db.select_role_uid_by_slug("role1")
+        await self.db.update_role_by_uid(role, slug="role2")
+        with self.assertRaises(LookupError):
+            await self.db.select_role_uid_by_slug("role1")
+
+    async def test_cascade_delete(self):
+        await self.db.select_project_uid_by_group_uid_and_slug(self.group1, "project1")
+        await self.db.select_task_uid_by_fullpath("group1", "project1", "task1")
+        await self.db.delete_group_by_uid(self.group1)
+        self.assertEqual(0, len(self.cache.projects))
+        self.assertEqual(0, len(self.cache.tasks))
+        with self.assertRaises(LookupError):
+            await self.db.select_project_uid_by_group_uid_and_slug(
+                self.group1, "project1"
+            )
+
+    async def test_delete_task_by_slug(self):
+        await self.db.select_task_uid_by_fullpath("group1", "project1", "task1")
+        await self.db.delete_task_by_slug(self.project1, "task1")
+        with self.assertRaises(LookupError):
+            await self.db.select_task_uid_by_fullpath("group1", "project1", "task1")
+
+    async def test_transaction(self):
+        async with self.db.session(transaction=True) as session:
+            group2 = await session.insert_group("group2")
+            self.assertEqual(group2, await session.select_group_uid_by_slug("group2"))
+            self.assertIsNone(self.cache.groups.get_uid("group2"))
+
+
+if __name__ == "__main__":
+    main()
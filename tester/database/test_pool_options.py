@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import TimeoutError, sleep
+from contextlib import AsyncExitStack
+from unittest import TestCase, main
+
+from recc_database.database.pg_db import PgDb
+from recc_database.database.pool_options import PgPoolOptions
+from recc_database.variables.database import (
+    DATABASE_POOL_ADAPTIVE_MAX_SIZE,
+    DATABASE_POOL_ADAPTIVE_MIN_SIZE,
+    DATABASE_POOL_MAX_SIZE,
+    DATABASE_POOL_MIN_SIZE,
+)
+from tester.postgresql_test_case import PostgresqlTestCase
+
+_SHRINK_TIMEOUT_SECONDS = 5.0
+_SHRINK_STEP_SECONDS = 0.05
+
+
+class PgPoolOptionsTestCase(TestCase):
+    def test_default(self):
+        options = PgPoolOptions()
+        self.assertEqual(DATABASE_POOL_MIN_SIZE, options.min_size)
+        self.assertEqual(DATABASE_POOL_MAX_SIZE, options.max_size)
+        self.assertIsNone(options.acquire_timeout)
+
+    def test_adaptive(self):
+        options = PgPoolOptions.adaptive()
+        self.assertEqual(DATABASE_POOL_ADAPTIVE_MIN_SIZE, options.min_size)
+        self.assertEqual(DATABASE_POOL_ADAPTIVE_MAX_SIZE, options.max_size)
+        self.assertLess(0, options.overflow)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            PgPoolOptions(min_size=-1)
+        with self.assertRaises(ValueError):
+            PgPoolOptions(max_size=0)
+        with self.assertRaises(ValueError):
+            PgPoolOptions(min_size=5, max_size=4)
+        with self.assertRaises(ValueError):
+            PgPoolOptions(acquire_timeout=0)
+
+
+class PgPoolTestCase(PostgresqlTestCase):
+    def setUp(self):
+        super().setUp()
+        self.options = PgPoolOptions(
+            min_size=1,
+            max_size=3,
+            max_inactive_connection_lifetime=0.2,
+            acquire_timeout=0.5,
+        )
+        self.db = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            pool_options=self.options,
+        )
+
+    async def test_grow_and_shrink(self):
+        self.assertIs(self.options, self.db.pool_options)
+
+        async with AsyncExitStack() as stack:
+            for _ in range(self.options.max_size):
+                session = await stack.enter_async_context(self.db.session())
+                await session.select_users_count()
+            self.assertEqual(self.options.max_size, self.db.pool_size())
+            self.assertEqual(0, self.db.pool_idle_size())
+
+            with self.assertRaises(TimeoutError):
+                await self.db.select_users_count()
+
+        elapsed = 0.0
+        while self.db.pool_size() > self.options.min_size:
+            self.assertLess(elapsed, _SHRINK_TIMEOUT_SECONDS)
+            await sleep(_SHRINK_STEP_SECONDS)
+            elapsed += _SHRINK_STEP_SECONDS
+        self.assertEqual(0, await self.db.select_users_count())
+
+
+if __name__ == "__main__":
+    main()
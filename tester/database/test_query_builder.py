@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 
+from itertools import product
 from unittest import TestCase, main
 
-from recc_database.database.query_builder import UpdateBuilder
+from recc_database.database.query.user import get_update_user_query_by_uid
+from recc_database.database.query_builder import (
+    UpdateBuilder,
+    build_update,
+    compile_update,
+)
 
 
 class UpdateBuilderTestCase(TestCase):
@@ -31,5 +37,38 @@ class UpdateBuilderTestCase(TestCase):
         self.assertEqual(extra, args[3])
 
 
+class BuildUpdateTestCase(TestCase):
+    def test_same_as_update_builder(self):
+        for a, b, c, uid in product((1, None), ("b", None), (3.0, None), (7, None)):
+            for if_none_skip in (True, False):
+                kwargs = dict(a=a, b=b, c=c, updated_at="now")
+                builder = UpdateBuilder(if_none_skip=if_none_skip, **kwargs)
+                builder.where().eq(uid=uid)
+                expected = builder.build("t")
+                result = build_update("t", dict(uid=uid), if_none_skip, **kwargs)
+                self.assertEqual(expected, result)
+
+    def test_cache(self):
+        get_update_user_query_by_uid(1, email="a@localhost")
+        hits = compile_update.cache_info().hits
+        query1, args1 = get_update_user_query_by_uid(2, email="b@localhost")
+        query2, args2 = get_update_user_query_by_uid(3, nickname="c")
+        self.assertEqual(hits + 1, compile_update.cache_info().hits)
+        self.assertEqual("b@localhost", args1[0])
+        self.assertEqual(2, args1[-1])
+        self.assertNotEqual(query1, query2)
+
+        compiled = compile_update("t", (("a", False), ("b", True)), (("uid", False),))
+        self.assertEqual(("a",), compiled.set_columns)
+        self.assertEqual(("uid",), compiled.where_columns)
+        self.assertListEqual([1, 9], compiled.bind(dict(a=1, b=None), dict(uid=9)))
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            build_update("t", dict(uid=1), if_none_skip=True, a=None)
+        with self.assertRaises(ValueError):
+            build_update("t", dict(), a=1)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import wait_for
+from inspect import Parameter, signature
+from unittest import TestCase, main
+
+from asyncpg.connection import Connection
+
+from recc_database.database.mixin._pg_base import warm_up_statements
+from recc_database.database.query import user
+from recc_database.database.query.user import SELECT_USER_BY_UID
+from recc_database.database.query_registry import (
+    HOT_QUERIES,
+    REGISTERED_QUERIES,
+    collect_queries,
+    get_query_name,
+    is_preparable,
+    is_registered_query,
+)
+from tester.postgresql_test_case import PostgresqlTestCase
+
+_DDL_TIMEOUT_SECONDS = 10.0
+
+
+class QueryRegistryTestCase(TestCase):
+    def test_is_preparable(self):
+        self.assertTrue(is_preparable("SELECT 1;"))
+        self.assertTrue(is_preparable("\n  update t SET a=1 WHERE b=$1;\n"))
+        self.assertTrue(is_preparable("WITH x AS (SELECT 1) SELECT * FROM x"))
+        self.assertFalse(is_preparable("CREATE TABLE t (a INT);"))
+        self.assertFalse(is_preparable("SELECT 1; SELECT 2;"))
+        self.assertFalse(is_preparable(""))
+
+    def test_collect_queries(self):
+        queries = collect_queries(user)
+        self.assertEqual(SELECT_USER_BY_UID, queries["SELECT_USER_BY_UID"])
+        self.assertTrue(all(is_preparable(q) for q in queries.values()))
+        self.assertTrue(all(n in REGISTERED_QUERIES for n in queries.keys()))
+
+    def test_hot_queries(self):
+        self.assertTrue(all(is_registered_query(q) for q in HOT_QUERIES))
+        self.assertEqual("SELECT_USER_BY_UID", get_query_name(SELECT_USER_BY_UID))
+        self.assertIsNone(get_query_name("SELECT 1;"))
+
+
+class StatementCacheApiTestCase(TestCase):
+    def test_get_statement_signature(self):
+        # `warm_up_statements()` relies on this private asyncpg method.
+        params = signature(Connection._get_statement).parameters
+        self.assertListEqual(["self", "query", "timeout"], list(params)[:3])
+        self.assertEqual(Parameter.KEYWORD_ONLY, params["use_cache"].kind)
+        self.assertIs(True, params["use_cache"].default)
+        self.assertIs(False, params["named"].default)
+
+
+class WarmUpStatementsTestCase(PostgresqlTestCase):
+    async def _prepared_statements(self, conn):
+        query = "SELECT statement FROM pg_prepared_statements;"
+        return set(r["statement"] for r in await conn.fetch(query))
+
+    async def test_warm_up_on_new_connection(self):
+        async with self.db._pool.acquire() as conn:
+            statements = await self._prepared_statements(conn)
+        self.assertTrue(all(q in statements for q in HOT_QUERIES))
+
+    async def test_warm_up_releases_locks(self):
+        async with self.db._pool.acquire() as conn:
+            count = await warm_up_statements(conn, HOT_QUERIES)
+            self.assertEqual(len(HOT_QUERIES), count)
+
+        # Any lingering relation lock of the warm-up would block this DDL.
+        await wait_for(self.db.drop_tables(), _DDL_TIMEOUT_SECONDS)
+        await self.db.create_tables()
+
+    async def test_warm_up_missing_tables(self):
+        async with self.db._pool.acquire() as conn:
+            count = await warm_up_statements(conn, ["SELECT * FROM _unknown_;"])
+        self.assertEqual(0, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+from dataclasses import dataclass, field, replace
+from typing import List, Optional
+from unittest import TestCase, main
+
+from recc_database.database.pg_db import PgDb
+from recc_database.database.row_mapper import get_row_mapper
+from recc_database.packet.group_join_member import GroupJoinGroupMember
+from recc_database.packet.role import Role
+from recc_database.packet.slotted import can_slot, slotted
+from recc_database.packet.user import PassInfo, User
+from tester.postgresql_test_case import PostgresqlTestCase
+
+
+@dataclass
+class _Packet:
+    uid: int
+    name: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    normalized: bool = False
+
+    def __post_init__(self):
+        self.normalized = True
+
+
+class _Row(dict):
+    """A mapping that also supports index access, like `asyncpg.Record`."""
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self.values())[key]
+        return super().__getitem__(key)
+
+
+class RowMapperTestCase(TestCase):
+    def test_dataclass(self):
+        row = _Row(uid=1, name="name")
+        mapper = get_row_mapper(_Packet, tuple(row.keys()))
+        self.assertIs(mapper, get_row_mapper(_Packet, tuple(row.keys())))
+
+        packet = mapper(row)
+        self.assertEqual(_Packet(**row), packet)
+        self.assertTrue(packet.normalized)
+        self.assertListEqual([], packet.tags)
+        self.assertIsNot(packet.tags, mapper(row).tags)
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            get_row_mapper(_Packet, ("name",))(_Row(name="name"))
+        with self.assertRaises(TypeError):
+            get_row_mapper(_Packet, ("uid", "unknown"))(_Row(uid=1, unknown=2))
+
+    def test_plain_class(self):
+        mapper = get_row_mapper(PassInfo, ("password", "salt"))
+        info = mapper(_Row(password=" pass ", salt=" salt "))
+        self.assertEqual("pass", info.password)
+        self.assertEqual("salt", info.salt)
+
+    def test_slotted(self):
+        role_slotted = slotted(Role)
+        self.assertIs(role_slotted, slotted(Role))
+        self.assertFalse(issubclass(role_slotted, Role))
+        self.assertEqual(Role.__name__, role_slotted.__name__)
+
+        role = get_row_mapper(role_slotted, ("uid", "slug"))(_Row(uid=1, slug="r"))
+        self.assertFalse(hasattr(role, "__dict__"))
+        self.assertEqual(1, role.uid)
+        self.assertEqual("r", role.slug)
+        self.assertIsNone(role.name)
+        self.assertEqual(role_slotted(uid=1, slug="r"), role)
+        self.assertEqual(Role(uid=1, slug="r"), role)
+        self.assertEqual(role, Role(uid=1, slug="r"))
+        self.assertNotEqual(role, Role(uid=2, slug="r"))
+
+        copied = pickle.loads(pickle.dumps(role))
+        self.assertIs(role_slotted, type(copied))
+        self.assertEqual(role, copied)
+        self.assertIs(role_slotted, type(replace(role, uid=2)))
+
+        self.assertFalse(can_slot(GroupJoinGroupMember))
+        with self.assertRaises(TypeError):
+            slotted(GroupJoinGroupMember)
+        with self.assertRaises(TypeError):
+            slotted(PassInfo)
+
+
+class PgSlottedPacketsTestCase(PostgresqlTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db = PgDb(
+            self.host,
+            self.port,
+            self.user,
+            self.pw,
+            self.name,
+            slotted_packets=True,
+        )
+
+    async def test_select(self):
+        uid = await self.db.insert_user("user1", "pass1", "salt1")
+        users = await self.db.select_users()
+        self.assertEqual(1, len(users))
+        self.assertIs(slotted(User), type(users[0]))
+        self.assertEqual(uid, users[0].uid)
+        self.assertEqual(users[0], await self.db.select_user_by_uid(uid))
+
+        info = await self.db.select_user_password_and_salt_by_uid(uid)
+        self.assertEqual("pass1", info.password)
+
+
+if __name__ == "__main__":
+    main()
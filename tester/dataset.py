@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, field
+from random import Random
+from typing import Any, Dict, List, Tuple
+
+from recc_database.database.pg_db import PgDb
+from recc_database.variables.database import (
+    ROLE_SLUG_DEVELOPER,
+    ROLE_SLUG_GUEST,
+    ROLE_SLUG_MAINTAINER,
+    ROLE_SLUG_OWNER,
+    ROLE_SLUG_REPORTER,
+    VISIBILITY_LEVEL_INTERNAL,
+    VISIBILITY_LEVEL_PRIVATE,
+    VISIBILITY_LEVEL_PUBLIC,
+)
+
+DATASET_SEED = 0x72656363
+
+_LANGS = ("ko", "en", "ja")
+_TIMEZONES = ("Asia/Seoul", "UTC", "Asia/Tokyo", "America/New_York")
+_FEATURES = ("airjs", "vms", "storage", "dashboard", "task", "layout")
+_VISIBILITIES = (
+    VISIBILITY_LEVEL_PRIVATE,
+    VISIBILITY_LEVEL_INTERNAL,
+    VISIBILITY_LEVEL_PUBLIC,
+)
+_IMAGES = ("python:3.9", "python:3.10", "ubuntu:22.04", "nvidia/cuda:11.8.0")
+_USER_INFO_KEYS = (
+    "profile.color",
+    "profile.avatar",
+    "ui.theme",
+    "ui.layout",
+    "dashboard.widgets",
+    "notification.email",
+    "notification.slack",
+    "recent.projects",
+)
+
+# Most members are guests and reporters, few are owners.
+_ROLE_WEIGHTS = (
+    (ROLE_SLUG_OWNER, 1),
+    (ROLE_SLUG_MAINTAINER, 2),
+    (ROLE_SLUG_DEVELOPER, 5),
+    (ROLE_SLUG_REPORTER, 6),
+    (ROLE_SLUG_GUEST, 10),
+)
+
+
+@dataclass(frozen=True)
+class DatasetOptions:
+    users: int = 1000
+    groups: int = 20
+    members_per_group: int = 50
+    projects_per_group: int = 3
+    members_per_project: int = 5
+    tasks_per_project: int = 2
+    infos_per_user: int = 3
+    admin_ratio: float = 0.001
+    seed: int = DATASET_SEED
+
+    def __post_init__(self):
+        if self.users < 1:
+            raise ValueError("The users must be at least 1")
+        if self.groups < 1:
+            raise ValueError("The groups must be at least 1")
+        if not 0 <= self.infos_per_user <= len(_USER_INFO_KEYS):
+            raise ValueError(
+                f"The infos_per_user must be in the range [0, {len(_USER_INFO_KEYS)}]"
+            )
+
+    @classmethod
+    def scaled(cls, users: int, seed=DATASET_SEED) -> "DatasetOptions":
+        """
+        One group for every fifty users, each user is a member of about one group.
+        """
+        return cls(users=users, groups=max(users // 50, 1), seed=seed)
+
+
+@dataclass
+class Dataset:
+    options: DatasetOptions
+    usernames: List[str]
+    user_uids: List[int]
+    group_slugs: List[str]
+    group_uids: List[int]
+    project_slugs: List[str]
+    project_uids: List[int]
+    project_groups: List[int]
+    """
+    The index of the group of each project.
+    """
+
+    task_slugs: List[str]
+    task_uids: List[int]
+    task_projects: List[int]
+    """
+    The index of the project of each task.
+    """
+
+    group_members: List[Tuple[int, int, int]] = field(default_factory=list)
+    """
+    The `(group_uid, user_uid, role_uid)` of each member.
+    """
+
+    project_members: List[Tuple[int, int, int]] = field(default_factory=list)
+    """
+    The `(project_uid, user_uid, role_uid)` of each member.
+    """
+
+    user_info_keys: List[str] = field(default_factory=list)
+
+
+def _vary(rng: Random, mean: int) -> int:
+    """
+    An integer in the range [mean/2, mean*3/2], so that the sizes are uneven.
+    """
+    return rng.randint(mean // 2, mean + mean // 2) if mean > 0 else 0
+
+
+def _task_extra(rng: Random, index: int) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "image": rng.choice(_IMAGES),
+        "env": {f"ENV{i}": str(rng.randrange(1000)) for i in range(rng.randint(0, 4))},
+        "gpu": rng.random() < 0.2,
+        "tags": rng.sample(_FEATURES, rng.randint(0, 3)),
+    }
+
+
+def _publish_ports(rng: Random) -> Dict[str, Any]:
+    ports = rng.sample(range(8000, 9000), rng.randint(1, 3))
+    return {f"{port}/tcp": rng.randint(30000, 32767) for port in ports}
+
+
+async def generate_dataset(db: PgDb, options=DatasetOptions()) -> Dataset:
+    """
+    Populate the database with the bulk insert methods of :class:`PgDb`.
+
+    The same options always generate the same rows on an empty database.
+    """
+
+    rng = Random(options.seed)
+    role_slugs = [slug for slug, _ in _ROLE_WEIGHTS]
+    role_weights = [weight for _, weight in _ROLE_WEIGHTS]
+    role_uids = {slug: await db.select_role_uid_by_slug(slug) for slug in role_slugs}
+
+    def _role() -> int:
+        return role_uids[rng.choices(role_slugs, role_weights)[0]]
+
+    usernames = [f"user{i}" for i in range(options.users)]
+    users = [
+        dict(
+            username=username,
+            password=f"{rng.getrandbits(128):032x}",
+            salt=f"{rng.getrandbits(64):016x}",
+            nickname=f"User {i}",
+            email=f"{username}@example.com",
+            admin=rng.random() < options.admin_ratio,
+            dark=rng.randint(0, 2),
+            lang=rng.choice(_LANGS),
+            timezone=rng.choice(_TIMEZONES),
+        )
+        for i, username in enumerate(usernames)
+    ]
+    user_uids = await db.insert_users(users)
+
+    group_slugs = [f"group{i}" for i in range(options.groups)]
+    groups = [
+        dict(
+            slug=slug,
+            name=f"Group {i}",
+            features=rng.sample(_FEATURES, rng.randint(0, len(_FEATURES))),
+            visibility=rng.choice(_VISIBILITIES),
+            extra={"index": i},
+        )
+        for i, slug in enumerate(group_slugs)
+    ]
+    group_uids = await db.insert_groups(groups)
+
+    group_members = list()
+    for group_uid in group_uids:
+        count = min(_vary(rng, options.members_per_group), options.users)
+        for user_index in rng.sample(range(options.users), count):
+            group_members.append((group_uid, user_uids[user_index], _role()))
+    await db.insert_group_members(group_members)
+
+    project_groups = list()
+    project_slugs: List[str] = list()
+    projects = list()
+    for group_index, group_uid in enumerate(group_uids):
+        for i in range(max(_vary(rng, options.projects_per_group), 1)):
+            project_groups.append(group_index)
+            project_slugs.append(f"project{i}")
+            projects.append(
+                dict(
+                    group_uid=group_uid,
+                    slug=project_slugs[-1],
+                    name=f"Project {i}",
+                    features=rng.sample(_FEATURES, rng.randint(0, 2)),
+                    visibility=rng.choice(_VISIBILITIES),
+                )
+            )
+    project_uids = await db.insert_projects(projects)
+
+    project_members = list()
+    for project_uid in project_uids:
+        count = min(_vary(rng, options.members_per_project), options.users)
+        for user_index in rng.sample(range(options.users), count):
+            project_members.append((project_uid, user_uids[user_index], _role()))
+    await db.insert_project_members(project_members)
+
+    task_projects = list()
+    task_slugs: List[str] = list()
+    tasks = list()
+    for project_index, project_uid in enumerate(project_uids):
+        for i in range(_vary(rng, options.tasks_per_project)):
+            task_projects.append(project_index)
+            task_slugs.append(f"task{i}")
+            tasks.append(
+                dict(
+                    project_uid=project_uid,
+                    slug=task_slugs[-1],
+                    name=f"Task {i}",
+                    extra=_task_extra(rng, i),
+                    rpc_address=f"10.0.{rng.randrange(256)}.{rng.randrange(256)}",
+                    maximum_restart_count=rng.randint(0, 5),
+                    base_image_name=rng.choice(_IMAGES),
+                    publish_ports=_publish_ports(rng),
+                )
+            )
+    task_uids = await db.insert_tasks(tasks)
+
+    user_info_keys = list(_USER_INFO_KEYS[: options.infos_per_user])
+    infos = (
+        (user_uid, key, f"{rng.getrandbits(32):08x}")
+        for user_uid in user_uids
+        for key in user_info_keys
+    )
+    await db.insert_user_infos(infos)
+
+    return Dataset(
+        options=options,
+        usernames=usernames,
+        user_uids=user_uids,
+        group_slugs=group_slugs,
+        group_uids=group_uids,
+        project_slugs=project_slugs,
+        project_uids=project_uids,
+        project_groups=project_groups,
+        task_slugs=task_slugs,
+        task_uids=task_uids,
+        task_projects=task_projects,
+        group_members=group_members,
+        project_members=project_members,
+        user_info_keys=user_info_keys,
+    )
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+from unittest import main
+
+from recc_database.variables.database import TABLE_TASK, TABLE_USER_INFO
+from tester.dataset import DatasetOptions, generate_dataset
+from tester.postgresql_test_case import PostgresqlTestCase
+
+
+class DatasetTestCase(PostgresqlTestCase):
+    async def count(self, table: str) -> int:
+        return await self.db.column(int, f"SELECT count(*) FROM {table};")
+
+    async def test_generate(self):
+        options = DatasetOptions(users=200, groups=5)
+        dataset = await generate_dataset(self.db, options)
+
+        self.assertEqual(200, await self.db.select_users_count())
+        self.assertEqual(5, await self.db.select_groups_count())
+        self.assertEqual(
+            len(dataset.project_uids), await self.db.select_projects_count()
+        )
+        self.assertEqual(len(dataset.task_uids), await self.count(TABLE_TASK))
+        self.assertEqual(600, await self.count(TABLE_USER_INFO))
+        members = await self.db.select_group_members()
+        self.assertEqual(len(dataset.group_members), len(members))
+
+        task = await self.db.select_task_by_uid(dataset.task_uids[0])
+        self.assertIsInstance(task.extra, dict)
+        self.assertTrue(task.publish_ports)
+
+    async def test_deterministic(self):
+        options = DatasetOptions(users=50, groups=3)
+        dataset1 = await generate_dataset(self.db, options)
+        await self.db.drop_tables()
+        await self.db.create_tables()
+        dataset2 = await generate_dataset(self.db, options)
+        self.assertEqual(dataset1, dataset2)
+
+    def test_scaled(self):
+        self.assertEqual(2000, DatasetOptions.scaled(100000).groups)
+        self.assertEqual(1, DatasetOptions.scaled(10).groups)
+        with self.assertRaises(ValueError):
+            DatasetOptions(infos_per_user=100)
+
+
+if __name__ == "__main__":
+    main()
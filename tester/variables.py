@@ -1,6 +1,16 @@
 # -*- coding: utf-8 -*-
 
-UID_PERFORMANCE_TEST_SKIP = True
-UID_PERFORMANCE_ITERATION = 10000
-# [Redis] Localhost 10000 iteration average is 0.0006s (WIN, x5 faster)
-# [PgSQL] Localhost 10000 iteration average is 0.0031s
+BENCHMARK_DATABASE_NAME = "recc_db.benchmark"
+BENCHMARK_ITERATIONS = 1000
+BENCHMARK_WARMUP = 100
+BENCHMARK_CONCURRENCY = (1, 4, 16)
+BENCHMARK_POOL_SIZES = (10,)
+BENCHMARK_ROWS = (1000,)
+BENCHMARK_METRIC = "p90"
+BENCHMARK_TOLERANCE = 0.2
+"""
+The allowed relative slowdown against the baseline report.
+"""
+
+SCALE_TEST_SKIP = True
+SCALE_TEST_USERS = 100000